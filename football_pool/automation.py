@@ -3,20 +3,38 @@ Complete automation framework for the football pool system.
 Handles the entire weekly workflow from prompt generation to submission.
 """
 
-import json
+import asyncio
 import logging
 import os
-from dataclasses import dataclass
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 from .core import PoolDominationSystem
 from .excel_automation import ExcelAutomation
+from .json_utils import append_jsonl
+from .models import Pick
 from .web_search import FootballWebSearch
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class WorkflowPhaseError(Exception):
+    """A phase of the weekly workflow failed; the original error is the __cause__."""
+
+    def __init__(self, phase: str, error: Exception):
+        super().__init__(f"{phase} workflow failed: {error}")
+        self.phase = phase
+        self.error = str(error)
+
+
+@dataclass(frozen=True, slots=True)
 class AutomationConfig:
     """Configuration for automation settings."""
 
@@ -30,6 +48,43 @@ class AutomationConfig:
     notifications_enabled: bool = True
 
 
+@dataclass(slots=True)
+class MondayResult:
+    """Outcome of the Monday data collection & analysis phase."""
+
+    prompt_generated: bool
+    llm_analysis: bool
+    batch_id: Optional[str]
+    picks_generated: int
+    excel_created: bool
+    validation_passed: bool
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TuesdayResult:
+    """Outcome of the Tuesday optimization & validation phase."""
+
+    batch_status: Optional[str]
+    competitor_analysis: dict[str, Any]
+    edge_analysis: dict[str, Any]
+    picks_optimized: int
+    validation_passed: bool
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class WednesdayResult:
+    """Outcome of the Wednesday final review & submission phase."""
+
+    picks_written: bool
+    final_validation: dict[str, Any]
+    submission_summary: str
+    backup_files: list[str]
+    email_sent: bool
+    submission_logged: bool = True
+
+
 class WeeklyAutomation:
     """Complete weekly workflow automation."""
 
@@ -38,11 +93,23 @@ class WeeklyAutomation:
         self.system = PoolDominationSystem()
         self.excel = ExcelAutomation()
         self.web_search = FootballWebSearch()
+        self._prompt_dir = Path.cwd() / "data" / "prompts"
+        # Picks are buffered per week and written to Excel once, on Wednesday
+        self._pending_picks: dict[int, list[Pick]] = {}
+        # Monday's picks, reused on Tuesday when no new inputs arrived
+        self._picks_by_week: dict[int, list[Pick]] = {}
+        # The LLM analysis Monday's picks were built from (None if none was available)
+        self._llm_analysis_by_week: dict[int, Optional[dict[str, Any]]] = {}
+        # Last validation per week, keyed by a fingerprint of the validated picks
+        self._validations: dict[int, tuple[tuple, dict[str, Any]]] = {}
+        # Competitor (games, side-weighted confidence) matrices per week
+        self._competitor_matrices: dict[int, tuple[list[str], np.ndarray]] = {}
 
     def run_weekly_workflow(self, date: str, week: int) -> dict[str, any]:
         """Run the complete weekly workflow."""
         try:
-            logger.info(f"Starting weekly workflow for Week {week} ({date})")
+            logger.info("Starting weekly workflow for Week %s (%s)", week, date)
+            timestamp = datetime.now().isoformat()
 
             # Phase 1: Monday - Data Collection & Analysis
             monday_results = self._monday_workflow(date, week)
@@ -51,81 +118,142 @@ class WeeklyAutomation:
             tuesday_results = self._tuesday_workflow(date, week)
 
             # Phase 3: Wednesday - Final Review & Submission
-            wednesday_results = self._wednesday_workflow(date, week)
+            wednesday_results = self._wednesday_workflow(date, week, timestamp)
 
             # Combine results
             workflow_results = {
                 "week": week,
                 "date": date,
-                "monday": monday_results,
-                "tuesday": tuesday_results,
-                "wednesday": wednesday_results,
+                "monday": asdict(monday_results),
+                "tuesday": asdict(tuesday_results),
+                "wednesday": asdict(wednesday_results),
                 "status": "completed",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
             # Save workflow results
             self._save_workflow_results(workflow_results)
 
-            logger.info(f"Weekly workflow completed for Week {week}")
+            logger.info("Weekly workflow completed for Week %s", week)
             return workflow_results
 
+        except WorkflowPhaseError as e:
+            return {"status": "error", "phase": e.phase, "error": e.error}
         except Exception as e:
-            logger.error(f"Error in weekly workflow: {e}")
+            logger.error("Error in weekly workflow: %s", e)
             return {"status": "error", "error": str(e)}
 
-    def _monday_workflow(self, date: str, week: int) -> dict[str, any]:
+    def _monday_workflow(self, date: str, week: int) -> MondayResult:
         """Monday: Data Collection & Analysis."""
         try:
-            logger.info(f"Running Monday workflow for Week {week}")
+            logger.info("Running Monday workflow for Week %s", week)
 
-            # 1. Generate enhanced prompt
-            prompt = self.system.generate_llm_research_prompt_by_date(date)
-            os.makedirs("data/prompts", exist_ok=True)
-            prompt_file = f"data/prompts/{date}_prompt.txt"
-            with open(prompt_file, "w") as f:
-                f.write(prompt)
-
-            # 2. Run automated LLM analysis
-            llm_analysis = None
-            if self.system.openrouter_api_key:
-                llm_analysis = self.system.call_openrouter_api(week)
-                if llm_analysis:
-                    self.system.save_llm_data(week, llm_analysis)
-
-            # 3. Generate initial picks
-            picks = self.system.generate_optimal_picks(week)
-
-            # 4. Create Excel file
-            excel_file = self.excel.create_weekly_file(week, date)
-
-            # 5. Update Excel with picks
-            picks_data = [
-                {"team": pick.predicted_winner, "confidence": pick.confidence_points, "week": week}
-                for pick in picks
-            ]
-            self.excel.update_picks(week, picks_data, date)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # 1. Create Excel file (independent of the research step)
+                excel_future = executor.submit(self.excel.create_weekly_file, week, date)
 
-            # 6. Validate picks
-            validation = self.excel.validate_picks(picks_data)
+                # 2-3. Generate prompt and run automated LLM analysis
+                llm_analysis, batch_id = self._run_llm_research(date, week)
 
-            return {
-                "prompt_generated": True,
-                "llm_analysis": llm_analysis is not None,
-                "picks_generated": len(picks),
-                "excel_created": excel_file is not None,
-                "validation_passed": validation["valid"],
-                "errors": validation.get("errors", []),
-            }
+                excel_file = excel_future.result()
+
+            # 4. Generate initial picks (LLM picks for every game come back in one response)
+            picks = self.system.generate_optimal_picks(week, llm_analysis)
+            self._picks_by_week[week] = picks
+            self._llm_analysis_by_week[week] = llm_analysis
+
+            # 5. Buffer picks for the Wednesday Excel write
+            self._pending_picks[week] = picks
 
+            # 6. Validate picks
+            validation = self._validate_picks(week, picks)
+
+            return MondayResult(
+                prompt_generated=True,
+                llm_analysis=llm_analysis is not None,
+                batch_id=batch_id,
+                picks_generated=len(picks),
+                excel_created=excel_file is not None,
+                validation_passed=validation["valid"],
+                errors=validation.get("errors", []),
+            )
+
+        except (OSError, ValueError) as e:
+            # Network (requests errors are OSErrors), disk and schedule/data errors only
+            logger.error("Error in Monday workflow: %s", e)
+            raise WorkflowPhaseError("monday", e) from e
+
+    def _run_llm_research(
+        self, date: str, week: int
+    ) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+        """Generate the research prompt and run (or submit) the LLM analysis."""
+        # Generate enhanced prompt (reuse a recent one on re-runs for the same date)
+        prompt_path = self._prompt_path(date)
+        prompt = self._get_cached_prompt(prompt_path)
+        if prompt is None:
+            prompt = self.system.generate_llm_research_prompt_by_date(date)
+            self._prompt_dir.mkdir(parents=True, exist_ok=True)
+            # Write then swap in, so a hard-linked backup never sees the rewrite
+            tmp_path = prompt_path.with_suffix(".txt.tmp")
+            tmp_path.write_text(prompt)
+            tmp_path.replace(prompt_path)
+
+        # Run automated LLM analysis (batched when available, collected Tuesday)
+        llm_analysis = None
+        batch_id = None
+        if self.system.openai_api_key:
+            batch_id = self.system.submit_llm_batch(week)
+        if not batch_id:
+            llm_analysis = self._run_interactive_llm(week)
+
+        return llm_analysis, batch_id
+
+    def _run_interactive_llm(self, week: int) -> Optional[dict[str, Any]]:
+        """Run the LLM analysis through OpenRouter right away and save it."""
+        if not self.system.openrouter_api_key:
+            return None
+
+        # The enhanced prompt (research prompt plus odds and web context)
+        analyses = asyncio.run(self.system.acall_openrouter_api(week))
+        llm_analysis = next((analysis for analysis in analyses if analysis), None)
+        if llm_analysis:
+            self.system.save_llm_data(week, llm_analysis)
+        return llm_analysis
+
+    def _prompt_path(self, date: str) -> Path:
+        """Get the research prompt path for a date."""
+        return self._prompt_dir / f"{date}_prompt.txt"
+
+    def _get_cached_prompt(self, prompt_path: Path) -> Optional[str]:
+        """Get a previously generated prompt if it is less than an hour old."""
+        try:
+            prompt_age = datetime.now().timestamp() - prompt_path.stat().st_mtime
+            if prompt_age > 3600:  # 1 hour
+                return None
+
+            logger.info("Using cached prompt %s", prompt_path)
+            return prompt_path.read_text()
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Error in Monday workflow: {e}")
-            return {"status": "error", "error": str(e)}
+            logger.error("Error reading cached prompt: %s", e)
+            return None
 
-    def _tuesday_workflow(self, date: str, week: int) -> dict[str, any]:
+    def _tuesday_workflow(self, date: str, week: int) -> TuesdayResult:
         """Tuesday: Optimization & Validation."""
         try:
-            logger.info(f"Running Tuesday workflow for Week {week}")
+            logger.info("Running Tuesday workflow for Week %s", week)
+
+            # 0. Collect Monday's batched LLM analysis (if submitted). A batch that isn't
+            #    done yet stays recorded; Monday's picks are kept and `collect-batch`
+            #    applies its results once it finishes.
+            batch_status, batch_analysis = self.system.collect_llm_batch(week)
+            if batch_status is not None and batch_analysis is None:
+                logger.info(
+                    "LLM batch for Week %s is %s; keeping Monday's picks until `collect-batch`",
+                    week,
+                    batch_status,
+                )
 
             # 1. Analyze competitor picks (if available)
             competitor_analysis = self._analyze_competitors(week)
@@ -134,106 +262,183 @@ class WeeklyAutomation:
             edge_analysis = self._identify_edges(week, competitor_analysis)
 
             # 3. Optimize picks based on competitive analysis
-            optimized_picks = self._optimize_picks(week, edge_analysis)
+            optimized_picks = self._optimize_picks(week, edge_analysis, batch_analysis)
 
-            # 4. Update Excel file with optimized picks
+            # 4. Buffer optimized picks for the Wednesday Excel write
             if optimized_picks:
-                picks_data = [
-                    {
-                        "team": pick.predicted_winner,
-                        "confidence": pick.confidence_points,
-                        "week": week,
-                    }
-                    for pick in optimized_picks
-                ]
-                self.excel.update_picks(week, picks_data, date)
-
-            # 5. Final validation
-            validation = self.excel.validate_picks(picks_data)
-
-            return {
-                "competitor_analysis": competitor_analysis,
-                "edge_analysis": edge_analysis,
-                "picks_optimized": len(optimized_picks) if optimized_picks else 0,
-                "validation_passed": validation["valid"],
-                "errors": validation.get("errors", []),
-            }
-
-        except Exception as e:
-            logger.error(f"Error in Tuesday workflow: {e}")
-            return {"status": "error", "error": str(e)}
-
-    def _wednesday_workflow(self, date: str, week: int) -> dict[str, any]:
+                self._pending_picks[week] = optimized_picks
+
+            # 5. Validate the in-memory picks (reuses Monday's result if unchanged)
+            validation = self._validate_picks(week, self._pending_picks.get(week, []))
+
+            return TuesdayResult(
+                batch_status=batch_status,
+                competitor_analysis=competitor_analysis,
+                edge_analysis=edge_analysis,
+                picks_optimized=len(optimized_picks) if optimized_picks else 0,
+                validation_passed=validation["valid"],
+                errors=validation.get("errors", []),
+            )
+
+        except (OSError, ValueError) as e:
+            logger.error("Error in Tuesday workflow: %s", e)
+            raise WorkflowPhaseError("tuesday", e) from e
+
+    def _wednesday_workflow(
+        self, date: str, week: int, timestamp: Optional[str] = None
+    ) -> WednesdayResult:
         """Wednesday: Final Review & Submission."""
         try:
-            logger.info(f"Running Wednesday workflow for Week {week}")
-
-            # 1. Final validation
-            final_validation = self._final_validation(week, date)
-
-            # 2. Generate submission summary
-            submission_summary = self._generate_submission_summary(week, date)
-
-            # 3. Create backup files
-            backup_files = self._create_backups(week, date)
-
-            # 4. Send submission email (if configured)
-            email_sent = False
-            if self.config.auto_email:
-                email_sent = self._send_submission_email(week, date)
+            logger.info("Running Wednesday workflow for Week %s", week)
+
+            # 0. Write buffered picks to Excel (single save per week)
+            picks_written = self._flush_pending_picks(week, date)
+
+            # 1-4. Validation, summary, backups and email only read the written picks
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                validation_future = executor.submit(self._final_validation, week, date)
+                summary_future = executor.submit(self._generate_submission_summary, week, date)
+                backups_future = executor.submit(self._create_backups, week, date)
+                email_future = (
+                    executor.submit(self._send_submission_email, week, date)
+                    if self.config.auto_email
+                    else None
+                )
+
+                final_validation = validation_future.result()
+                submission_summary = summary_future.result()
+                backup_files = backups_future.result()
+                email_sent = email_future.result() if email_future else False
 
             # 5. Log submission status
-            self._log_submission_status(week, date, final_validation["valid"])
-
-            return {
-                "final_validation": final_validation,
-                "submission_summary": submission_summary,
-                "backup_files": backup_files,
-                "email_sent": email_sent,
-                "submission_logged": True,
-            }
-
-        except Exception as e:
-            logger.error(f"Error in Wednesday workflow: {e}")
-            return {"status": "error", "error": str(e)}
+            self._log_submission_status(week, date, final_validation["valid"], timestamp)
+
+            return WednesdayResult(
+                picks_written=picks_written,
+                final_validation=final_validation,
+                submission_summary=submission_summary,
+                backup_files=backup_files,
+                email_sent=email_sent,
+            )
+
+        except (OSError, ValueError) as e:
+            logger.error("Error in Wednesday workflow: %s", e)
+            raise WorkflowPhaseError("wednesday", e) from e
+
+    def _validate_picks(self, week: int, picks: list[Pick]) -> dict[str, Any]:
+        """Validate picks, reusing the last result when the picks are unchanged."""
+        fingerprint = tuple((pick.predicted_winner, pick.confidence_points) for pick in picks)
+        cached = self._validations.get(week)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        validation = self.excel.validate_picks(picks)
+        self._validations[week] = (fingerprint, validation)
+        return validation
+
+    def _flush_pending_picks(self, week: int, date: str) -> bool:
+        """Write the week's buffered picks to the Excel file."""
+        picks = self._pending_picks.pop(week, None)
+        if not picks:
+            return False
+        return self.excel.update_picks(week, picks, date)
 
     def _analyze_competitors(self, week: int) -> dict[str, any]:
         """Analyze competitor picks for edge identification."""
+        import numpy as np
+
         try:
-            # This would integrate with competitor data collection
-            # For now, return mock data
+            tracker = self.system.competitor_tracker
+            competitors, games, sides, confidence = tracker.get_pick_matrix(week)
+            if not competitors:
+                return {
+                    "total_competitors": 0,
+                    "public_favorites": {},
+                    "contrarian_opportunities": [],
+                    "edge_plays": [],
+                }
+
+            # Per-game share of competitors on the home side (games x 1 vector ops)
+            pick_counts = np.count_nonzero(sides, axis=0)
+            home_share = np.count_nonzero(sides == 1, axis=0) / np.maximum(pick_counts, 1)
+            favorite_share = np.maximum(home_share, 1 - home_share)
+            lopsided = (pick_counts >= 3) & (favorite_share >= 0.7)
+
+            self._competitor_matrices[week] = (games, sides * confidence.astype(np.float32))
+
             return {
-                "total_competitors": 0,
-                "public_favorites": {},
-                "contrarian_opportunities": [],
+                "total_competitors": len(competitors),
+                "public_favorites": {
+                    game: round(float(share) * 100, 1)
+                    for game, share in zip(games, home_share, strict=True)
+                },
+                "contrarian_opportunities": [games[i] for i in np.flatnonzero(lopsided)],
                 "edge_plays": [],
             }
         except Exception as e:
-            logger.error(f"Error analyzing competitors: {e}")
+            logger.error("Error analyzing competitors: %s", e)
             return {}
 
-    def _identify_edges(self, week: int, competitor_analysis: dict[str, any]) -> dict[str, any]:
+    def _identify_edges(
+        self, week: int, competitor_analysis: dict[str, any], top_k: int = 5
+    ) -> dict[str, any]:
         """Identify edges and contrarian opportunities."""
+        import numpy as np
+
         try:
-            # This would implement the edge identification logic
+            # Games where the field's average side-weighted confidence differs most from ours
+            public_fade_opportunities = []
+            matrix = self._competitor_matrices.get(week)
+            if matrix is not None:
+                games, weighted = matrix
+                expected_confidence = np.zeros(len(games), dtype=np.float32)
+                game_index = {game: i for i, game in enumerate(games)}
+                for pick in self._picks_by_week.get(week, []):
+                    if pick.game in game_index:
+                        home = pick.game.split("@")[-1]
+                        side = 1 if pick.predicted_winner == home else -1
+                        expected_confidence[game_index[pick.game]] = side * pick.confidence_points
+
+                # Average only over competitors who picked each game; unpicked games have no edge
+                pick_counts = np.count_nonzero(weighted, axis=0)
+                field_confidence = weighted.sum(axis=0) / np.maximum(pick_counts, 1)
+                edges = np.where(
+                    pick_counts > 0, np.abs(field_confidence - expected_confidence), 0
+                )
+                public_fade_opportunities = [
+                    games[i] for i in np.argsort(edges)[::-1][:top_k] if edges[i] > 0
+                ]
+
             return {
-                "public_fade_opportunities": [],
+                "public_fade_opportunities": public_fade_opportunities,
                 "injury_misinformation": [],
                 "weather_plays": [],
                 "situational_factors": [],
             }
         except Exception as e:
-            logger.error(f"Error identifying edges: {e}")
+            logger.error("Error identifying edges: %s", e)
             return {}
 
-    def _optimize_picks(self, week: int, edge_analysis: dict[str, any]) -> list:
+    def _optimize_picks(
+        self, week: int, edge_analysis: dict[str, any], llm_data: Optional[dict] = None
+    ) -> list:
         """Optimize picks based on competitive analysis."""
         try:
+            # Only a newly collected LLM analysis changes the picks (the edges don't feed
+            # the optimizer yet), and regenerating would redraw the variance picks
+            monday_analysis = self._llm_analysis_by_week.get(week)
+            if llm_data is None or llm_data == monday_analysis:
+                cached_picks = self._picks_by_week.get(week)
+                if cached_picks:
+                    return cached_picks
+                if llm_data is None:
+                    llm_data = monday_analysis
+
             # This would implement pick optimization logic
-            # For now, return the original picks
-            return self.system.generate_optimal_picks(week)
+            # For now, regenerate with the LLM analysis the picks should reflect
+            return self.system.generate_optimal_picks(week, llm_data)
         except Exception as e:
-            logger.error(f"Error optimizing picks: {e}")
+            logger.error("Error optimizing picks: %s", e)
             return []
 
     def _final_validation(self, week: int, date: str) -> dict[str, any]:
@@ -252,17 +457,15 @@ class WeeklyAutomation:
                 "pick_count": len(picks) if picks else 0,
             }
         except Exception as e:
-            logger.error(f"Error in final validation: {e}")
+            logger.error("Error in final validation: %s", e)
             return {"valid": False, "error": str(e)}
 
     def _generate_submission_summary(self, week: int, date: str) -> str:
         """Generate submission summary."""
         try:
-            picks = self.excel.get_current_picks(week)
-            summary = self.excel.create_submission_summary(week, date)
-            return summary
+            return self.excel.create_submission_summary(week, date)
         except Exception as e:
-            logger.error(f"Error generating submission summary: {e}")
+            logger.error("Error generating submission summary: %s", e)
             return "Error generating summary"
 
     def _create_backups(self, week: int, date: str) -> list[str]:
@@ -276,15 +479,23 @@ class WeeklyAutomation:
                 backup_files.append(excel_backup)
 
             # Backup prompt file
-            prompt_file = f"data/prompts/{date}_prompt.txt"
-            if os.path.exists(prompt_file):
-                backup_file = f"{prompt_file}.backup"
-                os.rename(prompt_file, backup_file)
-                backup_files.append(backup_file)
+            prompt_path = self._prompt_path(date)
+            backup_path = prompt_path.with_suffix(".txt.backup")
+            backup_path.unlink(missing_ok=True)
+            try:
+                # Hard link when possible so no data is copied
+                os.link(prompt_path, backup_path)
+                backup_files.append(str(backup_path))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Hard links fail across filesystems; fall back to a real copy
+                shutil.copy2(prompt_path, backup_path)
+                backup_files.append(str(backup_path))
 
             return backup_files
         except Exception as e:
-            logger.error(f"Error creating backups: {e}")
+            logger.error("Error creating backups: %s", e)
             return []
 
     def _send_submission_email(self, week: int, date: str) -> bool:
@@ -295,35 +506,33 @@ class WeeklyAutomation:
 
             # This would implement email sending logic
             # For now, just log the action
-            logger.info(f"Would send submission email for Week {week}")
+            logger.info("Would send submission email for Week %s", week)
             return True
         except Exception as e:
-            logger.error(f"Error sending submission email: {e}")
+            logger.error("Error sending submission email: %s", e)
             return False
 
-    def _log_submission_status(self, week: int, date: str, valid: bool) -> None:
+    def _log_submission_status(
+        self, week: int, date: str, valid: bool, timestamp: Optional[str] = None
+    ) -> None:
         """Log submission status."""
         try:
             status = {
                 "week": week,
                 "date": date,
                 "valid": valid,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
             }
 
-            # Save to log file
-            log_file = f"submission_log_{week}.json"
-            with open(log_file, "w") as f:
-                json.dump(status, f, indent=2)
+            # Append to the submission log (one JSON record per line)
+            append_jsonl("submission_log.jsonl", status)
 
         except Exception as e:
-            logger.error(f"Error logging submission status: {e}")
+            logger.error("Error logging submission status: %s", e)
 
     def _save_workflow_results(self, results: dict[str, any]) -> None:
         """Save workflow results."""
         try:
-            results_file = f"workflow_results_{results['week']}.json"
-            with open(results_file, "w") as f:
-                json.dump(results, f, indent=2)
+            append_jsonl("workflow_results.jsonl", results)
         except Exception as e:
-            logger.error(f"Error saving workflow results: {e}")
+            logger.error("Error saving workflow results: %s", e)
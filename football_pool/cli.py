@@ -5,25 +5,39 @@ Provides a comprehensive CLI for managing weekly workflow.
 """
 
 import json
+import logging
 import os
-from datetime import datetime, timedelta
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict
+from functools import cache, lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt
-from rich.table import Table
 
-from .automation import AutomationConfig, WeeklyAutomation
 from .core import PoolDominationSystem
-from .excel_automation import ExcelAutomation
+from .json_utils import (
+    dumps,
+    iter_json_items,
+    read_json,
+    read_json_lazy,
+    to_python,
+    write_json,
+)
 from .log_viewer import LogViewer
 from .logging_config import logger
 from .models import Pick
 
+if TYPE_CHECKING:
+    from .excel_automation import ExcelAutomation
+    from .report_generator import StrategyReportGenerator
+
 # Initialize Typer app
 app = typer.Typer(
     name="football-pool",
@@ -32,8 +46,133 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
+
+class BufferedConsole(Console):
+    """Rich console that can collect lines and render them in one print call."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._line_buffer: list[str] = []
+
+    def writeln(self, line: str = "") -> None:
+        """Queue a line of (markup) text for the next flush."""
+        self._line_buffer.append(line)
+
+    def flush(self) -> None:
+        """Render all queued lines with a single print."""
+        if self._line_buffer:
+            self.print("\n".join(self._line_buffer))
+            self._line_buffer.clear()
+
+
 # Initialize Rich console
-console = Console()
+console = BufferedConsole()
+
+# Shared across commands run in the same process; see _get_system()
+_system: Optional[PoolDominationSystem] = None
+
+# Generated prompts live here (relative to the working directory)
+_PROMPTS_DIR = Path("data/prompts")
+
+# Fallback picks from weekly-workflow, reused on re-runs until their inputs change
+_PICKS_DIR = Path("data/picks")
+_SCHEDULE_FILE = Path("2025-2026 Football Schedule.xlsx")
+
+# Bound formatters for table cells (static format specs, no per-cell f-string parsing)
+_PCT = "{:.1f}%".format
+_ONE_DP = "{:.1f}".format
+
+# API usage percentage thresholds -> (color, status), highest first
+_USAGE_STATUS = (
+    (90, "red", "🔴 CRITICAL"),
+    (75, "yellow", "🟡 WARNING"),
+    (50, "orange", "🟠 CAUTION"),
+    (float("-inf"), "green", "🟢 SAFE"),
+)
+
+
+@cache
+def _ensure_dir(abs_path: str) -> None:
+    """Create a directory once per process (callers pass an absolute path)."""
+    os.makedirs(abs_path, exist_ok=True)
+
+
+@contextmanager
+def _maybe_progress(description: str) -> Iterator[Callable[[str], None]]:
+    """Show a spinner on a terminal; yields a callable that updates its description.
+
+    Under cron/CI there is no terminal, so skip the spinner and its refresh thread.
+    """
+    if not console.is_terminal:
+        yield lambda _description: None
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield lambda new_description: progress.update(task, description=new_description)
+
+
+def _contrarian_prompt_path(date: str) -> Path:
+    """Path of the saved contrarian prompt for a date."""
+    return _PROMPTS_DIR / f"{date}_contrarian_prompt.txt"
+
+
+def _is_newer_than(path: Path, sources: Iterable[Path]) -> bool:
+    """Check whether a file exists and is newer than each of its sources that exists."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+    for source in sources:
+        try:
+            if source.stat().st_mtime_ns > mtime:
+                return False
+        except FileNotFoundError:
+            continue
+    return True
+
+
+def _get_system() -> PoolDominationSystem:
+    """Get the shared PoolDominationSystem for this process."""
+    global _system
+    if _system is None:
+        _system = PoolDominationSystem()
+    return _system
+
+
+def _reset_system() -> None:
+    """Drop the shared system so the next _get_system() builds a fresh one."""
+    global _system
+    _system = None
+
+
+@lru_cache(maxsize=1)
+def _get_excel() -> "ExcelAutomation":
+    """Get the shared ExcelAutomation for this process."""
+    from .excel_automation import ExcelAutomation
+
+    return ExcelAutomation()
+
+
+@lru_cache(maxsize=1)
+def _get_report_generator() -> "StrategyReportGenerator":
+    """Get the shared StrategyReportGenerator for this process."""
+    from .report_generator import StrategyReportGenerator
+
+    return StrategyReportGenerator()
+
+
+@lru_cache(maxsize=1)
+def _get_log_viewer() -> LogViewer:
+    """Get the shared LogViewer for this process."""
+    return LogViewer()
 
 
 @app.command()
@@ -47,7 +186,7 @@ def prompt(
 ):
     """Generate LLM research prompt for the specified week."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
 
         if enhanced:
             prompt_text = system.get_enhanced_llm_prompt(week, force_refresh)
@@ -62,9 +201,7 @@ def prompt(
             output_file.write_text(prompt_text)
             console.print(f"✅ Prompt saved to {output_file}")
         else:
-            console.print(
-                Panel(prompt_text, title=f"Week {week} Research Prompt", border_style="blue")
-            )
+            _emit_prompt(prompt_text, f"Week {week} Research Prompt")
 
     except Exception as e:
         console.print(f"❌ Error generating prompt: {e}")
@@ -75,6 +212,7 @@ def prompt(
 def contrarian_prompt(
     date: str = typer.Argument(..., help="Date for contrarian analysis (e.g., '2024-09-17')"),
     output_file: Optional[Path] = typer.Option(None, "--output", "-o", help="Save prompt to file"),
+    full: bool = typer.Option(False, "--full", help="Display the full prompt, not a preview"),
 ):
     """Generate contrarian analysis prompt for optimal strategy."""
     try:
@@ -83,7 +221,7 @@ def contrarian_prompt(
             {"date": date, "output_file": str(output_file) if output_file else None},
         )
 
-        system = PoolDominationSystem()
+        system = _get_system()
         console.print(f"🎯 Generating CONTRARIAN ANALYSIS prompt for {date}")
         console.print("📊 Focus: Contrarian opportunities and value plays")
 
@@ -93,26 +231,21 @@ def contrarian_prompt(
         prompt_text = system.generate_contrarian_analysis_prompt_by_date(date)
 
         # Log prompt details
-        logger.llm_logger.debug(f"Generated contrarian prompt: {len(prompt_text)} characters")
-        logger.llm_logger.debug(f"Prompt preview: {prompt_text[:200]}...")
-
-        if output_file:
-            output_file.write_text(prompt_text)
-            console.print(f"✅ Contrarian prompt saved to {output_file}")
-            logger.excel_logger.info(f"Saved contrarian prompt to {output_file}")
-        else:
-            # Save to data/prompts directory
-            os.makedirs("data/prompts", exist_ok=True)
-            filename = f"data/prompts/{date}_contrarian_prompt.txt"
-            with open(filename, "w") as f:
-                f.write(prompt_text)
-            console.print(f"💾 Contrarian prompt saved to {filename}")
-            logger.excel_logger.info(f"Saved contrarian prompt to {filename}")
-
-        # Display the prompt
-        console.print(
-            Panel(prompt_text, title=f"{date} Contrarian Analysis Prompt", border_style="green")
+        if logger.llm_logger.isEnabledFor(logging.DEBUG):
+            logger.llm_logger.debug("Generated contrarian prompt: %d characters", len(prompt_text))
+            logger.llm_logger.debug("Prompt preview: %s...", prompt_text[:200])
+
+        # Save (to data/prompts unless an output file is given) and display the prompt
+        prompt_path = output_file or _contrarian_prompt_path(date)
+        _emit_prompt(
+            prompt_text,
+            f"{date} Contrarian Analysis Prompt",
+            prompt_path,
+            border_style="green",
+            full=full,
         )
+        console.print(f"💾 Contrarian prompt saved to {prompt_path}")
+        logger.excel_logger.info(f"Saved contrarian prompt to {prompt_path}")
 
         logger.log_command_end("contrarian_prompt", success=True)
 
@@ -130,23 +263,22 @@ def import_llm(
 ):
     """Import LLM analysis data for the specified week."""
     try:
-        if not file_path.exists():
+        try:
+            llm_doc = read_json_lazy(file_path)
+        except FileNotFoundError:
             console.print(f"❌ File not found: {file_path}")
             raise typer.Exit(1)
 
-        with open(file_path) as f:
-            llm_data = json.load(f)
-
         if validate:
-            # Basic validation
+            # Basic validation (top-level keys only, nothing materialized yet)
             required_fields = ["games", "spreads", "public_percentages", "confidence_scores"]
-            missing_fields = [field for field in required_fields if field not in llm_data]
+            missing_fields = [field for field in required_fields if field not in llm_doc]
             if missing_fields:
                 console.print(f"❌ Missing required fields: {missing_fields}")
                 raise typer.Exit(1)
 
-        system = PoolDominationSystem()
-        system.save_llm_data(week, llm_data)
+        system = _get_system()
+        system.save_llm_data(week, to_python(llm_doc))
 
         console.print(f"✅ LLM data imported for Week {week}")
 
@@ -158,6 +290,27 @@ def import_llm(
         raise typer.Exit(1)
 
 
+@app.command()
+def collect_batch(week: int = typer.Argument(..., help="Week number")):
+    """Collect the week's submitted LLM batch and import its analysis when complete."""
+    try:
+        system = _get_system()
+        status, analysis = system.collect_llm_batch(week)
+
+        if status is None:
+            console.print(f"ℹ️  No pending LLM batch for Week {week}")
+        elif analysis:
+            console.print(f"✅ LLM batch analysis imported for Week {week}")
+        elif status == "completed":
+            console.print(f"⚠️ LLM batch for Week {week} completed without an analysis")
+        else:
+            console.print(f"⏳ LLM batch for Week {week} is {status}; try again later")
+
+    except Exception as e:
+        console.print(f"❌ Error collecting LLM batch: {e}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def picks(
     week: int = typer.Argument(..., help="Week number"),
@@ -166,6 +319,8 @@ def picks(
     save: bool = typer.Option(False, "--save", help="Save picks to database"),
 ):
     """Generate optimal picks for the specified week."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -174,7 +329,7 @@ def picks(
         ) as progress:
             task = progress.add_task("Generating optimal picks...", total=None)
 
-            system = PoolDominationSystem()
+            system = _get_system()
 
             # Load LLM data if available
             llm_data = system.load_llm_data(week)
@@ -188,16 +343,15 @@ def picks(
 
             progress.update(task, description="✅ Picks generated!")
 
+        # Sort once by confidence (highest first); every display format reuses the order
+        picks.sort(key=attrgetter("confidence_points"), reverse=True)
+
         # Display picks
-        if format == "table":
-            _display_picks_table(picks, week)
-        elif format == "csv":
-            _display_picks_csv(picks)
-        elif format == "json":
-            _display_picks_json(picks)
-        else:
+        renderer = _PICK_RENDERERS.get(format)
+        if renderer is None:
             console.print(f"❌ Unknown format: {format}")
             raise typer.Exit(1)
+        renderer(picks, week)
 
         # Save to database if requested
         if save:
@@ -219,16 +373,16 @@ def results(
 ):
     """Track and import game results."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
 
         if import_file:
-            if not import_file.exists():
+            try:
+                results = iter_json_items(import_file)
+            except FileNotFoundError:
                 console.print(f"❌ File not found: {import_file}")
                 raise typer.Exit(1)
 
-            with open(import_file) as f:
-                results = json.load(f)
-
+            # Results are streamed straight into the database as (game, winner) pairs
             system.track_results(week, results)
             console.print(f"✅ Results imported for Week {week}")
 
@@ -238,7 +392,9 @@ def results(
 
             # Get current week's games
             picks = system.get_picks(week)
-            games = list(set(pick.game for pick in picks))
+            games = list(dict.fromkeys(pick.game for pick in picks))
+
+            from rich.prompt import Prompt
 
             for game in games:
                 winner = Prompt.ask(f"Winner of {game}", default="")
@@ -267,22 +423,19 @@ def report(
 ):
     """Generate weekly performance report."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
 
         if week is None:
             # Get latest week with data
-            picks = system.get_all_picks()
-            week = max(pick.week for pick in picks) if picks else 3
+            week = system.get_latest_week() or 3
 
         report_data = system.generate_weekly_report(week)
 
-        if format == "table":
-            _display_report_table(report_data, week)
-        elif format == "json":
-            console.print(json.dumps(report_data, indent=2, default=str))
-        else:
+        renderer = _REPORT_RENDERERS.get(format)
+        if renderer is None:
             console.print(f"❌ Unknown format: {format}")
             raise typer.Exit(1)
+        renderer(report_data, week)
 
     except Exception as e:
         console.print(f"❌ Error generating report: {e}")
@@ -292,8 +445,10 @@ def report(
 @app.command()
 def stats():
     """Display overall performance statistics."""
+    from rich.table import Table
+
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
         stats = system.get_performance_stats()
 
         # Create stats table
@@ -303,10 +458,10 @@ def stats():
 
         table.add_row("Total Picks", str(stats["total_picks"]))
         table.add_row("Correct Picks", str(stats["correct_picks"]))
-        table.add_row("Win Rate", f"{stats['win_rate']:.1f}%")
+        table.add_row("Win Rate", _PCT(stats["win_rate"]))
         table.add_row("Total Points", str(stats["total_points"]))
-        table.add_row("Avg Correct Confidence", f"{stats['avg_correct_confidence']:.1f}")
-        table.add_row("Avg Wrong Confidence", f"{stats['avg_wrong_confidence']:.1f}")
+        table.add_row("Avg Correct Confidence", _ONE_DP(stats["avg_correct_confidence"]))
+        table.add_row("Avg Wrong Confidence", _ONE_DP(stats["avg_wrong_confidence"]))
 
         console.print(table)
 
@@ -325,8 +480,8 @@ def stats():
                     strategy,
                     str(perf["uses"]),
                     str(perf["wins"]),
-                    f"{perf['win_rate']:.1f}%",
-                    f"{perf['avg_points']:.1f}",
+                    _PCT(perf["win_rate"]),
+                    _ONE_DP(perf["avg_points"]),
                 )
 
             console.print(strategy_table)
@@ -344,14 +499,13 @@ def competitors(
 ):
     """Track competitor picks for analysis."""
     try:
-        if not file_path.exists():
+        try:
+            picks_data = iter_json_items(file_path)
+        except FileNotFoundError:
             console.print(f"❌ File not found: {file_path}")
             raise typer.Exit(1)
 
-        with open(file_path) as f:
-            picks_data = json.load(f)
-
-        system = PoolDominationSystem()
+        system = _get_system()
         system.track_competitor_picks(week, name, picks_data)
 
         console.print(f"✅ Competitor picks tracked for {name} in Week {week}")
@@ -365,23 +519,25 @@ def competitors(
 def analyze():
     """Analyze competitor patterns and personal edges."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
 
-        # Competitor patterns
         patterns = system.analyze_competitor_patterns()
+        edges = system.identify_personal_edges()
+
+        # Buffer both sections and render them in a single print
         if patterns:
-            console.print("🔍 Competitor Analysis:")
+            console.writeln("🔍 Competitor Analysis:")
             for name, pattern in patterns.items():
-                console.print(
+                console.writeln(
                     f"  {name}: {pattern['strategy_type']} ({pattern['total_weeks']} weeks)"
                 )
 
-        # Personal edges
-        edges = system.identify_personal_edges()
         if edges:
-            console.print("\n🎯 Your Personal Edges:")
-            console.print(f"  Strengths: {', '.join(edges.get('strengths', []))}")
-            console.print(f"  Weaknesses: {', '.join(edges.get('weaknesses', []))}")
+            console.writeln("\n🎯 Your Personal Edges:")
+            console.writeln(f"  Strengths: {', '.join(edges.get('strengths', []))}")
+            console.writeln(f"  Weaknesses: {', '.join(edges.get('weaknesses', []))}")
+
+        console.flush()
 
     except Exception as e:
         console.print(f"❌ Error analyzing patterns: {e}")
@@ -392,14 +548,17 @@ def analyze():
 def project():
     """Project season finish based on current performance."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
         projection = system.project_season_finish()
 
-        console.print("🔮 Season Projection:")
-        console.print(f"  Current Rank: {projection['current_rank']}/{projection['total_players']}")
-        console.print(f"  Projected Final Rank: {projection['projected_final_rank']}")
-        console.print(f"  Win Probability: {projection['win_probability']:.1f}%")
-        console.print(f"  Expected Final Score: {projection['expected_final_score']:.1f}")
+        console.writeln("🔮 Season Projection:")
+        console.writeln(
+            f"  Current Rank: {projection['current_rank']}/{projection['total_players']}"
+        )
+        console.writeln(f"  Projected Final Rank: {projection['projected_final_rank']}")
+        console.writeln(f"  Win Probability: {projection['win_probability']:.1f}%")
+        console.writeln(f"  Expected Final Score: {projection['expected_final_score']:.1f}")
+        console.flush()
 
     except Exception as e:
         console.print(f"❌ Error projecting season: {e}")
@@ -408,9 +567,46 @@ def project():
 
 # Helper functions for display formatting
 
+# Saved prompts longer than this are previewed rather than rendered in full
+_PROMPT_PREVIEW_CHARS = 4000
+
+
+def _emit_prompt(
+    text: str,
+    title: str,
+    path: Optional[Path] = None,
+    border_style: str = "blue",
+    full: bool = False,
+):
+    """Save a prompt (when a path is given) and display it in a panel.
+
+    Saved prompts are shown as a preview unless ``full`` is set, so Rich never
+    has to render the whole payload when it is already on disk.
+    """
+    preview = text
+    if path:
+        _ensure_dir(os.path.abspath(path.parent))
+        path.write_bytes(text.encode("utf-8"))
+        if not full and len(text) > _PROMPT_PREVIEW_CHARS:
+            preview = f"{text[:_PROMPT_PREVIEW_CHARS]}\n...[truncated, full prompt in {path}]"
+
+    console.print(Panel(preview, title=title, border_style=border_style))
+
+
+def _head_lines(text: str, n: int) -> str:
+    """Return the first ``n`` lines of text without splitting the rest of it."""
+    end = -1
+    for _ in range(n):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text
+    return text[:max(end, 0)]
+
 
 def _display_picks_table(picks: list[Pick], week: int):
-    """Display picks in a formatted table."""
+    """Display picks (already sorted by confidence) in a formatted table."""
+    from rich.table import Table
+
     table = Table(title=f"Week {week} Optimal Picks")
     table.add_column("Pts", style="cyan", justify="right")
     table.add_column("Game", style="white")
@@ -418,40 +614,41 @@ def _display_picks_table(picks: list[Pick], week: int):
     table.add_column("Conf", style="yellow", justify="right")
     table.add_column("Strategy", style="blue")
 
-    for pick in sorted(picks, key=lambda x: x.confidence_points, reverse=True):
+    for pick in picks:
         table.add_row(
             str(pick.confidence_points),
             pick.game,
             pick.predicted_winner,
-            f"{pick.conf:.1f}%" if pick.conf else "N/A",
+            _PCT(pick.conf) if pick.conf else "N/A",
             pick.strategy_tag or "N/A",
         )
 
     console.print(table)
 
 
-def _display_picks_csv(picks: list[Pick]):
-    """Display picks in CSV format."""
-    print("Game,Pick,Points")
-    for pick in sorted(picks, key=lambda x: x.confidence_points, reverse=True):
-        print(f"{pick.game},{pick.predicted_winner},{pick.confidence_points}")
+def _display_picks_csv(picks: list[Pick], week: int):
+    """Display picks (already sorted by confidence) in CSV format."""
+    rows = (f"{pick.game},{pick.predicted_winner},{pick.confidence_points}\n" for pick in picks)
+    sys.stdout.write("Game,Pick,Points\n" + "".join(rows))
 
 
-def _display_picks_json(picks: list[Pick]):
-    """Display picks in JSON format."""
-    picks_data = []
-    for pick in picks:
-        picks_data.append(
-            {
-                "game": pick.game,
-                "predicted_winner": pick.predicted_winner,
-                "confidence_points": pick.confidence_points,
-                "confidence": pick.conf,
-                "strategy": pick.strategy_tag,
-            }
-        )
+def _display_picks_json(picks: list[Pick], week: int):
+    """Display picks in JSON format (raw bytes to stdout, no Rich markup parsing)."""
+    picks_data = [
+        {
+            "game": pick.game,
+            "predicted_winner": pick.predicted_winner,
+            "confidence_points": pick.confidence_points,
+            "confidence": pick.conf,
+            "strategy": pick.strategy_tag,
+        }
+        for pick in picks
+    ]
 
-    console.print(json.dumps(picks_data, indent=2))
+    # Flush pending text output so it stays ordered before the raw bytes
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps(picks_data, indent=True) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def _display_report_table(report_data: dict[str, Any], week: int):
@@ -460,6 +657,8 @@ def _display_report_table(report_data: dict[str, Any], week: int):
 
     # Key metrics
     if "performance" in report_data:
+        from rich.table import Table
+
         perf = report_data["performance"]
         table = Table(title="Performance Summary")
         table.add_column("Metric", style="cyan")
@@ -467,48 +666,61 @@ def _display_report_table(report_data: dict[str, Any], week: int):
 
         table.add_row("Weekly Score", str(perf.get("weekly_score", "N/A")))
         table.add_row("Correct Picks", str(perf.get("correct_picks", "N/A")))
-        table.add_row("Win Rate", f"{perf.get('win_rate', 0):.1f}%")
+        table.add_row("Win Rate", _PCT(perf.get("win_rate", 0)))
         table.add_row("Strategy Used", perf.get("strategy_used", "N/A"))
 
         console.print(table)
 
     # Insights
     if "insights" in report_data:
-        console.print("\n💡 Key Insights:")
+        console.writeln("\n💡 Key Insights:")
         for insight in report_data["insights"]:
-            console.print(f"  • {insight}")
+            console.writeln(f"  • {insight}")
+        console.flush()
+
+
+def _display_report_json(report_data: dict[str, Any], week: int):
+    """Display weekly report in JSON format."""
+    console.print(dumps(report_data, indent=True, default=str).decode())
+
+
+# Output format -> renderer; every renderer takes (data, week)
+_PICK_RENDERERS = {
+    "table": _display_picks_table,
+    "csv": _display_picks_csv,
+    "json": _display_picks_json,
+}
+_REPORT_RENDERERS = {
+    "table": _display_report_table,
+    "json": _display_report_json,
+}
 
 
 @app.command()
 def api_usage():
     """Check API usage and limits."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
         stats = system.usage_tracker.get_usage_stats()
 
-        console.print("\n[bold blue]API Usage Statistics[/bold blue]")
+        console.writeln("\n[bold blue]API Usage Statistics[/bold blue]")
 
         for api_name, data in stats.items():
             # Color coding based on usage percentage
-            if data["percentage"] >= 90:
-                color = "red"
-                status = "🔴 CRITICAL"
-            elif data["percentage"] >= 75:
-                color = "yellow"
-                status = "🟡 WARNING"
-            elif data["percentage"] >= 50:
-                color = "orange"
-                status = "🟠 CAUTION"
-            else:
-                color = "green"
-                status = "🟢 SAFE"
+            color, status = next(
+                (color, status)
+                for threshold, color, status in _USAGE_STATUS
+                if data["percentage"] >= threshold
+            )
 
-            console.print(f"\n[bold]{api_name.upper()}[/bold] - {status}")
-            console.print(f"  Used: {data['used']}/{data['limit']} ({data['percentage']:.1f}%)")
-            console.print(f"  Remaining: {data['remaining']}")
-            console.print(f"  Current Month: {data['current_month']}")
+            console.writeln(f"\n[bold]{api_name.upper()}[/bold] - {status}")
+            console.writeln(f"  Used: {data['used']}/{data['limit']} ({data['percentage']:.1f}%)")
+            console.writeln(f"  Remaining: {data['remaining']}")
+            console.writeln(f"  Current Month: {data['current_month']}")
             if data["last_reset"]:
-                console.print(f"  Last Reset: {data['last_reset']}")
+                console.writeln(f"  Last Reset: {data['last_reset']}")
+
+        console.flush()
 
     except Exception as e:
         console.print(f"❌ Error checking API usage: {e}")
@@ -519,21 +731,23 @@ def api_usage():
 def clear_cache():
     """Clear API cache files."""
     try:
-        import glob
-        from pathlib import Path
-
-        # Find and remove cache files
-        cache_files = glob.glob("cache_odds_week_*.json")
-        cache_files.extend(glob.glob("api_usage.json"))
-
+        # Find and remove cache files in a single directory pass
         removed_count = 0
-        for cache_file in cache_files:
-            try:
-                Path(cache_file).unlink()
-                removed_count += 1
-                console.print(f"🗑️  Removed {cache_file}")
-            except Exception as e:
-                console.print(f"⚠️  Could not remove {cache_file}: {e}")
+        with os.scandir(".") as entries:
+            for entry in entries:
+                name = entry.name
+                is_cache = name == "api_usage.json" or (
+                    name.startswith("cache_odds_week_") and name.endswith((".json", ".jsonl"))
+                )
+                if not is_cache or not entry.is_file():
+                    continue
+
+                try:
+                    os.unlink(entry.path)
+                    removed_count += 1
+                    console.print(f"🗑️  Removed {name}")
+                except OSError as e:
+                    console.print(f"⚠️  Could not remove {name}: {e}")
 
         if removed_count == 0:
             console.print("ℹ️  No cache files found to remove")
@@ -554,7 +768,7 @@ def test_web_search(
 ):
     """Test web search functionality."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
 
         if team:
             # Test team-specific search
@@ -600,7 +814,7 @@ def analyze_llm(
 ):
     """Get LLM analysis directly using OpenRouter models."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
 
         console.print(f"🤖 Getting LLM analysis for Week {week}")
 
@@ -619,14 +833,17 @@ def analyze_llm(
             # Display results
             console.print("\n📊 Analysis Results:")
             console.print(
-                Panel(json.dumps(analysis, indent=2), title="LLM Analysis", border_style="green")
+                Panel(
+                    dumps(analysis, indent=True).decode(),
+                    title="LLM Analysis",
+                    border_style="green",
+                )
             )
 
             # Save to file if requested
             if save:
                 filename = f"week_{week}_llm_analysis.json"
-                with open(filename, "w") as f:
-                    json.dump(analysis, f, indent=2)
+                write_json(filename, analysis, indent=True)
                 console.print(f"💾 Analysis saved to {filename}")
 
                 # Also import into system
@@ -667,7 +884,7 @@ def combine_analyses(
 ):
     """Combine automated and manual LLM analyses for enhanced insights."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
         console.print(f"🔄 Combining analyses for Week {week}")
 
         analyses = []
@@ -687,16 +904,18 @@ def combine_analyses(
 
         # Get manual analyses if provided
         if manual_files:
-            for i, manual_file in enumerate(manual_files):
-                if not os.path.exists(manual_file):
-                    console.print(f"❌ Manual analysis file not found: {manual_file}")
-                    raise typer.Exit(1)
-
-                console.print(f"📁 Loading manual analysis {i+1} from {manual_file}...")
-                with open(manual_file) as f:
-                    manual_analysis = json.load(f)
+            console.print(f"📁 Loading {len(manual_files)} manual analyses...")
+            try:
+                # Files are independent, so overlap the reads; map keeps the given order
+                with ThreadPoolExecutor(max_workers=min(8, len(manual_files))) as executor:
+                    manual_analyses = list(executor.map(read_json, manual_files))
+            except FileNotFoundError as e:
+                console.print(f"❌ Manual analysis file not found: {e.filename}")
+                raise typer.Exit(1)
+
+            for i, manual_analysis in enumerate(manual_analyses):
                 analyses.append((f"manual_{i+1}", manual_analysis))
-                console.print(f"✅ Manual analysis {i+1} loaded!")
+                console.print(f"✅ Manual analysis {i+1} loaded from {manual_files[i]}!")
 
         if not analyses:
             console.print("❌ No analyses to combine. Use --automated and/or --manual")
@@ -713,7 +932,7 @@ def combine_analyses(
             console.print("\n📊 Combined Analysis Results:")
             console.print(
                 Panel(
-                    json.dumps(combined_analysis, indent=2),
+                    dumps(combined_analysis, indent=True).decode(),
                     title="Combined Analysis",
                     border_style="blue",
                 )
@@ -721,8 +940,7 @@ def combine_analyses(
 
             # Save combined analysis
             filename = f"week_{week}_combined_analysis.json"
-            with open(filename, "w") as f:
-                json.dump(combined_analysis, f, indent=2)
+            write_json(filename, combined_analysis, indent=True)
             console.print(f"💾 Combined analysis saved to {filename}")
 
             # Import into system
@@ -754,10 +972,11 @@ def excel_prompt(
         False, "--enhanced", help="Include real odds data and web search context"
     ),
     force_refresh: bool = typer.Option(False, "--force-refresh", help="Force refresh of odds data"),
+    full: bool = typer.Option(False, "--full", help="Display the full prompt, not a preview"),
 ):
     """Generate LLM research prompt for the specified date."""
     try:
-        system = PoolDominationSystem()
+        system = _get_system()
 
         if enhanced:
             console.print("🔗 Using enhanced prompt with odds data (cached if available)")
@@ -766,15 +985,10 @@ def excel_prompt(
             console.print(f"📝 Generating basic research prompt for {date}")
             prompt_text = system.generate_llm_research_prompt_by_date(date)
 
-        # Display the prompt
-        console.print(Panel(prompt_text, title=f"{date} Research Prompt", border_style="blue"))
-
-        # Save to data/prompts directory
-        os.makedirs("data/prompts", exist_ok=True)
+        # Save to data/prompts directory and display the prompt
         safe_date = date.replace(" ", "_").replace("/", "-")
-        filename = f"data/prompts/{safe_date}_prompt.txt"
-        with open(filename, "w") as f:
-            f.write(prompt_text)
+        filename = _PROMPTS_DIR / f"{safe_date}_prompt.txt"
+        _emit_prompt(prompt_text, f"{date} Research Prompt", filename, full=full)
         console.print(f"💾 Prompt saved to {filename}")
 
     except Exception as e:
@@ -798,7 +1012,7 @@ def excel_update(
 ):
     """Update Excel file with picks for the specified week."""
     try:
-        excel = ExcelAutomation()
+        excel = _get_excel()
 
         # Load picks from file or generate them
         if analysis_file and os.path.exists(analysis_file):
@@ -812,8 +1026,7 @@ def excel_update(
                 pick["week"] = week
         elif picks_file and os.path.exists(picks_file):
             console.print(f"📁 Loading picks from {picks_file}")
-            with open(picks_file) as f:
-                picks_data = json.load(f)
+            picks_data = read_json(picks_file)
 
             # Convert to the format expected by Excel automation
             picks = []
@@ -832,7 +1045,7 @@ def excel_update(
         else:
             # Generate picks using the system
             console.print(f"🎯 Generating picks for Week {week}")
-            system = PoolDominationSystem()
+            system = _get_system()
             picks = system.generate_optimal_picks(week)
 
             # Convert Pick objects to dict format
@@ -847,9 +1060,10 @@ def excel_update(
         # Validate picks
         validation = excel.validate_picks(picks)
         if not validation["valid"]:
-            console.print("❌ Pick validation failed:")
+            console.writeln("❌ Pick validation failed:")
             for error in validation["errors"]:
-                console.print(f"  - {error}")
+                console.writeln(f"  - {error}")
+            console.flush()
             raise typer.Exit(1)
 
         # Update Excel file
@@ -860,7 +1074,7 @@ def excel_update(
             console.print(f"✅ Excel file updated successfully for Week {week}")
 
             # Show summary
-            summary = excel.create_submission_summary(week)
+            summary = excel.create_submission_summary(week, picks=picks)
             console.print(Panel(summary, title="Picks Summary", border_style="green"))
 
             # Create backup
@@ -885,7 +1099,7 @@ def excel_validate(
 ):
     """Validate picks in Excel file for the specified week."""
     try:
-        excel = ExcelAutomation()
+        excel = _get_excel()
 
         console.print(f"🔍 Validating picks for Week {week}")
         picks = excel.get_current_picks(week, date)
@@ -900,12 +1114,13 @@ def excel_validate(
         if validation["valid"]:
             console.print("✅ All picks are valid!")
         else:
-            console.print("❌ Validation failed:")
+            console.writeln("❌ Validation failed:")
             for error in validation["errors"]:
-                console.print(f"  - {error}")
+                console.writeln(f"  - {error}")
+            console.flush()
 
         # Show current picks
-        summary = excel.create_submission_summary(week)
+        summary = excel.create_submission_summary(week, picks=picks)
         console.print(Panel(summary, title="Current Picks", border_style="blue"))
 
     except Exception as e:
@@ -924,7 +1139,9 @@ def excel_submit(
 ):
     """Prepare Excel file for submission."""
     try:
-        excel = ExcelAutomation()
+        from .excel_automation import weekly_filename
+
+        excel = _get_excel()
 
         console.print(f"📧 Preparing submission for Week {week}")
 
@@ -936,21 +1153,18 @@ def excel_submit(
 
         validation = excel.validate_picks(picks)
         if not validation["valid"]:
-            console.print("❌ Picks validation failed. Please fix before submitting.")
+            console.writeln("❌ Picks validation failed. Please fix before submitting.")
             for error in validation["errors"]:
-                console.print(f"  - {error}")
+                console.writeln(f"  - {error}")
+            console.flush()
             raise typer.Exit(1)
 
         # Show submission summary
-        summary = excel.create_submission_summary(week)
+        summary = excel.create_submission_summary(week, picks=picks)
         console.print(Panel(summary, title="Submission Summary", border_style="green"))
 
         # Show file location
-        if date:
-            filename = f"Dawgpac25_{date}.xlsx"
-        else:
-            filename = f"Dawgpac25_Week{week}.xlsx"
-        console.print(f"📁 Excel file: {filename}")
+        console.print(f"📁 Excel file: {weekly_filename(week, date)}")
 
         if email:
             console.print(f"📧 Email: {email}")
@@ -981,26 +1195,24 @@ def auto_workflow(
         console.print(f"🤖 Starting automated workflow for Week {week} ({date})")
 
         # Load configuration
+        from .automation import AutomationConfig, WeeklyAutomation
+        from .excel_automation import weekly_filename
+
         config = AutomationConfig()
-        if config_file and os.path.exists(config_file):
-            with open(config_file) as f:
-                config_data = json.load(f)
-                config = AutomationConfig(**config_data)
+        if config_file:
+            try:
+                config = AutomationConfig(**read_json(config_file))
+            except FileNotFoundError:
+                pass  # No config file yet: run with the default settings
 
         # Initialize automation
         automation = WeeklyAutomation(config)
 
         # Run workflow
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running automated workflow...", total=None)
-
+        with _maybe_progress("Running automated workflow...") as update_progress:
             results = automation.run_weekly_workflow(date, week)
 
-            progress.update(task, description="Workflow completed!")
+            update_progress("Workflow completed!")
 
         # Display results
         if results["status"] == "completed":
@@ -1017,7 +1229,7 @@ def auto_workflow(
             )
 
             # Show Excel file
-            excel_file = f"Dawgpac25_{date}.xlsx"
+            excel_file = weekly_filename(week, date)
             if os.path.exists(excel_file):
                 console.print(f"📁 Excel file: {excel_file}")
                 console.print("💡 Ready for submission!")
@@ -1036,31 +1248,12 @@ def auto_workflow(
 def create_config(output_file: str = typer.Argument(..., help="Output file for automation config")):
     """Create an automation configuration file."""
     try:
-        config = AutomationConfig(
-            auto_email=False,
-            email_recipient="",
-            smtp_server="",
-            smtp_port=587,
-            smtp_username="",
-            smtp_password="",
-            backup_enabled=True,
-            notifications_enabled=True,
-        )
+        from .automation import AutomationConfig
 
-        # Convert to dict for JSON serialization
-        config_dict = {
-            "auto_email": config.auto_email,
-            "email_recipient": config.email_recipient,
-            "smtp_server": config.smtp_server,
-            "smtp_port": config.smtp_port,
-            "smtp_username": config.smtp_username,
-            "smtp_password": config.smtp_password,
-            "backup_enabled": config.backup_enabled,
-            "notifications_enabled": config.notifications_enabled,
-        }
+        # Serialize the default settings; every field is a JSON-native scalar
+        config_dict = asdict(AutomationConfig())
 
-        with open(output_file, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        write_json(output_file, config_dict, indent=True)
 
         console.print(f"✅ Configuration file created: {output_file}")
         console.print("💡 Edit the file to configure automation settings")
@@ -1104,7 +1297,7 @@ def logs(
 ):
     """View and analyze log files."""
     try:
-        viewer = LogViewer()
+        viewer = _get_log_viewer()
 
         if action == "summary":
             viewer.show_log_summary()
@@ -1152,41 +1345,43 @@ def strategy_report(
 ):
     """Generate comprehensive strategy report in markdown format."""
     try:
-        from .report_generator import StrategyReportGenerator
-
         # Set default analysis file if not provided
         if not analysis_file:
             analysis_file = f"data/json/week_{week}_complete_contrarian_analysis.json"
 
-        # Check if analysis file exists
-        if not os.path.exists(analysis_file):
+        # Load the analysis once; a missing file is the only hard error here
+        try:
+            analysis_data = read_json(analysis_file)
+        except FileNotFoundError:
             console.print(f"❌ Analysis file not found: {analysis_file}")
             console.print("💡 Generate analysis first with: football-pool contrarian-prompt")
             raise typer.Exit(1)
+        except ValueError as e:
+            # Malformed JSON: warn and build the report without the analysis
+            console.print(f"⚠️ Warning: Could not parse analysis file {analysis_file}: {e}")
+            analysis_data = {}
 
         # Initialize report generator
-        generator = StrategyReportGenerator()
+        generator = _get_report_generator()
 
         # Generate report
         console.print(f"📊 Generating strategy report for Week {week}...")
-        report_path = generator.generate_weekly_strategy_report(
+        report_path, report_content = generator.generate_weekly_strategy_report(
             week=week,
             date=date,
             analysis_file=analysis_file,
-            picks_file=picks_file
+            picks_file=picks_file,
+            analysis_data=analysis_data
         )
 
         console.print(f"✅ Strategy report generated: {report_path}")
         console.print(f"📁 Report saved to: {report_path}")
 
-        # Show preview of report
-        with open(report_path, 'r') as f:
-            content = f.read()
-            lines = content.split('\n')
-            preview_lines = lines[:20]  # First 20 lines
+        # Show preview of report (already in memory, no need to re-read the file)
+        preview = _head_lines(report_content, 20)
 
         console.print("\n📋 Report Preview:")
-        console.print(Panel('\n'.join(preview_lines), title="Strategy Report Preview", border_style="blue"))
+        console.print(Panel(preview, title="Strategy Report Preview", border_style="blue"))
 
         logger.log_command_end("strategy_report", success=True)
 
@@ -1209,25 +1404,31 @@ def enhanced_report(
 ):
     """Generate LLM-enhanced strategy report with next week considerations."""
     try:
-        from .report_generator import StrategyReportGenerator
+        from .report_generator import report_filename
 
         # Set default analysis file if not provided
         if not analysis_file:
             analysis_file = f"data/json/week_{week}_complete_contrarian_analysis.json"
 
-        # Check if analysis file exists
-        if not os.path.exists(analysis_file):
+        # Load the analysis once; a missing file is the only hard error here
+        try:
+            analysis_data = read_json(analysis_file)
+        except FileNotFoundError:
             console.print(f"❌ Analysis file not found: {analysis_file}")
             console.print("💡 Generate analysis first with: football-pool contrarian-prompt")
             raise typer.Exit(1)
+        except ValueError as e:
+            # Malformed JSON: warn and build the report without the analysis
+            console.print(f"⚠️ Warning: Could not parse analysis file {analysis_file}: {e}")
+            analysis_data = {}
 
         # Initialize report generator
-        generator = StrategyReportGenerator()
+        generator = _get_report_generator()
 
-        # Get API key if LLM is requested
+        # Get API key if LLM is requested (read once by the system after loading .env)
         openrouter_api_key = None
         if use_llm:
-            openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
+            openrouter_api_key = _get_system().openrouter_api_key
             if not openrouter_api_key:
                 console.print("⚠️ OPENROUTER_API_KEY not found, generating standard report")
                 use_llm = False
@@ -1240,33 +1441,31 @@ def enhanced_report(
                 week=week,
                 date=date,
                 analysis_file=analysis_file,
-                openrouter_api_key=openrouter_api_key
+                openrouter_api_key=openrouter_api_key,
+                analysis_data=analysis_data
             )
         else:
             report_content = generator._build_report_content(
                 week=week,
                 date=date,
-                analysis_data=generator._load_analysis_data(analysis_file),
+                analysis_data=analysis_data,
                 picks_data=None
             )
 
         # Save report
-        report_filename = f"Week_{week}_Enhanced_Strategy_Report_{date}.md"
-        report_path = Path("reports") / report_filename
+        report_path = Path("reports") / report_filename(week, date, enhanced=True)
         report_path.parent.mkdir(exist_ok=True)
 
-        with open(report_path, 'w') as f:
-            f.write(report_content)
+        report_path.write_bytes(report_content.encode("utf-8"))
 
         console.print(f"✅ Enhanced strategy report generated: {report_path}")
         console.print(f"📁 Report saved to: {report_path}")
 
         # Show preview of report
-        lines = report_content.split('\n')
-        preview_lines = lines[:25]  # First 25 lines
+        preview = _head_lines(report_content, 25)
 
         console.print("\n📋 Report Preview:")
-        console.print(Panel('\n'.join(preview_lines), title="Enhanced Strategy Report Preview", border_style="green"))
+        console.print(Panel(preview, title="Enhanced Strategy Report Preview", border_style="green"))
 
         logger.log_command_end("enhanced_report", success=True)
 
@@ -1285,15 +1484,13 @@ def value_optimization(
     """Analyze picks for value play opportunities and optimization."""
     try:
         from .value_optimization import ValuePlayOptimizer
-        import json
 
         if not analysis:
             console.print("❌ Analysis file required for value optimization")
             raise typer.Exit(1)
 
         # Load contrarian analysis
-        with open(analysis, 'r') as f:
-            data = json.load(f)
+        data = read_json(analysis)
 
         picks = data.get("optimal_picks", [])
         if not picks:
@@ -1336,8 +1533,7 @@ def value_optimization(
 
         # Save report if output specified
         if output:
-            with open(output, 'w') as f:
-                json.dump(value_report, f, indent=2)
+            write_json(output, value_report, indent=True)
             console.print(f"\n💾 Value analysis report saved to: {output}")
 
     except Exception as e:
@@ -1375,15 +1571,13 @@ def multi_llm_analysis(
         analyses = {}
 
         if grok_file.exists():
-            with open(grok_file, 'r') as f:
-                analyses['grok'] = json.load(f)
+            analyses['grok'] = read_json(grok_file)
             console.print(f"✅ Loaded Grok analysis: {grok_file}")
         else:
             console.print(f"⚠️  Grok file not found: {grok_file}")
 
         if chatgpt_file.exists():
-            with open(chatgpt_file, 'r') as f:
-                analyses['chatgpt'] = json.load(f)
+            analyses['chatgpt'] = read_json(chatgpt_file)
             console.print(f"✅ Loaded ChatGPT analysis: {chatgpt_file}")
         else:
             console.print(f"⚠️  ChatGPT file not found: {chatgpt_file}")
@@ -1407,24 +1601,22 @@ def multi_llm_analysis(
 
         # Save integrated analysis
         output_file = f"data/json/week_{week}_multi_llm_analysis.json"
-        with open(output_file, 'w') as f:
-            json.dump({
-                "date": date,
-                "individual_analyses": analyses,
-                "combined_analysis": combined_analysis,
-                "optimal_picks": consensus_picks,  # Use standard format
-                "consensus_picks": consensus_picks,
-                "strategy_used": combine_strategy,
-                "report": report
-            }, f, indent=2)
+        write_json(output_file, {
+            "date": date,
+            "individual_analyses": analyses,
+            "combined_analysis": combined_analysis,
+            "optimal_picks": consensus_picks,  # Use standard format
+            "consensus_picks": consensus_picks,
+            "strategy_used": combine_strategy,
+            "report": report
+        }, indent=True)
 
         console.print(f"✅ Multi-LLM analysis saved to: {output_file}")
         console.print(f"📊 Generated {len(consensus_picks)} consensus picks")
         console.print(f"🎯 Strategy used: {combine_strategy}")
 
         # Update Excel with consensus picks
-        from .excel_automation import ExcelAutomation
-        excel = ExcelAutomation()
+        excel = _get_excel()
         success = excel.update_picks_from_analysis(output_file, week, date)
         if success:
             console.print("✅ Excel file updated with consensus picks")
@@ -1453,8 +1645,7 @@ def enhanced_weekly_workflow(
 
         # Step 1: Generate contrarian prompt
         console.print("📝 Step 1: Generating contrarian prompt...")
-        from .core import PoolDominationSystem
-        system = PoolDominationSystem()
+        system = _get_system()
         prompt_file = system.generate_contrarian_analysis_prompt_by_date(date)
         console.print(f"✅ Prompt saved to: {prompt_file}")
 
@@ -1500,9 +1691,7 @@ def comprehensive_csv(
 ):
     """Generate comprehensive CSV with all contrarian analysis metadata."""
     try:
-        from .excel_automation import ExcelAutomation
-
-        excel_automation = ExcelAutomation()
+        excel_automation = _get_excel()
 
         if analysis:
             console.print(f"📊 Generating comprehensive CSV from {analysis}")
@@ -1537,7 +1726,11 @@ def weekly_workflow(
 ):
     """🚀 COMPLETE WEEKLY WORKFLOW - Generate everything for the week in one command."""
     try:
-        from .report_generator import StrategyReportGenerator
+        from .excel_automation import weekly_filename
+        from .report_generator import preview_filename, report_filename
+
+        # Shared by every step below
+        system = _get_system()
 
         console.print(f"🚀 Starting COMPLETE WEEKLY WORKFLOW for Week {week} ({date})")
         console.print("=" * 80)
@@ -1545,17 +1738,13 @@ def weekly_workflow(
         # Step 1: Generate contrarian prompt
         console.print("\n📝 Step 1: Generating contrarian analysis prompt...")
         try:
-            from .core import PoolDominationSystem
-            system = PoolDominationSystem()
-
             # Generate contrarian prompt
             prompt_text = system.generate_contrarian_analysis_prompt_by_date(date)
 
             # Save prompt
-            os.makedirs("data/prompts", exist_ok=True)
-            prompt_file = f"data/prompts/{date}_contrarian_prompt.txt"
-            with open(prompt_file, "w") as f:
-                f.write(prompt_text)
+            _ensure_dir(os.path.abspath(_PROMPTS_DIR))
+            prompt_file = _contrarian_prompt_path(date)
+            prompt_file.write_bytes(prompt_text.encode("utf-8"))
 
             console.print(f"✅ Contrarian prompt saved: {prompt_file}")
             console.print("💡 Copy this prompt to ChatGPT/Claude/Gemini and get JSON response")
@@ -1568,7 +1757,13 @@ def weekly_workflow(
         if not analysis_file:
             analysis_file = f"data/json/week_{week}_complete_contrarian_analysis.json"
 
-        if not os.path.exists(analysis_file):
+        try:
+            analysis_data = read_json(analysis_file)
+        except ValueError as e:
+            # Malformed JSON: warn and carry on without the analysis
+            console.print(f"\n⚠️ Warning: Could not parse analysis file {analysis_file}: {e}")
+            analysis_data = {}
+        except FileNotFoundError:
             console.print(f"\n⚠️ Analysis file not found: {analysis_file}")
             console.print("📋 MANUAL STEP REQUIRED:")
             console.print("1. Copy the contrarian prompt from data/prompts/")
@@ -1580,115 +1775,133 @@ def weekly_workflow(
             # Generate standard picks as fallback
             if not skip_picks:
                 console.print("\n📊 Step 2: Generating standard picks...")
-                try:
-                    from .core import PoolDominationSystem
-                    system = PoolDominationSystem()
-
-                    # Generate picks
-                    picks = system.generate_optimal_picks(week)
-                    console.print("✅ Standard picks generated")
-
-                except Exception as e:
-                    console.print(f"⚠️ Warning: Could not generate standard picks: {e}")
+                picks_path = _PICKS_DIR / f"week_{week}_picks.json"
+                llm_data_path = Path(f"llm_data_week_{week}.json")
+                if _is_newer_than(picks_path, (_SCHEDULE_FILE, llm_data_path)):
+                    # Re-run while waiting for the analysis: keep the picks from last time
+                    console.print(f"✅ Standard picks already generated: {picks_path}")
+                else:
+                    try:
+                        # Generate picks and save them in the excel-update --picks-file format
+                        picks = system.generate_optimal_picks(week, system.load_llm_data(week))
+                        _ensure_dir(os.path.abspath(_PICKS_DIR))
+                        write_json(
+                            picks_path,
+                            {
+                                "week": week,
+                                "picks": [
+                                    {
+                                        "game": pick.game,
+                                        "team": pick.predicted_winner,
+                                        "confidence": pick.confidence_points,
+                                    }
+                                    for pick in picks
+                                ],
+                            },
+                            indent=True,
+                        )
+                        console.print(f"✅ Standard picks generated: {picks_path}")
+
+                    except Exception as e:
+                        console.print(f"⚠️ Warning: Could not generate standard picks: {e}")
 
             console.print("\n📋 WORKFLOW INCOMPLETE - Manual step required")
             console.print("💡 Run again after saving your analysis JSON file")
             return
 
-        # Step 3: Update Excel with analysis
-        console.print(f"\n📊 Step 2: Updating Excel with contrarian analysis...")
-        try:
-            from .excel_automation import ExcelAutomation
-            excel = ExcelAutomation()
-
-            # Update Excel with contrarian analysis
-            success = excel.update_picks(week, [], date)
-            if success:
-                console.print(f"✅ Excel file updated: data/excel/Dawgpac25_{date}.xlsx")
-            else:
-                console.print("⚠️ Warning: Excel update failed")
-
-        except Exception as e:
-            console.print(f"⚠️ Warning: Could not update Excel: {e}")
-
-        # Step 4: Generate strategy report
-        console.print(f"\n📋 Step 3: Generating strategy report...")
-        try:
-            generator = StrategyReportGenerator()
-
-            # Generate enhanced report
-            if use_llm and os.getenv("OPENROUTER_API_KEY"):
+        # Steps 3-5 only depend on the loaded analysis, so run them concurrently
+        # (the report generator is stateless, so the report and preview threads can share it)
+        generator = _get_report_generator()
+        # Read once by the system at startup (after loading .env)
+        openrouter_api_key = system.openrouter_api_key
+        use_llm_report = use_llm and openrouter_api_key
+        report_name = report_filename(week, date, enhanced=bool(use_llm_report))
+        preview_name = preview_filename(week, date)
+        excel_name = weekly_filename(week, date)
+
+        def update_excel() -> str:
+            """Step 3: Update Excel with contrarian analysis."""
+            if _get_excel().update_picks(week, [], date):
+                return f"✅ Excel file updated: data/excel/{excel_name}"
+            return "⚠️ Warning: Excel update failed"
+
+        def write_strategy_report() -> str:
+            """Step 4: Generate strategy report."""
+            if use_llm_report:
                 report_content = generator.generate_llm_enhanced_report(
                     week=week,
                     date=date,
                     analysis_file=analysis_file,
-                    openrouter_api_key=os.getenv("OPENROUTER_API_KEY")
+                    openrouter_api_key=openrouter_api_key,
+                    analysis_data=analysis_data
                 )
-                report_filename = f"Week_{week}_Enhanced_Strategy_Report_{date}.md"
             else:
                 report_content = generator._build_report_content(
                     week=week,
                     date=date,
-                    analysis_data=generator._load_analysis_data(analysis_file),
+                    analysis_data=analysis_data,
                     picks_data=None
                 )
-                report_filename = f"Week_{week}_Strategy_Report_{date}.md"
 
-            # Save report
-            report_path = Path("reports") / report_filename
+            report_path = Path("reports") / report_name
             report_path.parent.mkdir(exist_ok=True)
+            report_path.write_bytes(report_content.encode("utf-8"))
+            return f"✅ Strategy report generated: {report_path}"
 
-            with open(report_path, 'w') as f:
-                f.write(report_content)
-
-            console.print(f"✅ Strategy report generated: {report_path}")
-
-        except Exception as e:
-            console.print(f"⚠️ Warning: Could not generate strategy report: {e}")
-
-        # Step 5: Generate next week preview
-        console.print(f"\n🔍 Step 4: Generating next week preview...")
-        try:
-            next_week_date = (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
+        def write_next_week_preview() -> str:
+            """Step 5: Generate next week preview."""
             preview_content = generator.generate_next_week_preview(week, date)
 
-            preview_filename = f"Week_{week+1}_Preview_{next_week_date}.md"
-            preview_path = Path("reports") / preview_filename
+            preview_path = Path("reports") / preview_name
             preview_path.parent.mkdir(exist_ok=True)
+            preview_path.write_bytes(preview_content.encode("utf-8"))
+            return f"✅ Next week preview generated: {preview_path}"
+
+        # Step -> warning prefix if it raises
+        steps = {
+            update_excel: "Could not update Excel",
+            write_strategy_report: "Could not generate strategy report",
+            write_next_week_preview: "Could not generate next week preview",
+        }
 
-            with open(preview_path, 'w') as f:
-                f.write(preview_content)
-
-            console.print(f"✅ Next week preview generated: {preview_path}")
-
-        except Exception as e:
-            console.print(f"⚠️ Warning: Could not generate next week preview: {e}")
+        console.print(
+            "\n📊 Steps 3-5: Updating Excel, generating strategy report and next week preview..."
+        )
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = {executor.submit(step): failure for step, failure in steps.items()}
+            # Report each step as it finishes (the LLM report is usually last)
+            for future in as_completed(futures):
+                try:
+                    console.print(future.result())
+                except Exception as e:
+                    console.print(f"⚠️ Warning: {futures[future]}: {e}")
 
-        # Step 6: Summary
-        console.print("\n" + "=" * 80)
-        console.print("🎯 WEEKLY WORKFLOW COMPLETE!")
-        console.print("=" * 80)
+        # Step 6: Summary (buffered, rendered in one print)
+        console.writeln("\n" + "=" * 80)
+        console.writeln("🎯 WEEKLY WORKFLOW COMPLETE!")
+        console.writeln("=" * 80)
 
         # Show generated files
-        console.print("\n📁 Generated Files:")
-        console.print(f"  📝 Contrarian Prompt: data/prompts/{date}_contrarian_prompt.txt")
-        console.print(f"  📊 Excel File: data/excel/Dawgpac25_{date}.xlsx")
-        console.print(f"  📋 Strategy Report: reports/{report_filename}")
-        console.print(f"  🔍 Next Week Preview: reports/Week_{week+1}_Preview_{next_week_date}.md")
+        console.writeln("\n📁 Generated Files:")
+        console.writeln(f"  📝 Contrarian Prompt: {_contrarian_prompt_path(date)}")
+        console.writeln(f"  📊 Excel File: data/excel/{excel_name}")
+        console.writeln(f"  📋 Strategy Report: reports/{report_name}")
+        console.writeln(f"  🔍 Next Week Preview: reports/{preview_name}")
 
         # Show next steps
-        console.print("\n🚀 Next Steps:")
-        console.print("1. Review the strategy report for your picks")
-        console.print("2. Submit the Excel file to your pool")
-        console.print("3. Use the next week preview for future planning")
-        console.print("4. Track results and refine strategy")
+        console.writeln("\n🚀 Next Steps:")
+        console.writeln("1. Review the strategy report for your picks")
+        console.writeln("2. Submit the Excel file to your pool")
+        console.writeln("3. Use the next week preview for future planning")
+        console.writeln("4. Track results and refine strategy")
 
         # Show competitive edge
-        console.print("\n💰 Competitive Edge:")
-        console.print("✅ Contrarian analysis for differentiation")
-        console.print("✅ Value plays for maximum earnings")
-        console.print("✅ Risk management with confidence points")
-        console.print("✅ Future planning with next week insights")
+        console.writeln("\n💰 Competitive Edge:")
+        console.writeln("✅ Contrarian analysis for differentiation")
+        console.writeln("✅ Value plays for maximum earnings")
+        console.writeln("✅ Risk management with confidence points")
+        console.writeln("✅ Future planning with next week insights")
+        console.flush()
 
         logger.log_command_end("weekly_workflow", success=True)
 
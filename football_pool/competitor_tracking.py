@@ -5,55 +5,122 @@ This module provides competitor pick tracking and analysis
 to identify contrarian opportunities and avoid common picks.
 """
 
-import json
+import atexit
 import logging
+import weakref
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from .json_utils import read_json, write_json
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Returned for weeks without tracked picks; read-only so it can be shared between calls
+_DEFAULT_ANALYSIS: Mapping[str, Any] = MappingProxyType({
+    "total_competitors": 0,
+    "common_picks": (),
+    "contrarian_opportunities": (),
+    "avoid_picks": (),
+    "competitor_patterns": MappingProxyType({
+        "favorite_pickers": (),
+        "underdog_pickers": (),
+        "high_confidence_pickers": (),
+        "low_confidence_pickers": ()
+    })
+})
+
+
+@dataclass(frozen=True, slots=True)
+class TrackedPick:
+    """A single tracked competitor pick."""
+
+    game: str
+    team: str
+    confidence: int
+    timestamp: str
+
+
+# Trackers that may hold unsaved picks; one exit hook flushes whichever are still alive
+_LIVE_TRACKERS: "weakref.WeakSet[CompetitorTracker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_trackers() -> None:
+    for tracker in list(_LIVE_TRACKERS):
+        tracker.flush()
+
 
 class CompetitorTracker:
     """Tracks competitor picks and identifies contrarian opportunities."""
 
     def __init__(self):
         """Initialize competitor tracker."""
-        self.data_dir = Path("data/competitors")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        # Absolute, so the atexit flush writes here even if the cwd has changed
+        self.data_dir = Path("data/competitors").absolute()
+        # Created on first write; reads of a missing directory just find no data
+        self._dir_ready = False
         self.tracking_file = self.data_dir / "competitor_picks.json"
+        # Parsed tracking data, reused until the file's (mtime, size) changes
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_stamp: Optional[Tuple[int, int]] = None
+        # Tracked picks not yet written; flush() (or leaving a with-block) saves them
+        self._dirty = False
+        # Shared timestamp for picks tracked inside a with-block
+        self._batch_timestamp: Optional[str] = None
+        _LIVE_TRACKERS.add(self)
+
+    def __del__(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "CompetitorTracker":
+        self._batch_timestamp = datetime.now().isoformat()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._batch_timestamp = None
+        self.flush()
+
+    def close(self) -> None:
+        """Save pending picks and drop the tracker from the exit-time flush."""
+        self.flush()
+        _LIVE_TRACKERS.discard(self)
+
+    def flush(self) -> None:
+        """Write tracked picks to disk if any are pending."""
+        if self._dirty and self._save_tracking_data(self._cache):
+            self._dirty = False
 
     def track_competitor_pick(self, competitor: str, week: int, game: str,
-                            team: str, confidence: int) -> None:
-        """Track a competitor's pick."""
+                            team: str, confidence: int, timestamp: Optional[str] = None) -> None:
+        """Track a competitor's pick (written on the next flush).
+
+        Without an explicit timestamp, picks tracked inside ``with tracker:`` share
+        the time the block was entered; otherwise the current time is used.
+        """
         try:
             # Load existing data
             data = self._load_tracking_data()
 
             # Add new pick
-            if week not in data:
-                data[week] = {}
-
-            if competitor not in data[week]:
-                data[week][competitor] = []
-
-            pick = {
-                "game": game,
-                "team": team,
-                "confidence": confidence,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            data[week][competitor].append(pick)
+            week_data = data.setdefault(week, {})
+            week_data.setdefault(competitor, [])
 
-            # Save updated data
-            self._save_tracking_data(data)
+            timestamp = timestamp or self._batch_timestamp or datetime.now().isoformat()
+            week_data[competitor].append(TrackedPick(game, team, confidence, timestamp))
+            self._dirty = True
             logger.info(f"Tracked pick for {competitor}: {team} in {game}")
 
         except Exception as e:
             logger.error(f"Error tracking competitor pick: {e}")
 
-    def get_competitor_analysis(self, week: int) -> Dict[str, Any]:
+    def get_competitor_analysis(self, week: int) -> Mapping[str, Any]:
         """Get competitor analysis for a specific week."""
         try:
             data = self._load_tracking_data()
@@ -62,13 +129,14 @@ class CompetitorTracker:
                 return self._get_default_analysis()
 
             week_data = data[week]
+            pick_counts, game_counts = self._aggregate_week(week_data)
 
             # Analyze competitor picks
             analysis = {
                 "total_competitors": len(week_data),
-                "common_picks": self._find_common_picks(week_data),
-                "contrarian_opportunities": self._find_contrarian_opportunities(week_data),
-                "avoid_picks": self._find_avoid_picks(week_data),
+                "common_picks": self._find_common_picks(pick_counts),
+                "contrarian_opportunities": self._find_contrarian_opportunities(game_counts),
+                "avoid_picks": self._find_avoid_picks(pick_counts, len(week_data)),
                 "competitor_patterns": self._analyze_competitor_patterns(week_data)
             }
 
@@ -78,24 +146,37 @@ class CompetitorTracker:
             logger.error(f"Error getting competitor analysis: {e}")
             return self._get_default_analysis()
 
-    def _find_common_picks(self, week_data: Dict[str, List[Dict]]) -> List[Dict[str, Any]]:
-        """Find picks that multiple competitors are making."""
-        pick_counts = {}
+    def _aggregate_week(
+        self, week_data: Dict[str, List[TrackedPick]]
+    ) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[str, Counter]]:
+        """Count picks per (game, team) and per game in a single pass over the week."""
+        pick_counts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        game_counts: Dict[str, Counter] = defaultdict(Counter)
 
         for competitor, picks in week_data.items():
             for pick in picks:
-                key = f"{pick['game']}_{pick['team']}"
-                if key not in pick_counts:
-                    pick_counts[key] = {
-                        "game": pick["game"],
-                        "team": pick["team"],
+                game = pick.game
+                team = pick.team
+
+                entry = pick_counts.get((game, team))
+                if entry is None:
+                    entry = pick_counts[game, team] = {
+                        "game": game,
+                        "team": team,
                         "count": 0,
                         "competitors": []
                     }
+                entry["count"] += 1
+                entry["competitors"].append(competitor)
+
+                game_counts[game][team] += 1
 
-                pick_counts[key]["count"] += 1
-                pick_counts[key]["competitors"].append(competitor)
+        return pick_counts, game_counts
 
+    def _find_common_picks(
+        self, pick_counts: Dict[Tuple[str, str], Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Find picks that multiple competitors are making."""
         # Return picks with 2+ competitors
         common_picks = [
             pick for pick in pick_counts.values()
@@ -104,69 +185,44 @@ class CompetitorTracker:
 
         return sorted(common_picks, key=lambda x: x["count"], reverse=True)
 
-    def _find_contrarian_opportunities(self, week_data: Dict[str, List[Dict]]) -> List[Dict[str, Any]]:
+    def _find_contrarian_opportunities(
+        self, game_counts: Dict[str, Counter]
+    ) -> List[Dict[str, Any]]:
         """Find games where competitors are heavily on one side."""
-        game_analysis = {}
-
-        for competitor, picks in week_data.items():
-            for pick in picks:
-                game = pick["game"]
-                team = pick["team"]
-
-                if game not in game_analysis:
-                    game_analysis[game] = {"teams": {}, "total_picks": 0}
-
-                if team not in game_analysis[game]["teams"]:
-                    game_analysis[game]["teams"][team] = 0
-
-                game_analysis[game]["teams"][team] += 1
-                game_analysis[game]["total_picks"] += 1
-
-        # Find games with heavy bias
         contrarian_opportunities = []
 
-        for game, analysis in game_analysis.items():
-            if analysis["total_picks"] >= 3:  # Need at least 3 picks to analyze
-                teams = list(analysis["teams"].items())
-                teams.sort(key=lambda x: x[1], reverse=True)
+        for game, team_counts in game_counts.items():
+            total_picks = team_counts.total()
+            if total_picks >= 3 and len(team_counts) >= 2:  # Need at least 3 picks to analyze
+                top_team, second_team = team_counts.most_common(2)
 
-                if len(teams) >= 2:
-                    top_team = teams[0]
-                    second_team = teams[1]
+                # If top team has 70%+ of picks, other side is contrarian
+                top_percentage = top_team[1] / total_picks
 
-                    # If top team has 70%+ of picks, other side is contrarian
-                    top_percentage = top_team[1] / analysis["total_picks"]
-
-                    if top_percentage >= 0.7:
-                        contrarian_opportunities.append({
-                            "game": game,
-                            "public_team": top_team[0],
-                            "contrarian_team": second_team[0],
-                            "public_percentage": round(top_percentage * 100, 1),
-                            "contrarian_percentage": round((1 - top_percentage) * 100, 1)
-                        })
+                if top_percentage >= 0.7:
+                    contrarian_opportunities.append({
+                        "game": game,
+                        "public_team": top_team[0],
+                        "contrarian_team": second_team[0],
+                        "public_percentage": round(top_percentage * 100, 1),
+                        "contrarian_percentage": round((1 - top_percentage) * 100, 1)
+                    })
 
         return contrarian_opportunities
 
-    def _find_avoid_picks(self, week_data: Dict[str, List[Dict]]) -> List[str]:
+    def _find_avoid_picks(
+        self, pick_counts: Dict[Tuple[str, str], Dict[str, Any]], total_competitors: int
+    ) -> List[str]:
         """Find picks to avoid (too many competitors on them)."""
-        pick_counts = {}
-
-        for competitor, picks in week_data.items():
-            for pick in picks:
-                key = f"{pick['game']}_{pick['team']}"
-                pick_counts[key] = pick_counts.get(key, 0) + 1
-
         # Avoid picks with 50%+ of competitors
-        total_competitors = len(week_data)
-        avoid_picks = [
-            pick for pick, count in pick_counts.items()
-            if count >= total_competitors * 0.5
+        return [
+            f"{game}_{team}" for (game, team), pick in pick_counts.items()
+            if pick["count"] >= total_competitors * 0.5
         ]
 
-        return avoid_picks
-
-    def _analyze_competitor_patterns(self, week_data: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    def _analyze_competitor_patterns(
+        self, week_data: Dict[str, List[TrackedPick]]
+    ) -> Dict[str, Any]:
         """Analyze competitor picking patterns."""
         patterns = {
             "favorite_pickers": [],
@@ -179,8 +235,16 @@ class CompetitorTracker:
             if not picks:
                 continue
 
-            # Analyze picking patterns
-            avg_confidence = sum(pick["confidence"] for pick in picks) / len(picks)
+            # Analyze picking patterns in one pass over the competitor's picks
+            total_confidence = favorite_picks = underdog_picks = 0
+            for pick in picks:
+                confidence = pick.confidence
+                total_confidence += confidence
+                if confidence >= 15:
+                    favorite_picks += 1
+                elif confidence <= 10:
+                    underdog_picks += 1
+            avg_confidence = total_confidence / len(picks)
 
             # Categorize competitors
             if avg_confidence >= 15:
@@ -189,9 +253,6 @@ class CompetitorTracker:
                 patterns["low_confidence_pickers"].append(competitor)
 
             # Analyze favorite vs underdog tendencies
-            favorite_picks = sum(1 for pick in picks if pick["confidence"] >= 15)
-            underdog_picks = sum(1 for pick in picks if pick["confidence"] <= 10)
-
             if favorite_picks > underdog_picks:
                 patterns["favorite_pickers"].append(competitor)
             elif underdog_picks > favorite_picks:
@@ -199,58 +260,119 @@ class CompetitorTracker:
 
         return patterns
 
+    def get_pick_matrix(
+        self, week: int
+    ) -> Tuple[List[str], List[str], "np.ndarray", "np.ndarray"]:
+        """Get competitor picks for a week as (competitors, games, sides, confidence).
+
+        ``sides`` and ``confidence`` are (n_competitors, n_games) int8 arrays.
+        Sides are +1 for the home team, -1 for the away team and 0 for no pick.
+        """
+        import numpy as np
+
+        data = self._load_tracking_data()
+        week_data = data.get(week, {})
+
+        competitors = list(week_data)
+        games = sorted({pick.game for picks in week_data.values() for pick in picks})
+        game_index = {game: i for i, game in enumerate(games)}
+
+        sides = np.zeros((len(competitors), len(games)), dtype=np.int8)
+        confidence = np.zeros_like(sides)
+        for row, competitor in enumerate(competitors):
+            for pick in week_data[competitor]:
+                col = game_index[pick.game]
+                home = pick.game.split("@")[-1]
+                sides[row, col] = 1 if pick.team == home else -1
+                confidence[row, col] = pick.confidence
+
+        return competitors, games, sides, confidence
+
     def _load_tracking_data(self) -> Dict[str, Any]:
-        """Load competitor tracking data."""
-        if not self.tracking_file.exists():
-            return {}
+        """Load competitor tracking data as {week: {competitor: [TrackedPick]}}.
+
+        JSON object keys are strings, so weeks are converted back to ints here.
+        """
+        # Unsaved picks take precedence over the file
+        if self._dirty:
+            return self._cache
 
         try:
-            with open(self.tracking_file) as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading tracking data: {e}")
-            return {}
+            stamp = self._file_stamp()
+        except FileNotFoundError:
+            stamp = None
+
+        if self._cache is not None and stamp == self._cache_stamp:
+            return self._cache
+
+        data = {}
+        if stamp is not None:
+            try:
+                data = {
+                    int(week): {
+                        competitor: [TrackedPick(**pick) for pick in picks]
+                        for competitor, picks in week_data.items()
+                    }
+                    for week, week_data in read_json(self.tracking_file).items()
+                }
+            except Exception as e:
+                logger.error(f"Error loading tracking data: {e}")
+
+        self._cache, self._cache_stamp = data, stamp
+        return data
 
-    def _save_tracking_data(self, data: Dict[str, Any]) -> None:
+    def _save_tracking_data(self, data: Dict[str, Any]) -> bool:
         """Save competitor tracking data."""
         try:
-            with open(self.tracking_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Write then swap in, so a crash mid-write never leaves a truncated file
+            self._ensure_dir()
+            tmp_path = self.tracking_file.with_suffix(".json.tmp")
+            write_json(tmp_path, data, indent=True, default=asdict)
+            tmp_path.replace(self.tracking_file)
+            self._cache, self._cache_stamp = data, self._file_stamp()
+            return True
         except Exception as e:
             logger.error(f"Error saving tracking data: {e}")
+            return False
 
-    def _get_default_analysis(self) -> Dict[str, Any]:
-        """Get default analysis when no data is available."""
-        return {
-            "total_competitors": 0,
-            "common_picks": [],
-            "contrarian_opportunities": [],
-            "avoid_picks": [],
-            "competitor_patterns": {
-                "favorite_pickers": [],
-                "underdog_pickers": [],
-                "high_confidence_pickers": [],
-                "low_confidence_pickers": []
-            }
-        }
+    def _ensure_dir(self) -> None:
+        """Create the data directory before the first write."""
+        if not self._dir_ready:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        """(mtime in ns, size) of the tracking file, used to validate the cache."""
+        stat = self.tracking_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_default_analysis(self) -> Mapping[str, Any]:
+        """Get default analysis when no data is available (shared, read-only)."""
+        return _DEFAULT_ANALYSIS
 
     def get_contrarian_recommendations(self, week: int, games: List[str]) -> List[Dict[str, Any]]:
         """Get contrarian recommendations based on competitor analysis."""
         analysis = self.get_competitor_analysis(week)
 
+        # At most one opportunity per game
+        opportunities = {
+            opportunity["game"]: opportunity
+            for opportunity in analysis["contrarian_opportunities"]
+        }
+
         recommendations = []
 
         for game in games:
             # Check if this game has contrarian opportunities
-            for opportunity in analysis["contrarian_opportunities"]:
-                if opportunity["game"] == game:
-                    recommendations.append({
-                        "game": game,
-                        "recommended_team": opportunity["contrarian_team"],
-                        "avoid_team": opportunity["public_team"],
-                        "reasoning": f"Only {opportunity['contrarian_percentage']}% of competitors on {opportunity['contrarian_team']}",
-                        "contrarian_edge": "High - Different from crowd"
-                    })
+            opportunity = opportunities.get(game)
+            if opportunity:
+                recommendations.append({
+                    "game": game,
+                    "recommended_team": opportunity["contrarian_team"],
+                    "avoid_team": opportunity["public_team"],
+                    "reasoning": f"Only {opportunity['contrarian_percentage']}% of competitors on {opportunity['contrarian_team']}",
+                    "contrarian_edge": "High - Different from crowd"
+                })
 
         return recommendations
 
@@ -272,9 +394,9 @@ class CompetitorTracker:
                 "analysis": analysis
             }
 
+            self._ensure_dir()
             export_file = self.data_dir / f"week_{week}_export.json"
-            with open(export_file, "w") as f:
-                json.dump(export_data, f, indent=2)
+            write_json(export_file, export_data, indent=True, default=asdict)
 
             return str(export_file)
 
@@ -3,10 +3,15 @@ Enhanced LLM prompts for contrarian analysis and optimal strategy implementation
 """
 
 
+def _games_list(games: list) -> str:
+    """Format games as a markdown bullet list."""
+    return "- " + "\n- ".join(games) if games else ""
+
+
 def generate_contrarian_analysis_prompt(date: str, games: list) -> str:
     """Generate enhanced prompt for contrarian analysis and optimal strategy."""
 
-    games_list = "\n".join([f"- {game}" for game in games])
+    games_list = _games_list(games)
 
     prompt = f"""# {date} CONTRARIAN FOOTBALL POOL ANALYSIS
 **GOAL**: Identify contrarian opportunities and value plays for optimal pool strategy
@@ -180,7 +185,7 @@ Please provide your contrarian analysis in the exact JSON format above."""
 def generate_enhanced_llm_prompt(date: str, games: list) -> str:
     """Generate enhanced LLM prompt with contrarian focus."""
 
-    games_list = "\n".join([f"- {game}" for game in games])
+    games_list = _games_list(games)
 
     prompt = f"""# {date} ENHANCED FOOTBALL POOL ANALYSIS
 **STRATEGY**: Contrarian analysis for optimal pool performance
@@ -5,16 +5,25 @@ This module contains the main PoolDominationSystem class that orchestrates
 all functionality for the football pool system.
 """
 
+import asyncio
+import atexit
 import json
 import logging
 import os
-import random
+import re
+import threading
+import time
+import weakref
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .database import DatabaseManager
 from .logging_config import logger as app_logger
@@ -23,20 +32,100 @@ from .web_search import FootballWebSearch
 from .weather_data import WeatherDataProvider
 from .injury_data import InjuryDataProvider
 from .competitor_tracking import CompetitorTracker
+from .json_utils import read_json, read_jsonl, write_json, write_jsonl
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Parsed schedule workbook, reused while the workbook's (mtime, size) is unchanged
+_SCHEDULE_CACHE = Path("cache_schedule.json")
+
+# Schedule cells that are headers, week references or dates rather than games
+# ("/" also covers the 11/, 12/ and 1/ date prefixes)
+_NON_GAME_CELL = re.compile(r"Week|Champ|TBD|ARMY@NAVY|/|2025-2026")
+
+# Submitted OpenAI batches waiting to be collected, one week_{week}.json per week
+_LLM_BATCH_DIR = Path("data/llm_batches")
+
+# Batch statuses after which there is nothing more to collect
+_FINISHED_BATCH_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+# Team power ratings (example - should be updated with real data)
+_TEAM_POWER_RATINGS = {
+    "KC": 95,
+    "BALT": 92,
+    "SF": 91,
+    "BUF": 90,
+    "DAL": 89,
+    "PHIL": 88,
+    "MIA": 87,
+    "DET": 86,
+    "HOU": 84,
+    "LAR": 82,
+    "SEA": 81,
+    "TB": 80,
+    "IND": 79,
+    "CINC": 78,
+    "PITT": 77,
+    "LV": 76,
+    "NO": 75,
+    "ATL": 74,
+    "CHI": 73,
+    "NYG": 72,
+    "WASH": 71,
+    "CAR": 70,
+    "DEN": 69,
+    "NYJ": 68,
+    "TENN": 67,
+    "JAC": 66,
+    "LAC": 65,
+    "MINN": 64,
+    "ARIZ": 63,
+    "NE": 62,
+    "CLEV": 61,
+    "GB": 60,
+}
+
+
+# Usage trackers that may hold unsaved counts; one exit hook flushes whichever are still alive
+_LIVE_USAGE_TRACKERS: "weakref.WeakSet[APIUsageTracker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_usage_trackers() -> None:
+    for tracker in list(_LIVE_USAGE_TRACKERS):
+        tracker.flush()
+
 
 class APIUsageTracker:
     """Track API usage to stay within monthly limits."""
 
     def __init__(self):
-        self.usage_file = Path("api_usage.json")
+        # Absolute, so the atexit flush writes here even if the cwd has changed
+        self.usage_file = Path("api_usage.json").absolute()
         self.monthly_limits = {
             "odds_api": 500,
             "openrouter": 1000,  # Assuming higher limit for OpenRouter
         }
         self.usage_data = self._load_usage_data()
+        # Recorded requests are written in batches (and at exit)
+        self._unsaved_requests = 0
+        self._flush_every = 20
+        # Requests are recorded from worker threads (see acall_openrouter_api)
+        self._lock = threading.RLock()
+        _LIVE_USAGE_TRACKERS.add(self)
+
+    def __del__(self):
+        self.flush()
+
+    def flush(self):
+        """Write recorded requests to disk if any are pending."""
+        with self._lock:
+            if self._unsaved_requests:
+                self._save_usage_data()
 
     def _load_usage_data(self) -> dict[str, Any]:
         """Load usage data from file."""
@@ -47,8 +136,7 @@ class APIUsageTracker:
             }
 
         try:
-            with open(self.usage_file) as f:
-                return json.load(f)
+            return read_json(self.usage_file)
         except Exception as e:
             logger.error(f"Error loading usage data: {e}")
             return {
@@ -59,8 +147,15 @@ class APIUsageTracker:
     def _save_usage_data(self):
         """Save usage data to file."""
         try:
-            with open(self.usage_file, "w") as f:
-                json.dump(self.usage_data, f, indent=2)
+            # Write then swap in, so a crash mid-write never leaves a truncated file; the tmp
+            # name is unique per process and thread so concurrent writers never share it
+            tmp_path = self.usage_file.with_name(
+                f"{self.usage_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with self._lock:
+                write_json(tmp_path, self.usage_data, indent=True)
+                tmp_path.replace(self.usage_file)
+                self._unsaved_requests = 0
         except Exception as e:
             logger.error(f"Error saving usage data: {e}")
 
@@ -80,24 +175,34 @@ class APIUsageTracker:
         if api_name not in self.usage_data:
             return True
 
-        self._check_month_reset(api_name)
-        api_data = self.usage_data[api_name]
-        limit = self.monthly_limits.get(api_name, 1000)
+        with self._lock:
+            self._check_month_reset(api_name)
+            api_data = self.usage_data[api_name]
+            limit = self.monthly_limits.get(api_name, 1000)
 
-        return api_data["requests_used"] < limit
+            return api_data["requests_used"] < limit
 
     def record_request(self, api_name: str, success: bool = True):
         """Record an API request."""
-        if api_name not in self.usage_data:
-            self.usage_data[api_name] = {
-                "current_month": None,
-                "requests_used": 0,
-                "last_reset": None,
-            }
+        with self._lock:
+            if api_name not in self.usage_data:
+                self.usage_data[api_name] = {
+                    "current_month": None,
+                    "requests_used": 0,
+                    "last_reset": None,
+                }
 
-        self._check_month_reset(api_name)
-        self.usage_data[api_name]["requests_used"] += 1
-        self._save_usage_data()
+            self._check_month_reset(api_name)
+            warning_level = self.get_warning_level(api_name)
+            self.usage_data[api_name]["requests_used"] += 1
+            self._unsaved_requests += 1
+
+            # Save right away when usage crosses into a new warning level
+            if (
+                self._unsaved_requests >= self._flush_every
+                or self.get_warning_level(api_name) != warning_level
+            ):
+                self._save_usage_data()
 
         if success:
             logger.info(
@@ -142,6 +247,39 @@ class APIUsageTracker:
             return "safe"
 
 
+def _scaled_confidence(rating_diff: float, slope: float, cap: float) -> float:
+    """Confidence that grows linearly from 50 with the rating gap, capped at 50 + cap."""
+    return 50 + min(cap, abs(rating_diff) * slope)
+
+
+class TokenBucket:
+    """Client-side rate limiter: `rate` requests per `per` seconds, bursting up to `burst`."""
+
+    def __init__(self, rate: float, per: float = 60.0, burst: int = 3):
+        """Start with a full bucket."""
+        self.fill_rate = rate / per
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            # Waiters queue on the lock, so each sleeps for exactly one token
+            wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+            self._tokens = 0.0
+            self._updated = now + wait
+
+
 class PoolDominationSystem:
     """
     Complete system for dominating your football confidence pool.
@@ -174,13 +312,32 @@ class PoolDominationSystem:
         # API Keys
         self.odds_api_key = os.getenv("THE_ODDS_API_KEY")
         self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
+        self.openai_api_key = os.getenv("OPENAI_API_KEY")
 
         # API Configuration
         self.odds_api_base = "https://api.the-odds-api.com/v4"
         self.openrouter_api_base = "https://openrouter.ai/api/v1"
+        self.openai_api_base = "https://api.openai.com/v1"
+        self.batch_model = "gpt-4o-mini"
+
+        # Pooled keep-alive connections shared by every API call. urllib3 retries 429/5xx
+        # only for idempotent methods; OpenRouter POSTs are retried by _post_with_retry
+        # alone, so that prefix gets an adapter without retries of its own.
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+            ),
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        self._http.mount(self.openrouter_api_base, HTTPAdapter(pool_maxsize=4, max_retries=0))
 
         # API Usage Tracking
         self.usage_tracker = APIUsageTracker()
+        self._odds_bucket = TokenBucket(rate=10, per=60, burst=3)
 
         # Web Search Integration
         self.web_search = FootballWebSearch(os.getenv("SMITHERY_API_KEY"))
@@ -205,58 +362,36 @@ class PoolDominationSystem:
             "maximum_variance": -150,  # Behind by 150+ points
         }
 
-        # Team power ratings (example - should be updated with real data)
-        self.team_power_ratings = {
-            "KC": 95,
-            "BALT": 92,
-            "SF": 91,
-            "BUF": 90,
-            "DAL": 89,
-            "PHIL": 88,
-            "MIA": 87,
-            "DET": 86,
-            "CLEV": 85,
-            "HOU": 84,
-            "GB": 83,
-            "LAR": 82,
-            "SEA": 81,
-            "TB": 80,
-            "IND": 79,
-            "CINC": 78,
-            "PITT": 77,
-            "LV": 76,
-            "NO": 75,
-            "ATL": 74,
-            "CHI": 73,
-            "NYG": 72,
-            "WASH": 71,
-            "CAR": 70,
-            "DEN": 69,
-            "NYJ": 68,
-            "TENN": 67,
-            "JAC": 66,
-            "LAC": 65,
-            "MINN": 64,
-            "ARIZ": 63,
-            "NE": 62,
-            "CLEV": 61,
-            "GB": 60,
-        }
+        # Team power ratings (copied so per-instance tweaks don't leak)
+        self.team_power_ratings = dict(_TEAM_POWER_RATINGS)
 
         # Schedule data
         self.schedule = self._load_schedule()
 
+    @cached_property
+    def _rng(self) -> "np.random.Generator":
+        """Random source for the variance strategies (assign a seeded one for reproducible picks)."""
+        # numpy is only needed by the variance strategies; keep it off the CLI import path
+        import numpy as np
+
+        return np.random.default_rng()
+
     def _load_schedule(self) -> dict[int, dict[str, Any]]:
         """Load the complete season schedule from the Excel file."""
         try:
-            import os
-
-            import pandas as pd
-
             # Try to load from the Excel file
             excel_file = "2025-2026 Football Schedule.xlsx"
             if os.path.exists(excel_file):
-                df = pd.read_excel(excel_file, header=None)
+                stat = os.stat(excel_file)
+                stamp = [stat.st_mtime_ns, stat.st_size]
+                schedule = self._read_schedule_cache(stamp)
+                if schedule is not None:
+                    return schedule
+
+                import pandas as pd
+
+                # Plain object array: cell reads below skip pandas indexing
+                cells = pd.read_excel(excel_file, header=None).to_numpy(dtype=object)
 
                 schedule = {}
 
@@ -265,36 +400,22 @@ class PoolDominationSystem:
                     week_num = col + 1
 
                     # Get date range (row 2)
-                    date_range = df.iloc[2, col]
+                    date_range = cells[2, col]
                     if pd.notna(date_range):
                         # Get games for this week (rows 3 onwards)
                         games = []
-                        for row in range(3, len(df)):
-                            game = df.iloc[row, col]
-                            if pd.notna(game) and str(game).strip() and str(game).strip() != "BYE":
+                        for game in cells[3:, col]:
+                            if pd.notna(game):
                                 game_str = str(game).strip()
-                                # Skip header rows, week references, dates, and mixed data
-                                if not any(
-                                    x in game_str
-                                    for x in [
-                                        "Week",
-                                        "Champ",
-                                        "TBD",
-                                        "ARMY@NAVY",
-                                        "/",
-                                        "2025-2026",
-                                        "11/",
-                                        "12/",
-                                        "1/",
-                                    ]
-                                ):
-                                    # Only include games with @ symbol (actual games)
-                                    if "@" in game_str:
-                                        games.append(game_str)
+                                # Skip header rows, week references, dates, and mixed data;
+                                # only include games with @ symbol (actual games, never BYE)
+                                if "@" in game_str and not _NON_GAME_CELL.search(game_str):
+                                    games.append(game_str)
 
                         if games:
                             schedule[week_num] = {"dates": str(date_range), "games": games}
 
+                self._write_schedule_cache(stamp, schedule)
                 return schedule
             else:
                 logger.warning(f"Excel file {excel_file} not found, using default schedule")
@@ -304,6 +425,25 @@ class PoolDominationSystem:
             logger.error(f"Error loading schedule from Excel: {e}")
             return self._get_default_schedule()
 
+    def _read_schedule_cache(self, stamp: list[int]) -> Optional[dict[int, dict[str, Any]]]:
+        """Get the cached schedule if it was parsed from the current workbook."""
+        try:
+            cached = read_json(_SCHEDULE_CACHE)
+        except (OSError, ValueError):
+            return None
+
+        if cached.get("stamp") != stamp:
+            return None
+        # JSON object keys are strings; weeks are ints everywhere else
+        return {int(week): data for week, data in cached["schedule"].items()}
+
+    def _write_schedule_cache(self, stamp: list[int], schedule: dict[int, dict[str, Any]]) -> None:
+        """Cache a schedule parsed from the workbook."""
+        try:
+            write_json(_SCHEDULE_CACHE, {"stamp": stamp, "schedule": schedule})
+        except OSError as e:
+            logger.warning(f"Could not cache schedule: {e}")
+
     def _get_default_schedule(self) -> dict[int, dict[str, Any]]:
         """Get default schedule as fallback."""
         return {
@@ -388,6 +528,10 @@ class PoolDominationSystem:
         else:
             picks = self._generate_balanced_picks(week, week_games, llm_data)
 
+        # Fold in batched LLM picks (one response covering every matchup)
+        if llm_data and llm_data.get("picks"):
+            picks = self._apply_llm_picks(picks, llm_data["picks"])
+
         # Apply Fibonacci point assignment
         picks = self._apply_fibonacci_assignment(picks)
 
@@ -412,43 +556,45 @@ class PoolDominationSystem:
         else:
             return "maximum_variance"
 
-    def _generate_protective_picks(
-        self, week: int, games: list[str], llm_data: Optional[dict]
-    ) -> list[Pick]:
-        """Generate conservative picks to protect a lead."""
-        picks = []
+    def _rated_matchups(self, games: Iterable[str]) -> Iterator[tuple[str, str, str, int, int]]:
+        """Yield (game, away, home, away_rating, home_rating) for each matchup.
 
+        Unknown teams rate 50, and the home rating includes home field advantage (+3).
+        """
+        rating = self.team_power_ratings.get
         for game in games:
             if "@" in game:
                 away, home = game.split("@")
+                yield game, away, home, rating(away, 50), rating(home, 50) + 3
 
-                # Use power ratings and spreads for conservative picks
-                away_rating = self.team_power_ratings.get(away, 50)
-                home_rating = self.team_power_ratings.get(home, 50)
-
-                # Home field advantage
-                home_rating += 3
-
-                # Determine favorite
-                if home_rating > away_rating + 5:
-                    predicted_winner = home
-                    confidence = min(85, 50 + (home_rating - away_rating) * 2)
-                elif away_rating > home_rating + 5:
-                    predicted_winner = away
-                    confidence = min(85, 50 + (away_rating - home_rating) * 2)
-                else:
-                    # Skip close games in protective mode
-                    continue
+    def _generate_protective_picks(
+        self, week: int, games: list[str], llm_data: Optional[dict]
+    ) -> list[Pick]:
+        """Generate conservative picks to protect a lead."""
+        picks = []
 
-                pick = Pick(
-                    game=game,
-                    predicted_winner=predicted_winner,
-                    confidence_points=1,  # Will be assigned later
-                    conf=confidence,
-                    spread=home_rating - away_rating,
-                    public_pct=50,  # Default, should be updated with real data
-                )
-                picks.append(pick)
+        # Use power ratings and spreads for conservative picks
+        for game, away, home, away_rating, home_rating in self._rated_matchups(games):
+            # Determine favorite
+            rating_diff = home_rating - away_rating
+            if rating_diff > 5:
+                predicted_winner = home
+            elif rating_diff < -5:
+                predicted_winner = away
+            else:
+                # Skip close games in protective mode
+                continue
+            confidence = _scaled_confidence(rating_diff, 2, 35)
+
+            pick = Pick(
+                game=game,
+                predicted_winner=predicted_winner,
+                confidence_points=1,  # Will be assigned later
+                conf=confidence,
+                spread=home_rating - away_rating,
+                public_pct=50,  # Default, should be updated with real data
+            )
+            picks.append(pick)
 
         return picks[:20]  # Limit to 20 picks
 
@@ -458,34 +604,26 @@ class PoolDominationSystem:
         """Generate balanced picks with moderate risk."""
         picks = []
 
-        for game in games:
-            if "@" in game:
-                away, home = game.split("@")
-
-                # Use power ratings
-                away_rating = self.team_power_ratings.get(away, 50)
-                home_rating = self.team_power_ratings.get(home, 50)
-                home_rating += 3  # Home field advantage
-
-                # Calculate confidence
-                rating_diff = abs(home_rating - away_rating)
-                confidence = 50 + min(35, rating_diff * 1.5)
-
-                # Determine winner
-                if home_rating > away_rating:
-                    predicted_winner = home
-                else:
-                    predicted_winner = away
+        # Use power ratings
+        for game, away, home, away_rating, home_rating in self._rated_matchups(games):
+            # Calculate confidence
+            confidence = _scaled_confidence(home_rating - away_rating, 1.5, 35)
 
-                pick = Pick(
-                    game=game,
-                    predicted_winner=predicted_winner,
-                    confidence_points=1,
-                    conf=confidence,
-                    spread=home_rating - away_rating,
-                    public_pct=50,
-                )
-                picks.append(pick)
+            # Determine winner
+            if home_rating > away_rating:
+                predicted_winner = home
+            else:
+                predicted_winner = away
+
+            pick = Pick(
+                game=game,
+                predicted_winner=predicted_winner,
+                confidence_points=1,
+                conf=confidence,
+                spread=home_rating - away_rating,
+                public_pct=50,
+            )
+            picks.append(pick)
 
         return picks[:20]
 
@@ -495,45 +633,42 @@ class PoolDominationSystem:
         """Generate picks with higher variance for catching up."""
         picks = []
 
-        for game in games:
-            if "@" in game:
-                away, home = game.split("@")
+        # Use power ratings but add more variance, drawing every game's randomness at once
+        matchups = list(self._rated_matchups(games))
+        variances = self._rng.uniform(-10, 10, len(matchups)).tolist()
+        pick_underdogs = (self._rng.random(len(matchups)) < 0.3).tolist()  # 30% underdog chance
 
-                # Use power ratings but add more variance
-                away_rating = self.team_power_ratings.get(away, 50)
-                home_rating = self.team_power_ratings.get(home, 50)
-                home_rating += 3
-
-                # Add random variance for underdog picks
-                variance = random.uniform(-10, 10)
-                away_rating += variance
-                home_rating += variance
-
-                # Calculate confidence with more risk
-                rating_diff = abs(home_rating - away_rating)
-                confidence = 50 + min(40, rating_diff * 1.2)
-
-                # Sometimes pick the underdog
-                if random.random() < 0.3:  # 30% chance to pick underdog
-                    if home_rating > away_rating:
-                        predicted_winner = away
-                    else:
-                        predicted_winner = home
+        for (game, away, home, away_rating, home_rating), variance, pick_underdog in zip(
+            matchups, variances, pick_underdogs, strict=True
+        ):
+            # Add random variance for underdog picks
+            away_rating += variance
+            home_rating += variance
+
+            # Calculate confidence with more risk
+            confidence = _scaled_confidence(home_rating - away_rating, 1.2, 40)
+
+            # Sometimes pick the underdog
+            if pick_underdog:
+                if home_rating > away_rating:
+                    predicted_winner = away
                 else:
-                    if home_rating > away_rating:
-                        predicted_winner = home
-                    else:
-                        predicted_winner = away
-
-                pick = Pick(
-                    game=game,
-                    predicted_winner=predicted_winner,
-                    confidence_points=1,
-                    conf=confidence,
-                    spread=home_rating - away_rating,
-                    public_pct=50,
-                )
-                picks.append(pick)
+                    predicted_winner = home
+            else:
+                if home_rating > away_rating:
+                    predicted_winner = home
+                else:
+                    predicted_winner = away
+
+            pick = Pick(
+                game=game,
+                predicted_winner=predicted_winner,
+                confidence_points=1,
+                conf=confidence,
+                spread=home_rating - away_rating,
+                public_pct=50,
+            )
+            picks.append(pick)
 
         return picks[:20]
 
@@ -543,47 +678,63 @@ class PoolDominationSystem:
         """Generate maximum variance picks for desperate situations."""
         picks = []
 
-        for game in games:
-            if "@" in game:
-                away, home = game.split("@")
+        # Use power ratings but with maximum variance, drawing every game's randomness at once
+        matchups = list(self._rated_matchups(games))
+        variances = self._rng.uniform(-20, 20, len(matchups)).tolist()
+        confidences = self._rng.uniform(60, 90, len(matchups)).tolist()
+        pick_underdogs = (self._rng.random(len(matchups)) < 0.6).tolist()  # 60% underdog chance
 
-                # Use power ratings but with maximum variance
-                away_rating = self.team_power_ratings.get(away, 50)
-                home_rating = self.team_power_ratings.get(home, 50)
-                home_rating += 3
-
-                # Add significant variance
-                variance = random.uniform(-20, 20)
-                away_rating += variance
-                home_rating += variance
-
-                # High confidence on contrarian picks
-                confidence = random.uniform(60, 90)
-
-                # Often pick the underdog
-                if random.random() < 0.6:  # 60% chance to pick underdog
-                    if home_rating > away_rating:
-                        predicted_winner = away
-                    else:
-                        predicted_winner = home
+        for matchup, variance, confidence, pick_underdog in zip(
+            matchups, variances, confidences, pick_underdogs, strict=True
+        ):
+            game, away, home, away_rating, home_rating = matchup
+
+            # Add significant variance
+            away_rating += variance
+            home_rating += variance
+
+            # Often pick the underdog
+            if pick_underdog:
+                if home_rating > away_rating:
+                    predicted_winner = away
                 else:
-                    if home_rating > away_rating:
-                        predicted_winner = home
-                    else:
-                        predicted_winner = away
-
-                pick = Pick(
-                    game=game,
-                    predicted_winner=predicted_winner,
-                    confidence_points=1,
-                    conf=confidence,
-                    spread=home_rating - away_rating,
-                    public_pct=50,
-                )
-                picks.append(pick)
+                    predicted_winner = home
+            else:
+                if home_rating > away_rating:
+                    predicted_winner = home
+                else:
+                    predicted_winner = away
+
+            pick = Pick(
+                game=game,
+                predicted_winner=predicted_winner,
+                confidence_points=1,
+                conf=confidence,
+                spread=home_rating - away_rating,
+                public_pct=50,
+            )
+            picks.append(pick)
 
         return picks[:20]
 
+    def _apply_llm_picks(self, picks: list[Pick], llm_picks: list[dict[str, Any]]) -> list[Pick]:
+        """Apply per-game winners and confidence from a batched LLM response."""
+        llm_by_game = {pick.get("game_id"): pick for pick in llm_picks if pick.get("game_id")}
+
+        for pick in picks:
+            llm_pick = llm_by_game.get(pick.game)
+            if not llm_pick:
+                continue
+
+            if llm_pick.get("winner") in pick.game.split("@"):
+                pick.predicted_winner = llm_pick["winner"]
+
+            confidence = llm_pick.get("confidence")
+            if isinstance(confidence, (int, float)) and 0 <= confidence <= 100:
+                pick.conf = float(confidence)
+
+        return picks
+
     def _apply_fibonacci_assignment(self, picks: list[Pick]) -> list[Pick]:
         """Apply Fibonacci-like point assignment to picks."""
         # Sort by confidence
@@ -665,12 +816,19 @@ class PoolDominationSystem:
                 "dateFormat": "iso",
             }
 
-            response = requests.get(url, params=params, timeout=15)
+            self._odds_bucket.acquire()
+            response = self._http.get(url, params=params, timeout=15)
             response.raise_for_status()
 
             all_games = response.json()
             week_games = self.schedule.get(week, {}).get("games", [])
 
+            # Index API games by matchup (either side home) keeping the first listing
+            games_by_teams = {}
+            for api_game in all_games:
+                teams = frozenset((api_game.get("away_team"), api_game.get("home_team")))
+                games_by_teams.setdefault(teams, api_game)
+
             # Filter and map to our week's games
             odds_data = {}
             for game_str in week_games:
@@ -680,19 +838,11 @@ class PoolDominationSystem:
                     home_api = self._map_team_to_api(home)
 
                     if away_api and home_api:
-                        # Find matching game in API response
-                        for api_game in all_games:
-                            if (
-                                api_game.get("away_team") == away_api
-                                and api_game.get("home_team") == home_api
-                            ) or (
-                                api_game.get("away_team") == home_api
-                                and api_game.get("home_team") == away_api
-                            ):
-                                parsed_odds = self._parse_odds_data(api_game, away, home)
-                                if parsed_odds:
-                                    odds_data[game_str] = parsed_odds
-                                break
+                        api_game = games_by_teams.get(frozenset((away_api, home_api)))
+                        if api_game:
+                            parsed_odds = self._parse_odds_data(api_game, away, home)
+                            if parsed_odds:
+                                odds_data[game_str] = parsed_odds
 
             logger.info(f"Batch fetched odds for {len(odds_data)} games in Week {week}")
             return odds_data
@@ -701,10 +851,23 @@ class PoolDominationSystem:
             logger.error(f"Error in batch odds fetch: {e}")
             return {}
 
+    async def _agather(self, fetches: dict[str, Optional[tuple]]) -> dict[str, Any]:
+        """Run blocking (func, *args) fetches in worker threads at the same time.
+
+        Results keep the keys of ``fetches``; a None fetch yields None and a failed one
+        yields its exception.
+        """
+
+        async def _fetch(call: Optional[tuple]) -> Any:
+            return await asyncio.to_thread(*call) if call else None
+
+        results = await asyncio.gather(*map(_fetch, fetches.values()), return_exceptions=True)
+        return dict(zip(fetches, results, strict=True))
+
     def _get_cached_odds(self, week: int) -> Optional[dict[str, Any]]:
         """Get cached odds data if available and not expired."""
         try:
-            cache_file = Path(f"cache_odds_week_{week}.json")
+            cache_file = Path(f"cache_odds_week_{week}.jsonl")
             if not cache_file.exists():
                 return None
 
@@ -714,8 +877,7 @@ class PoolDominationSystem:
                 cache_file.unlink()
                 return None
 
-            with open(cache_file) as f:
-                return json.load(f)
+            return {record["game"]: record["odds"] for record in read_jsonl(cache_file)}
 
         except Exception as e:
             logger.error(f"Error reading odds cache: {e}")
@@ -724,9 +886,11 @@ class PoolDominationSystem:
     def _cache_odds_data(self, week: int, odds_data: dict[str, Any]) -> None:
         """Cache odds data to file."""
         try:
-            cache_file = Path(f"cache_odds_week_{week}.json")
-            with open(cache_file, "w") as f:
-                json.dump(odds_data, f, indent=2)
+            # One line per game so the file is never serialized as a single document
+            cache_file = Path(f"cache_odds_week_{week}.jsonl")
+            write_jsonl(
+                cache_file, ({"game": game, "odds": odds} for game, odds in odds_data.items())
+            )
             logger.info(f"Cached odds data for Week {week}")
         except Exception as e:
             logger.error(f"Error caching odds data: {e}")
@@ -779,20 +943,18 @@ class PoolDominationSystem:
     def _parse_odds_data(self, game_data: dict, away_team: str, home_team: str) -> dict[str, Any]:
         """Parse odds data from API response."""
         try:
-            # Get the best spread odds
-            best_spread = None
-            best_odds = None
-
-            for bookmaker in game_data.get("bookmakers", []):
-                for market in bookmaker.get("markets", []):
-                    if market.get("key") == "spreads":
-                        for outcome in market.get("outcomes", []):
-                            if outcome.get("name") == home_team:
-                                spread = outcome.get("point", 0)
-                                odds = outcome.get("price", 0)
-                                if best_spread is None or abs(spread) < abs(best_spread):
-                                    best_spread = spread
-                                    best_odds = odds
+            # Get the best (smallest) home spread across bookmakers
+            home_spreads = (
+                (outcome.get("point", 0), outcome.get("price", 0))
+                for bookmaker in game_data.get("bookmakers", ())
+                for market in bookmaker.get("markets", ())
+                if market.get("key") == "spreads"
+                for outcome in market.get("outcomes", ())
+                if outcome.get("name") == home_team
+            )
+            best_spread, best_odds = min(
+                home_spreads, key=lambda spread_odds: abs(spread_odds[0]), default=(None, None)
+            )
 
             return {
                 "spread": best_spread,
@@ -812,31 +974,36 @@ class PoolDominationSystem:
         week_games = self.schedule.get(week, {}).get("games", [])
         default_data = {}
 
-        for game in week_games:
-            if "@" in game and game != "BYE":
-                # Generate default spread based on team ratings
-                away, home = game.split("@")
-                away_rating = self.team_power_ratings.get(away, 50)
-                home_rating = self.team_power_ratings.get(home, 50)
-                home_rating += 3  # Home field advantage
-
-                spread = home_rating - away_rating
-                default_data[game] = {
-                    "spread": spread,
-                    "odds": -110,
-                    "away_team": away,
-                    "home_team": home,
-                    "game_time": None,
-                    "last_updated": datetime.now().isoformat(),
-                    "source": "default",
-                }
+        # Generate default spread based on team ratings
+        for game, away, home, away_rating, home_rating in self._rated_matchups(week_games):
+            spread = home_rating - away_rating
+            default_data[game] = {
+                "spread": spread,
+                "odds": -110,
+                "away_team": away,
+                "home_team": home,
+                "game_time": None,
+                "last_updated": datetime.now().isoformat(),
+                "source": "default",
+            }
 
         return default_data
 
     def get_enhanced_llm_prompt(self, date: str, force_refresh: bool = False) -> str:
         """Generate enhanced LLM prompt with real odds data and web search context."""
-        # Fetch real odds data for the date
-        odds_data = self.fetch_odds_data_by_date(date, force_refresh)
+        # Fetch real odds data and web search context for the date (independent, so overlapped)
+        context = asyncio.run(
+            self._agather(
+                {
+                    "odds": (self.fetch_odds_data_by_date, date, force_refresh),
+                    "web": (self._get_web_search_context_by_date, date),
+                }
+            )
+        )
+        for result in context.values():
+            if isinstance(result, Exception):
+                raise result
+        odds_data = context["odds"]
 
         # Generate base prompt
         base_prompt = self.generate_llm_research_prompt_by_date(date)
@@ -854,7 +1021,7 @@ class PoolDominationSystem:
             enhanced_prompt = base_prompt
 
         # Add web search context for better analysis
-        web_context = self._get_web_search_context_by_date(date)
+        web_context = context["web"]
         if web_context:
             enhanced_prompt += web_context
 
@@ -935,13 +1102,20 @@ class PoolDominationSystem:
             logger.error(f"Error parsing date {date}: {e}")
             return 3
 
-    def generate_llm_research_prompt_by_date(self, date: str) -> str:
-        """Generate research prompt for LLM analysis by date."""
+    def generate_llm_research_prompt_by_date(
+        self, date: str, games: Optional[list[str]] = None
+    ) -> str:
+        """Generate research prompt for LLM analysis by date.
+
+        All matchups are folded into a single prompt so one response covers the
+        whole slate. Pass ``games`` to analyze specific matchups instead of the
+        scheduled week.
+        """
         # Get the week and games for this date
-        week = self._get_week_from_date(date)
-        week_data = self.schedule.get(week, {})
-        games = week_data.get("games", [])
-        date_range = week_data.get("dates", date)
+        if games is None:
+            week = self._get_week_from_date(date)
+            week_data = self.schedule.get(week, {})
+            games = week_data.get("games", [])
 
         # Filter out BYE games
         actual_games = [game for game in games if game != "BYE"]
@@ -950,7 +1124,7 @@ class PoolDominationSystem:
             return f"# {date} Football Pool Research Request\n\nNo games scheduled for this date."
 
         # Create games list for the prompt
-        games_list = "\n".join([f"- {game}" for game in actual_games])
+        games_list = "- " + "\n- ".join(actual_games)
 
         prompt = f"""# {date} Football Pool Research Request
 
@@ -992,10 +1166,20 @@ Please analyze the following games and provide structured data in JSON format:
       }},
       "confidence_score": 78
     }}
+  ],
+  "picks": [
+    {{
+      "game_id": "KC@NYG",
+      "winner": "KC",
+      "confidence": 78
+    }}
   ]
 }}
 ```
 
+Return ONE JSON object covering every game listed above, with exactly one "picks"
+entry per game ("game_id" must match the game as written above).
+
 Please provide your analysis in the exact JSON format above."""
         return prompt
 
@@ -1024,7 +1208,7 @@ Please provide your analysis in the exact JSON format above."""
             )
 
         # Create games list for the prompt
-        games_list = "\n".join([f"- {game}" for game in pool_games])
+        games_list = "- " + "\n- ".join(pool_games)
 
         prompt = f"""# {date} CONTRARIAN FOOTBALL POOL ANALYSIS
 **GOAL**: Identify contrarian opportunities and value plays for optimal pool strategy
@@ -1438,7 +1622,9 @@ Please provide your analysis in the exact JSON format above.
 
     # ============= RESULTS TRACKING =============
 
-    def track_results(self, week: int, results: dict[str, str]) -> bool:
+    def track_results(
+        self, week: int, results: Union[dict[str, str], Iterable[tuple[str, str]]]
+    ) -> bool:
         """Track game results and update pick performance."""
         return self.db.update_pick_results(week, results)
 
@@ -1454,9 +1640,15 @@ Please provide your analysis in the exact JSON format above.
         """Get all picks from database."""
         return self.db.get_picks()
 
+    def get_latest_week(self) -> Optional[int]:
+        """Get the most recent week with saved picks."""
+        return self.db.get_latest_week()
+
     # ============= COMPETITOR ANALYSIS =============
 
-    def track_competitor_picks(self, week: int, competitor: str, picks: list[dict]) -> bool:
+    def track_competitor_picks(
+        self, week: int, competitor: str, picks: Iterable[dict]
+    ) -> bool:
         """Track competitor picks for analysis."""
         return self.db.save_competitor_picks(week, competitor, picks)
 
@@ -1642,8 +1834,12 @@ Please provide your analysis in the exact JSON format above.
     ) -> dict[str, Any]:
         """Generate OpenRouter API request for LLM analysis."""
         # Use enhanced prompt with real odds data
-        prompt = self.get_enhanced_llm_prompt(week)
+        return self._openrouter_request_body(week, self.get_enhanced_llm_prompt(week), api_key)
 
+    def _openrouter_request_body(
+        self, week: int, prompt: str, api_key: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Build an OpenRouter request for a ready-made prompt."""
         # Use free models for cost efficiency
         free_models = [
             "moonshotai/kimi-k2:free",  # Best overall performance
@@ -1687,7 +1883,78 @@ Please provide your analysis in the exact JSON format above.
         try:
             # Generate request
             request_data = self.generate_openrouter_request(week, self.openrouter_api_key)
+        except Exception as e:
+            logger.error(f"Error calling OpenRouter API: {e}")
+            self.usage_tracker.record_request("openrouter", success=False)
+            return None
+
+        return self._openrouter_completion(request_data, week)
 
+    async def acall_openrouter_api(
+        self, week: int, prompts: Optional[list[str]] = None, max_concurrency: int = 4
+    ) -> list[Optional[dict[str, Any]]]:
+        """Call OpenRouter API concurrently for one or more prompt variants.
+
+        Without prompts, sends the enhanced prompt (odds and web context) like
+        call_openrouter_api. Results are returned in prompt order; failed calls yield None.
+        """
+        if not self.openrouter_api_key:
+            logger.warning("No OpenRouter API key found.")
+            app_logger.log_error(Exception("No OpenRouter API key"), "acall_openrouter_api")
+            return []
+
+        if prompts:
+            # Ready-made prompts only need the model and params, not the enhanced prompt
+            requests_data = [
+                self._openrouter_request_body(week, prompt, self.openrouter_api_key)
+                for prompt in prompts
+            ]
+        else:
+            try:
+                # Off the event loop: building the enhanced prompt runs its own fetches
+                requests_data = [
+                    await asyncio.to_thread(
+                        self.generate_openrouter_request, week, self.openrouter_api_key
+                    )
+                ]
+            except Exception as e:
+                logger.error(f"Error calling OpenRouter API: {e}")
+                self.usage_tracker.record_request("openrouter", success=False)
+                return []
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _complete(request_data: dict[str, Any]) -> Optional[dict[str, Any]]:
+            async with semaphore:
+                if not self.usage_tracker.can_make_request("openrouter"):
+                    warning_level = self.usage_tracker.get_warning_level("openrouter")
+                    logger.warning(f"OpenRouter API limit reached! Warning level: {warning_level}")
+                    return None
+                return await asyncio.to_thread(self._openrouter_completion, request_data, week)
+
+        return list(await asyncio.gather(*(_complete(data) for data in requests_data)))
+
+    def _post_with_retry(self, url: str, attempts: int = 3, **kwargs: Any) -> requests.Response:
+        """POST with exponential backoff on connection errors, timeouts, 429s and 5xx."""
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = self._http.post(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+            else:
+                if last_attempt or (response.status_code != 429 and response.status_code < 500):
+                    return response
+
+            logger.warning(f"Retrying request to {url} (attempt {attempt + 2}/{attempts})")
+            time.sleep(2**attempt)
+
+    def _openrouter_completion(
+        self, request_data: dict[str, Any], week: int
+    ) -> Optional[dict[str, Any]]:
+        """Send a single chat completion request and parse the JSON payload."""
+        try:
             # Log LLM request
             model = request_data.get("model", "unknown")
             prompt = request_data.get("messages", [{}])[0].get("content", "")
@@ -1700,10 +1967,8 @@ Please provide your analysis in the exact JSON format above.
                 "Content-Type": "application/json",
             }
 
-            import time
-
             start_time = time.time()
-            response = requests.post(url, json=request_data, headers=headers, timeout=30)
+            response = self._post_with_retry(url, json=request_data, headers=headers, timeout=30)
             response_time = time.time() - start_time
 
             # Log API call
@@ -1726,24 +1991,7 @@ Please provide your analysis in the exact JSON format above.
             app_logger.log_llm_response(model, content, tokens_used)
 
             # Try to parse JSON from response
-            try:
-                # Look for JSON in the response
-                import re
-
-                json_match = re.search(r"\{.*\}", content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group()
-                    parsed_data = json.loads(json_str)
-                    app_logger.llm_logger.info(f"Successfully parsed JSON response from {model}")
-                    return parsed_data
-                else:
-                    logger.warning("No JSON found in OpenRouter response")
-                    app_logger.llm_logger.warning("No JSON found in OpenRouter response")
-                    return None
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON from OpenRouter response: {e}")
-                app_logger.log_error(e, f"JSON parsing error for {model}")
-                return None
+            return self._parse_llm_json(content, model)
 
         except Exception as e:
             logger.error(f"Error calling OpenRouter API: {e}")
@@ -1751,6 +1999,165 @@ Please provide your analysis in the exact JSON format above.
             self.usage_tracker.record_request("openrouter", success=False)
             return None
 
+    def _parse_llm_json(self, content: str, model: str) -> Optional[dict[str, Any]]:
+        """Extract the JSON object embedded in an LLM response."""
+        try:
+            # Look for JSON in the response
+            json_match = re.search(r"\{.*\}", content, re.DOTALL)
+            if json_match:
+                json_str = json_match.group()
+                parsed_data = json.loads(json_str)
+                app_logger.llm_logger.info(f"Successfully parsed JSON response from {model}")
+                return parsed_data
+            else:
+                logger.warning("No JSON found in LLM response")
+                app_logger.llm_logger.warning("No JSON found in LLM response")
+                return None
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing JSON from LLM response: {e}")
+            app_logger.log_error(e, f"JSON parsing error for {model}")
+            return None
+
+    def submit_llm_batch(self, week: int) -> Optional[str]:
+        """Submit the weekly research prompt through the OpenAI Batch API."""
+        if not self.openai_api_key:
+            logger.warning("No OpenAI API key found. Skipping batch submission.")
+            return None
+
+        # Re-runs for the week keep waiting on the batch already submitted
+        pending_batch_id = self.pending_llm_batch(week)
+        if pending_batch_id:
+            logger.info(f"LLM batch {pending_batch_id} already submitted for Week {week}")
+            return pending_batch_id
+
+        try:
+            request_data = self.generate_openrouter_request(week)
+            batch_line = {
+                "custom_id": f"week{week}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {**request_data, "model": self.batch_model},
+            }
+            headers = {"Authorization": f"Bearer {self.openai_api_key}"}
+
+            # Upload the JSONL input file
+            upload = self._http.post(
+                f"{self.openai_api_base}/files",
+                headers=headers,
+                data={"purpose": "batch"},
+                files={"file": (f"week_{week}_batch.jsonl", json.dumps(batch_line) + "\n")},
+                timeout=30,
+            )
+            app_logger.log_api_call("OpenAI", "files", "POST", upload.status_code)
+            upload.raise_for_status()
+
+            # Create the batch against the uploaded file
+            response = self._http.post(
+                f"{self.openai_api_base}/batches",
+                headers=headers,
+                json={
+                    "input_file_id": upload.json()["id"],
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h",
+                },
+                timeout=30,
+            )
+            app_logger.log_api_call("OpenAI", "batches", "POST", response.status_code)
+            response.raise_for_status()
+
+            batch_id = response.json()["id"]
+            logger.info(f"Submitted LLM batch {batch_id} for Week {week}")
+
+            # Remember the batch so a later run can collect it (see collect_llm_batch)
+            _LLM_BATCH_DIR.mkdir(parents=True, exist_ok=True)
+            write_json(
+                self._llm_batch_path(week),
+                {"batch_id": batch_id, "submitted_at": datetime.now().isoformat()},
+                indent=True,
+            )
+            return batch_id
+
+        except Exception as e:
+            logger.error(f"Error submitting LLM batch: {e}")
+            return None
+
+    def _llm_batch_path(self, week: int) -> Path:
+        """Path of the record of a week's submitted LLM batch."""
+        return _LLM_BATCH_DIR / f"week_{week}.json"
+
+    def pending_llm_batch(self, week: int) -> Optional[str]:
+        """Get the id of the week's submitted LLM batch, if it has not been collected yet."""
+        try:
+            return read_json(self._llm_batch_path(week)).get("batch_id")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading LLM batch record for Week {week}: {e}")
+            return None
+
+    def collect_llm_batch(self, week: int) -> tuple[Optional[str], Optional[dict[str, Any]]]:
+        """Check the week's pending LLM batch and save its analysis once it completes.
+
+        Returns (None, None) when no batch is pending; the record is kept until the
+        batch finishes, so later runs can check again.
+        """
+        batch_id = self.pending_llm_batch(week)
+        if not batch_id:
+            return None, None
+
+        status, analysis = self.retrieve_llm_batch(batch_id)
+        if analysis:
+            self.save_llm_data(week, analysis)
+        if status in _FINISHED_BATCH_STATUSES:
+            self._llm_batch_path(week).unlink(missing_ok=True)
+        return status, analysis
+
+    def retrieve_llm_batch(self, batch_id: str) -> tuple[str, Optional[dict[str, Any]]]:
+        """Check a submitted batch and return its status and parsed analysis."""
+        if not self.openai_api_key:
+            logger.warning("No OpenAI API key found. Cannot retrieve batch.")
+            return "unavailable", None
+
+        try:
+            headers = {"Authorization": f"Bearer {self.openai_api_key}"}
+            response = self._http.get(
+                f"{self.openai_api_base}/batches/{batch_id}", headers=headers, timeout=30
+            )
+            app_logger.log_api_call("OpenAI", f"batches/{batch_id}", "GET", response.status_code)
+            response.raise_for_status()
+
+            batch = response.json()
+            status = batch.get("status", "unknown")
+            if status != "completed" or not batch.get("output_file_id"):
+                logger.info(f"LLM batch {batch_id} is {status}")
+                return status, None
+
+            # Download the output file (one JSON result per line)
+            output = self._http.get(
+                f"{self.openai_api_base}/files/{batch['output_file_id']}/content",
+                headers=headers,
+                timeout=30,
+            )
+            output.raise_for_status()
+
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                body = json.loads(line).get("response", {}).get("body", {})
+                content = body.get("choices", [{}])[0].get("message", {}).get("content", "")
+                if content:
+                    app_logger.log_llm_response(
+                        self.batch_model, content, body.get("usage", {}).get("total_tokens", 0)
+                    )
+                    return status, self._parse_llm_json(content, self.batch_model)
+
+            logger.warning(f"LLM batch {batch_id} completed without output")
+            return status, None
+
+        except Exception as e:
+            logger.error(f"Error retrieving LLM batch {batch_id}: {e}")
+            return "error", None
+
     def get_ai_analysis(self, week: int) -> Optional[dict[str, Any]]:
         """Get AI analysis using OpenRouter API."""
         logger.info(f"Getting AI analysis for Week {week}")
@@ -6,10 +6,11 @@ Handles SQLite database operations, schema management, and migrations.
 
 import logging
 import sqlite3
+from collections.abc import Iterable
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from .models import CompetitorPick, Pick, StrategyPerformance
 
@@ -274,13 +275,23 @@ class DatabaseManager:
 
             return picks
 
-    def update_pick_results(self, week: int, results: dict[str, str]) -> bool:
-        """Update picks with actual results."""
+    def get_latest_week(self) -> Optional[int]:
+        """Get the most recent week with saved picks."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(week) FROM picks")
+            return cursor.fetchone()[0]
+
+    def update_pick_results(
+        self, week: int, results: Union[dict[str, str], Iterable[tuple[str, str]]]
+    ) -> bool:
+        """Update picks with actual results (a dict or an iterable of (game, winner) pairs)."""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
-                for game, winner in results.items():
+                pairs = results.items() if isinstance(results, dict) else results
+                for game, winner in pairs:
                     # Save game result
                     cursor.execute(
                         """
@@ -315,7 +326,7 @@ class DatabaseManager:
     # ============= COMPETITOR OPERATIONS =============
 
     def save_competitor_picks(
-        self, week: int, competitor_name: str, picks: list[dict[str, Any]]
+        self, week: int, competitor_name: str, picks: Iterable[dict[str, Any]]
     ) -> bool:
         """Save competitor picks."""
         try:
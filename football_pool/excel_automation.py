@@ -10,14 +10,138 @@ import os
 import shutil
 import csv
 import json
+from collections.abc import Iterable, Iterator
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import cache
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, List, Optional, Union
 
 from openpyxl import load_workbook
 from openpyxl.styles import Alignment, Border, Font, Side
 
+from .models import Pick
+
 logger = logging.getLogger(__name__)
 
+_pick_fields = attrgetter("predicted_winner", "confidence_points", "week")
+
+# openpyxl style objects are immutable, so build them once and share them across cells
+_THIN_SIDE = Side(style="thin")
+_HEADER_FONT = Font(bold=True, size=11)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_HEADER_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+_PICK_FONT = Font(bold=True)
+_PICK_ALIGNMENT = Alignment(horizontal="center")
+
+
+def weekly_filename(week: int, date: str = None) -> str:
+    """Get the weekly submission file name (date suffix, or week number without a date)."""
+    return f"Dawgpac25_{date}.xlsx" if date else f"Dawgpac25_Week{week}.xlsx"
+
+
+def _iter_pick_fields(
+    picks: Iterable[Union[Pick, dict[str, Any]]], week: int
+) -> Iterator[tuple[str, int, int]]:
+    """Yield (team, confidence, week) for Pick objects or pick dicts."""
+    for pick in picks:
+        if isinstance(pick, Pick):
+            team, confidence, pick_week = _pick_fields(pick)
+            yield team, confidence, pick_week or week
+        else:
+            yield pick.get("team", ""), pick.get("confidence", 0), pick.get("week", week)
+
+
+# Standard team abbreviations for the pool (full names and variants -> abbreviation)
+_TEAM_ABBREVIATIONS = {
+    # NFL Teams
+    "Kansas City Chiefs": "KC",
+    "New York Giants": "NYG",
+    "Buffalo Bills": "BUF",
+    "Miami Dolphins": "MIA",
+    "Los Angeles Rams": "LAR",
+    "San Francisco 49ers": "SF",
+    "Dallas Cowboys": "DAL",
+    "Philadelphia Eagles": "PHI",
+    "Green Bay Packers": "GB",
+    "Chicago Bears": "CHI",
+    "Detroit Lions": "DET",
+    "Minnesota Vikings": "MIN",
+    "New Orleans Saints": "NO",
+    "Tampa Bay Buccaneers": "TB",
+    "Atlanta Falcons": "ATL",
+    "Carolina Panthers": "CAR",
+    "Arizona Cardinals": "ARI",
+    "Seattle Seahawks": "SEA",
+    "Los Angeles Chargers": "LAC",
+    "Las Vegas Raiders": "LV",
+    "Denver Broncos": "DEN",
+    "Pittsburgh Steelers": "PIT",
+    "PITT": "PIT",  # Handle PITT -> PIT conversion
+    "Baltimore Ravens": "BAL",
+    "Cleveland Browns": "CLE",
+    "Cincinnati Bengals": "CIN",
+    "Houston Texans": "HOU",
+    "Indianapolis Colts": "IND",
+    "Tennessee Titans": "TEN",
+    "Jacksonville Jaguars": "JAX",
+    "New England Patriots": "NE",
+    "New York Jets": "NYJ",
+    "Washington Commanders": "WAS",
+    "WASH": "WAS",  # Handle WASH -> WAS conversion
+    # CFB Teams (common abbreviations)
+    "Alabama": "ALA",
+    "Georgia": "UGA",
+    "Ohio State": "OSU",
+    "Michigan": "MICH",
+    "Clemson": "CLEM",
+    "Notre Dame": "ND",
+    "Oklahoma": "OU",
+    "Texas": "TEX",
+    "USC": "USC",
+    "LSU": "LSU",
+    "Florida": "UF",
+    "Auburn": "AUB",
+    "Tennessee": "TENN",
+    "Kentucky": "UK",
+    "South Carolina": "SC",
+    "Missouri": "MIZ",
+    "Arkansas": "ARK",
+    "Mississippi State": "MSST",
+    "Ole Miss": "MISS",
+    "Vanderbilt": "VANDY",
+    # Additional CFB teams
+    "Louisville": "LOU",
+    "Stanford": "STAN",
+    "Penn State": "PSU",
+    "UCLA": "UCLA",
+    "Florida State": "FSU",
+    "Nebraska": "NEB",
+    "Indiana": "UIND",
+    "California": "CAL",
+    "North Carolina": "NC",
+    "Alabama": "ALA",
+    "Washington": "UW",
+    "Washington State": "WSU",
+    "UW": "UW",  # Handle UW -> UW conversion
+    "WSU": "WSU",  # Handle WSU -> WSU conversion
+}
+_KNOWN_ABBREVIATIONS = frozenset(abbrev.upper() for abbrev in _TEAM_ABBREVIATIONS.values())
+
+
+@cache
+def _match_abbreviation(team: str) -> Optional[str]:
+    """Match a team name that is not itself an abbreviation, or return None."""
+    team_lower = team.lower()
+    for full_name, abbrev in _TEAM_ABBREVIATIONS.items():
+        # More precise matching to avoid conflicts like NO -> ND
+        if (
+            len(team) > 2
+            and team_lower in full_name.lower()
+            and abs(len(team) - len(abbrev)) <= 2
+        ):
+            return abbrev
+    return None
+
 
 class ExcelAutomation:
     """Handles Excel file automation for pool submissions."""
@@ -50,16 +174,12 @@ class ExcelAutomation:
     ) -> str:
         """Create a new weekly file based on template with date suffix."""
         try:
-            # Load template
-            if not self.load_template():
+            if not os.path.exists(self.template_path):
+                logger.error(f"Template file not found: {self.template_path}")
                 return None
 
             # Create filename with date suffix
-            if date:
-                filename = f"Dawgpac25_{date}.xlsx"
-            else:
-                # Default to week number if no date provided
-                filename = f"Dawgpac25_Week{week}.xlsx"
+            filename = weekly_filename(week, date)
 
             # Ensure output directory exists
             os.makedirs(self.output_dir, exist_ok=True)
@@ -67,8 +187,8 @@ class ExcelAutomation:
             # Full path for output
             output_path = os.path.join(self.output_dir, filename)
 
-            # Save as new file (preserving original template)
-            self.workbook.save(output_path)
+            # Copy the template byte-for-byte (preserves formatting, no openpyxl round-trip)
+            shutil.copyfile(self.template_path, output_path)
             logger.info(f"Created weekly file: {output_path}")
             return output_path
 
@@ -79,40 +199,33 @@ class ExcelAutomation:
     def update_picks(
         self,
         week: int,
-        picks: list[dict[str, Any]],
+        picks: list[Union[Pick, dict[str, Any]]],
         date: str = None,
         participant_name: str = "Dawgpac",
     ) -> bool:
         """Update picks for a specific week in the Excel file."""
         try:
             # Determine filename
-            if date:
-                filename = f"Dawgpac25_{date}.xlsx"
-            else:
-                filename = f"Dawgpac25_Week{week}.xlsx"
+            filename = weekly_filename(week, date)
 
             # Full path for file
             file_path = os.path.join(self.output_dir, filename)
 
-            if not os.path.exists(file_path):
-                # Create new file if it doesn't exist
+            # Load the weekly copy; on first use, copy the template and modify that
+            try:
+                workbook = load_workbook(file_path)
+            except FileNotFoundError:
                 file_path = self.create_weekly_file(week, date, participant_name)
                 if not file_path:
                     return False
-
-            # Load workbook
-            workbook = load_workbook(file_path)
+                workbook = load_workbook(file_path)
             worksheet = workbook.active
 
             # Update picks in the Excel file
             # The structure is: Row 1 = Week numbers (1-18), Column A = Confidence points (20-1)
             # We need to find the right cell for each pick
 
-            for pick in picks:
-                team = pick.get("team", "")
-                confidence = pick.get("confidence", 0)
-                week_num = pick.get("week", week)
-
+            for team, confidence, week_num in _iter_pick_fields(picks, week):
                 if team and confidence:
                     # Find the row for this confidence level
                     # Confidence 20 = row 3, Confidence 1 = row 22
@@ -130,18 +243,13 @@ class ExcelAutomation:
                     # Style the cell to match row 2 formatting
                     if row == 2:
                         # For row 2, match the formatting of other cells in that row
-                        cell.font = Font(bold=True, size=11)
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                        cell.border = Border(
-                            left=Side(style="thin"),
-                            right=Side(style="thin"),
-                            top=Side(style="thin"),
-                            bottom=Side(style="thin"),
-                        )
+                        cell.font = _HEADER_FONT
+                        cell.alignment = _HEADER_ALIGNMENT
+                        cell.border = _HEADER_BORDER
                     else:
                         # For other rows, use standard formatting
-                        cell.font = Font(bold=True)
-                        cell.alignment = Alignment(horizontal="center")
+                        cell.font = _PICK_FONT
+                        cell.alignment = _PICK_ALIGNMENT
 
             # Save the updated file
             workbook.save(file_path)
@@ -156,10 +264,7 @@ class ExcelAutomation:
         """Get current picks from the Excel file for a specific week."""
         try:
             # Determine filename
-            if date:
-                filename = f"Dawgpac25_{date}.xlsx"
-            else:
-                filename = f"Dawgpac25_Week{week}.xlsx"
+            filename = weekly_filename(week, date)
 
             # Full path for file
             file_path = os.path.join(self.output_dir, filename)
@@ -167,30 +272,34 @@ class ExcelAutomation:
             if not os.path.exists(file_path):
                 return []
 
-            # Load workbook
-            workbook = load_workbook(file_path)
-            worksheet = workbook.active
+            # Read-only streaming load with cached cell values (lookups never write back)
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                worksheet = workbook.active
 
-            picks = []
+                picks = []
 
-            # Read picks from the Excel file
-            for row in range(2, 22):  # Rows 2-21 (confidence 20-1)
-                confidence = 22 - row  # Calculate confidence from row
-                cell = worksheet.cell(row=row, column=week + 1)
-                team = cell.value
+                # Read picks from the Excel file
+                rows = worksheet.iter_rows(
+                    min_row=2, max_row=21, min_col=week + 1, max_col=week + 1, values_only=True
+                )
+                for row, (team,) in enumerate(rows, start=2):  # Rows 2-21 (confidence 20-1)
+                    confidence = 22 - row  # Calculate confidence from row
 
-                if team and str(team).strip():
-                    picks.append(
-                        {"team": str(team).strip(), "confidence": confidence, "week": week}
-                    )
+                    if team and str(team).strip():
+                        picks.append(
+                            {"team": str(team).strip(), "confidence": confidence, "week": week}
+                        )
 
-            return picks
+                return picks
+            finally:
+                workbook.close()
 
         except Exception as e:
             logger.error(f"Error reading picks: {e}")
             return []
 
-    def validate_picks(self, picks: list[dict[str, Any]]) -> dict[str, Any]:
+    def validate_picks(self, picks: list[Union[Pick, dict[str, Any]]]) -> dict[str, Any]:
         """Validate picks according to pool rules."""
         validation_result = {"valid": True, "errors": [], "warnings": []}
 
@@ -199,41 +308,52 @@ class ExcelAutomation:
             validation_result["valid"] = False
             validation_result["errors"].append(f"Expected 20 picks, got {len(picks)}")
 
+        # Collect confidence and team problems in a single pass over the picks
+        seen_confidences = set()
+        duplicate_confidence = out_of_range = False
+        empty_teams = []
+        for i, (team, confidence, _) in enumerate(_iter_pick_fields(picks, 0)):
+            if confidence in seen_confidences:
+                duplicate_confidence = True
+            seen_confidences.add(confidence)
+            if not 1 <= confidence <= 20:
+                out_of_range = True
+            if not team or not team.strip():
+                empty_teams.append(i)
+
         # Check confidence points (1-20, no duplicates)
-        confidences = [pick.get("confidence", 0) for pick in picks]
-        if len(set(confidences)) != len(confidences):
+        if duplicate_confidence:
             validation_result["valid"] = False
             validation_result["errors"].append("Duplicate confidence points found")
 
-        if min(confidences) < 1 or max(confidences) > 20:
+        if out_of_range:
             validation_result["valid"] = False
             validation_result["errors"].append("Confidence points must be between 1 and 20")
 
         # Check for empty teams
-        empty_teams = [i for i, pick in enumerate(picks) if not pick.get("team", "").strip()]
         if empty_teams:
             validation_result["valid"] = False
             validation_result["errors"].append(f"Empty team names at positions: {empty_teams}")
 
         return validation_result
 
-    def create_submission_summary(self, week: int, date: str = None) -> str:
-        """Create a summary of picks for submission."""
+    def create_submission_summary(
+        self, week: int, date: str = None, picks: list[dict[str, Any]] = None
+    ) -> str:
+        """Create a summary of picks for submission (pass ``picks`` to skip re-reading)."""
         try:
-            picks = self.get_current_picks(week)
+            if picks is None:
+                picks = self.get_current_picks(week)
             if not picks:
                 return "No picks found for this week."
 
             # Sort by confidence (highest first)
-            picks.sort(key=lambda x: x["confidence"], reverse=True)
+            picks = sorted(picks, key=itemgetter("confidence"), reverse=True)
 
-            summary = f"Week {week} Picks Summary:\n"
-            summary += "=" * 30 + "\n"
+            lines = [f"Week {week} Picks Summary:", "=" * 30]
+            lines.extend(f"{pick['confidence']:2d}: {pick['team']}" for pick in picks)
 
-            for pick in picks:
-                summary += f"{pick['confidence']:2d}: {pick['team']}\n"
-
-            return summary
+            return "\n".join(lines) + "\n"
 
         except Exception as e:
             logger.error(f"Error creating submission summary: {e}")
@@ -242,7 +362,7 @@ class ExcelAutomation:
     def backup_file(self, week: int, date: str = None) -> str:
         """Create a backup of the current file."""
         try:
-            filename = f"Dawgpac25_Week{week}.xlsx"
+            filename = weekly_filename(week)
             file_path = os.path.join(self.output_dir, filename)
 
             if not os.path.exists(file_path):
@@ -263,109 +383,24 @@ class ExcelAutomation:
 
     def get_team_abbreviations(self) -> dict[str, str]:
         """Get standard team abbreviations for the pool."""
-        return {
-            # NFL Teams
-            "Kansas City Chiefs": "KC",
-            "New York Giants": "NYG",
-            "Buffalo Bills": "BUF",
-            "Miami Dolphins": "MIA",
-            "Los Angeles Rams": "LAR",
-            "San Francisco 49ers": "SF",
-            "Dallas Cowboys": "DAL",
-            "Philadelphia Eagles": "PHI",
-            "Green Bay Packers": "GB",
-            "Chicago Bears": "CHI",
-            "Detroit Lions": "DET",
-            "Minnesota Vikings": "MIN",
-            "New Orleans Saints": "NO",
-            "Tampa Bay Buccaneers": "TB",
-            "Atlanta Falcons": "ATL",
-            "Carolina Panthers": "CAR",
-            "Arizona Cardinals": "ARI",
-            "Seattle Seahawks": "SEA",
-            "Los Angeles Chargers": "LAC",
-            "Las Vegas Raiders": "LV",
-            "Denver Broncos": "DEN",
-            "Pittsburgh Steelers": "PIT",
-            "PITT": "PIT",  # Handle PITT -> PIT conversion
-            "Baltimore Ravens": "BAL",
-            "Cleveland Browns": "CLE",
-            "Cincinnati Bengals": "CIN",
-            "Houston Texans": "HOU",
-            "Indianapolis Colts": "IND",
-            "Tennessee Titans": "TEN",
-            "Jacksonville Jaguars": "JAX",
-            "New England Patriots": "NE",
-            "New York Jets": "NYJ",
-            "Washington Commanders": "WAS",
-            "WASH": "WAS",  # Handle WASH -> WAS conversion
-            # CFB Teams (common abbreviations)
-            "Alabama": "ALA",
-            "Georgia": "UGA",
-            "Ohio State": "OSU",
-            "Michigan": "MICH",
-            "Clemson": "CLEM",
-            "Notre Dame": "ND",
-            "Oklahoma": "OU",
-            "Texas": "TEX",
-            "USC": "USC",
-            "LSU": "LSU",
-            "Florida": "UF",
-            "Auburn": "AUB",
-            "Tennessee": "TENN",
-            "Kentucky": "UK",
-            "South Carolina": "SC",
-            "Missouri": "MIZ",
-            "Arkansas": "ARK",
-            "Mississippi State": "MSST",
-            "Ole Miss": "MISS",
-            "Vanderbilt": "VANDY",
-            # Additional CFB teams
-            "Louisville": "LOU",
-            "Stanford": "STAN",
-            "Penn State": "PSU",
-            "UCLA": "UCLA",
-            "Florida State": "FSU",
-            "Nebraska": "NEB",
-            "Indiana": "UIND",
-            "California": "CAL",
-            "North Carolina": "NC",
-            "Alabama": "ALA",
-            "Washington": "UW",
-            "Washington State": "WSU",
-            "UW": "UW",  # Handle UW -> UW conversion
-            "WSU": "WSU",  # Handle WSU -> WSU conversion
-        }
+        return dict(_TEAM_ABBREVIATIONS)
 
     def convert_team_names(self, picks: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Convert team names to standard abbreviations."""
-        abbreviations = self.get_team_abbreviations()
-
         converted_picks = []
         for pick in picks:
             team = pick.get("team", "")
-            original_team = team
 
             # First, check if it's already an abbreviation (exact match)
-            if team.upper() in [abbrev.upper() for abbrev in abbreviations.values()]:
+            if team.upper() in _KNOWN_ABBREVIATIONS:
                 # Already an abbreviation, keep as is
                 converted_picks.append(pick)
                 continue
 
-            # Try to find abbreviation with more precise matching
-            found_match = False
-            for full_name, abbrev in abbreviations.items():
-                # More precise matching to avoid conflicts like NO -> ND
-                if team.upper() == abbrev.upper() or (
-                    len(team) > 2
-                    and team.lower() in full_name.lower()
-                    and abs(len(team) - len(abbrev)) <= 2
-                ):
-                    pick["team"] = abbrev
-                    found_match = True
-                    break
-
-            if not found_match:
+            abbrev = _match_abbreviation(team)
+            if abbrev:
+                pick["team"] = abbrev
+            else:
                 # Keep original if no match found
                 logger.warning(f"No abbreviation found for team: {team}")
 
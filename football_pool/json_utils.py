@@ -0,0 +1,142 @@
+"""
+JSON helpers for the Football Pool Domination System.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise, so callers never need to care which one is active.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import json_stream
+except ImportError:
+    json_stream = None
+
+# Files smaller than this are parsed in one go; streaming only pays off above it
+STREAM_THRESHOLD = 256 * 1024
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    if indent:
+        return json.dumps(obj, indent=2, default=default, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=default, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(
+    path: Union[str, Path],
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """Serialize an object and write it to a file in a single write."""
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=indent, default=default))
+
+
+def append_jsonl(
+    path: Union[str, Path], obj: Any, default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """Append an object to a JSON Lines file as a single compact line."""
+    with open(path, "ab") as f:
+        f.write(dumps(obj, default=default) + b"\n")
+
+
+def write_jsonl(
+    path: Union[str, Path], objs: Iterable[Any], default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """Write objects to a JSON Lines file, serializing one line at a time."""
+    with open(path, "wb") as f:
+        f.writelines(dumps(obj, default=default) + b"\n" for obj in objs)
+
+
+def read_jsonl(path: Union[str, Path]) -> Iterator[Any]:
+    """Lazily deserialize each line of a JSON Lines file."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and deserialize a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def read_json_lazy(path: Union[str, Path]) -> Any:
+    """Parse a JSON file without building Python objects up front.
+
+    With pysimdjson installed this returns a lazy document that supports key
+    lookups and ``in`` checks; otherwise it falls back to :func:`read_json`.
+    Use :func:`to_python` to materialize the result.
+    """
+    if simdjson is not None:
+        return simdjson.Parser().load(str(path))
+    return read_json(path)
+
+
+def to_python(doc: Any) -> Any:
+    """Materialize a document returned by :func:`read_json_lazy`."""
+    if simdjson is not None and isinstance(doc, simdjson.Object):
+        return doc.as_dict()
+    if simdjson is not None and isinstance(doc, simdjson.Array):
+        return doc.as_list()
+    return doc
+
+
+def iter_json_items(
+    path: Union[str, Path], stream_threshold: int = STREAM_THRESHOLD
+) -> Iterator[Any]:
+    """Iterate over the top-level entries of a JSON file.
+
+    Objects yield ``(key, value)`` pairs and arrays yield their elements. Files
+    of at least ``stream_threshold`` bytes are streamed with json-stream when it
+    is installed, so only one top-level entry is in memory at a time. A missing
+    file raises FileNotFoundError here rather than on first iteration.
+    """
+    if json_stream is None or os.path.getsize(path) < stream_threshold:
+        doc = read_json(path)
+        return iter(doc.items() if isinstance(doc, dict) else doc)
+    return _stream_json_items(path)
+
+
+def _stream_json_items(path: Union[str, Path]) -> Iterator[Any]:
+    """Stream the top-level entries of a JSON file with json-stream."""
+    with open(path, "rb") as f:
+        doc = json_stream.load(f)
+        if isinstance(doc, json_stream.base.StreamingJSONObject):
+            for key, value in doc.items():
+                yield key, json_stream.to_standard_types(value)
+        else:
+            for value in doc:
+                yield json_stream.to_standard_types(value)
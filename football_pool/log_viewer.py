@@ -4,6 +4,7 @@ Log Viewer Utility for Football Pool Domination System.
 Provides tools to view, analyze, and search through log files.
 """
 
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -12,6 +13,9 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+# Timestamp prefix written by logging_config: YYYY-MM-DD HH:MM:SS
+_TIMESTAMP_RE = re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+
 
 class LogViewer:
     """Utility for viewing and analyzing log files."""
@@ -95,25 +99,35 @@ class LogViewer:
         search_files = [self.log_dir / log_file] if log_file else list(self.log_dir.glob("*.log"))
         results = []
 
+        # Plain substring match, compiled once and run over whole files instead of per line
+        pattern = re.compile(re.escape(query), 0 if case_sensitive else re.IGNORECASE)
+
         for log_path in search_files:
             if not log_path.exists():
                 continue
 
             try:
-                with open(log_path, encoding="utf-8") as f:
-                    for line_num, line in enumerate(f, 1):
-                        search_line = line if case_sensitive else line.lower()
-                        search_query = query if case_sensitive else query.lower()
-
-                        if search_query in search_line:
-                            results.append(
-                                {
-                                    "file": log_path.name,
-                                    "line": line_num,
-                                    "content": line.strip(),
-                                    "timestamp": self._extract_timestamp(line),
-                                }
-                            )
+                text = log_path.read_text(encoding="utf-8")
+                line_num, counted_to = 1, 0
+                match = pattern.search(text)
+                while match:
+                    start = text.rfind("\n", 0, match.start()) + 1
+                    end = text.find("\n", match.end())
+                    if end == -1:
+                        end = len(text)
+                    line_num += text.count("\n", counted_to, start)
+                    counted_to = start
+                    line = text[start:end]
+                    results.append(
+                        {
+                            "file": log_path.name,
+                            "line": line_num,
+                            "content": line.strip(),
+                            "timestamp": self._extract_timestamp(line),
+                        }
+                    )
+                    # One result per line: resume after this line
+                    match = pattern.search(text, end + 1) if end + 1 < len(text) else None
             except Exception as e:
                 self.console.print(f"❌ Error reading {log_path.name}: {e}")
 
@@ -150,21 +164,21 @@ class LogViewer:
             return
 
         try:
+            # Count patterns in one streaming pass
+            requests = responses = errors = 0
             with open(llm_log, encoding="utf-8") as f:
-                lines = f.readlines()
-
-            # Analyze patterns
-            requests = [line for line in lines if "LLM Request" in line]
-            responses = [line for line in lines if "LLM Response" in line]
-            errors = [line for line in lines if "ERROR" in line or "WARNING" in line]
+                for line in f:
+                    requests += "LLM Request" in line
+                    responses += "LLM Response" in line
+                    errors += "ERROR" in line or "WARNING" in line
 
             self.console.print(
                 Panel(
                     f"🤖 LLM Interactions Analysis\n\n"
-                    f"📤 Total Requests: {len(requests)}\n"
-                    f"📥 Total Responses: {len(responses)}\n"
-                    f"❌ Errors/Warnings: {len(errors)}\n"
-                    f"📊 Success Rate: {len(responses)/len(requests)*100:.1f}%"
+                    f"📤 Total Requests: {requests}\n"
+                    f"📥 Total Responses: {responses}\n"
+                    f"❌ Errors/Warnings: {errors}\n"
+                    f"📊 Success Rate: {responses/requests*100:.1f}%"
                     if requests
                     else "N/A",
                     title="LLM Analysis",
@@ -183,23 +197,21 @@ class LogViewer:
             return
 
         try:
-            with open(api_log, encoding="utf-8") as f:
-                lines = f.readlines()
-
             # Count API calls by service
             services = {}
             total_calls = 0
 
-            for line in lines:
-                if "API Call:" in line:
-                    total_calls += 1
-                    # Extract service name
-                    if "OpenRouter" in line:
-                        services["OpenRouter"] = services.get("OpenRouter", 0) + 1
-                    elif "Odds" in line:
-                        services["The Odds API"] = services.get("The Odds API", 0) + 1
-                    elif "Exa" in line:
-                        services["Exa"] = services.get("Exa", 0) + 1
+            with open(api_log, encoding="utf-8") as f:
+                for line in f:
+                    if "API Call:" in line:
+                        total_calls += 1
+                        # Extract service name
+                        if "OpenRouter" in line:
+                            services["OpenRouter"] = services.get("OpenRouter", 0) + 1
+                        elif "Odds" in line:
+                            services["The Odds API"] = services.get("The Odds API", 0) + 1
+                        elif "Exa" in line:
+                            services["Exa"] = services.get("Exa", 0) + 1
 
             self.console.print(
                 Panel(
@@ -218,14 +230,8 @@ class LogViewer:
 
     def _extract_timestamp(self, line: str) -> Optional[str]:
         """Extract timestamp from log line."""
-        try:
-            # Look for timestamp pattern: YYYY-MM-DD HH:MM:SS
-            import re
-
-            match = re.search(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line)
-            return match.group(1) if match else None
-        except:
-            return None
+        match = _TIMESTAMP_RE.search(line)
+        return match.group(1) if match else None
 
     def clear_logs(self, confirm: bool = False):
         """Clear all log files."""
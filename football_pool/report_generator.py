@@ -2,19 +2,43 @@
 Comprehensive Markdown Report Generator for Football Pool Strategy
 """
 
-import json
 import logging
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from .json_utils import read_json
+
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=32)
+def next_week_date(date: str) -> str:
+    """Get the YYYY-MM-DD date one week after a YYYY-MM-DD date (parsed once per date)."""
+    return (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
+
+
+def report_filename(week: int, date: str, enhanced: bool = False) -> str:
+    """Get the file name of a week's (enhanced) strategy report."""
+    kind = "Enhanced_Strategy_Report" if enhanced else "Strategy_Report"
+    return f"Week_{week}_{kind}_{date}.md"
+
+
+def preview_filename(week: int, date: str) -> str:
+    """Get the file name of the preview for the week after ``week``."""
+    return f"Week_{week + 1}_Preview_{next_week_date(date)}.md"
+
+
 class StrategyReportGenerator:
-    """Generate comprehensive markdown reports for pool strategy."""
+    """Generate comprehensive markdown reports for pool strategy.
+
+    Holds no per-report state (only the reports directory), so one instance is safe to
+    share between threads generating different reports.
+    """
 
     def __init__(self):
         self.reports_dir = Path("reports")
@@ -25,12 +49,14 @@ class StrategyReportGenerator:
         week: int,
         date: str,
         analysis_file: str,
-        picks_file: Optional[str] = None
-    ) -> str:
-        """Generate comprehensive weekly strategy report."""
+        picks_file: Optional[str] = None,
+        analysis_data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """Generate comprehensive weekly strategy report, returning (path, content)."""
 
-        # Load analysis data
-        analysis_data = self._load_analysis_data(analysis_file)
+        # Load analysis data unless the caller already has it
+        if analysis_data is None:
+            analysis_data = self._load_analysis_data(analysis_file)
 
         # Load picks data if available
         picks_data = self._load_picks_data(picks_file) if picks_file else None
@@ -41,20 +67,17 @@ class StrategyReportGenerator:
         )
 
         # Save report
-        report_filename = f"Week_{week}_Strategy_Report_{date}.md"
-        report_path = self.reports_dir / report_filename
+        report_path = self.reports_dir / report_filename(week, date)
 
-        with open(report_path, 'w') as f:
-            f.write(report_content)
+        report_path.write_bytes(report_content.encode("utf-8"))
 
         logger.info(f"Strategy report saved to {report_path}")
-        return str(report_path)
+        return str(report_path), report_content
 
     def _load_analysis_data(self, analysis_file: str) -> Dict[str, Any]:
         """Load analysis data from JSON file."""
         try:
-            with open(analysis_file, 'r') as f:
-                return json.load(f)
+            return read_json(analysis_file)
         except Exception as e:
             logger.error(f"Error loading analysis data: {e}")
             return {}
@@ -62,8 +85,7 @@ class StrategyReportGenerator:
     def _load_picks_data(self, picks_file: str) -> Optional[Dict[str, Any]]:
         """Load picks data from JSON file."""
         try:
-            with open(picks_file, 'r') as f:
-                return json.load(f)
+            return read_json(picks_file)
         except Exception as e:
             logger.error(f"Error loading picks data: {e}")
             return None
@@ -266,10 +288,7 @@ class StrategyReportGenerator:
     def generate_next_week_preview(self, week: int, date: str) -> str:
         """Generate next week preview with considerations."""
 
-        # Calculate next week date
-        current_date = datetime.strptime(date, "%Y-%m-%d")
-        next_week_date = current_date + timedelta(days=7)
-        next_week_str = next_week_date.strftime("%Y-%m-%d")
+        next_week_str = next_week_date(date)
 
         preview_content = f"""# Week {week + 1} Preview - {next_week_str}
 
@@ -309,12 +328,14 @@ class StrategyReportGenerator:
         week: int,
         date: str,
         analysis_file: str,
-        openrouter_api_key: Optional[str] = None
+        openrouter_api_key: Optional[str] = None,
+        analysis_data: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate LLM-enhanced strategy report with next week considerations."""
 
-        # Load analysis data
-        analysis_data = self._load_analysis_data(analysis_file)
+        # Load analysis data unless the caller already has it
+        if analysis_data is None:
+            analysis_data = self._load_analysis_data(analysis_file)
 
         # Generate base report
         base_report = self._build_report_content(week, date, analysis_data, None)
@@ -339,10 +360,7 @@ class StrategyReportGenerator:
     ) -> str:
         """Get LLM analysis for next week considerations."""
 
-        # Calculate next week date
-        current_date = datetime.strptime(date, "%Y-%m-%d")
-        next_week_date = current_date + timedelta(days=7)
-        next_week_str = next_week_date.strftime("%Y-%m-%d")
+        next_week_str = next_week_date(date)
 
         # Build prompt for LLM
         prompt = f"""Based on the Week {week} contrarian analysis, provide strategic insights for Week {week + 1} ({next_week_str}).
@@ -9,12 +9,20 @@ from unittest.mock import MagicMock, patch
 import pytest
 from typer.testing import CliRunner
 
+from football_pool import cli
 from football_pool.cli import app
 
 
 class TestCLI:
     """Test CLI functionality."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_system(self):
+        """Build a new (possibly patched) system for every test."""
+        cli._reset_system()
+        yield
+        cli._reset_system()
+
     @pytest.fixture
     def runner(self):
         """Create CLI runner for testing."""
@@ -329,3 +337,30 @@ class TestCLI:
 
         assert result.exit_code != 0
         assert "Invalid JSON" in result.stdout
+
+    def test_auto_workflow_without_terminal(self, runner):
+        """Test auto-workflow skips the spinner when output is not a terminal."""
+        with patch("football_pool.automation.WeeklyAutomation") as mock_automation:
+            mock_automation.return_value.run_weekly_workflow.return_value = {
+                "status": "error",
+                "error": "No games",
+            }
+
+            result = runner.invoke(app, ["auto-workflow", "2025-09-17", "3"])
+
+            assert "Workflow failed: No games" in result.stdout
+            assert "\x1b[?25l" not in result.stdout
+
+    def test_strategy_report_with_malformed_analysis(self, runner, tmp_path, monkeypatch):
+        """Test strategy-report falls back to an empty analysis on malformed JSON."""
+        monkeypatch.chdir(tmp_path)
+        analysis_file = tmp_path / "analysis.json"
+        analysis_file.write_text("{not json")
+
+        result = runner.invoke(
+            app, ["strategy-report", "3", "2025-09-17", "--analysis", str(analysis_file)]
+        )
+
+        assert result.exit_code == 0
+        assert "Could not parse analysis file" in result.stdout
+        assert "Strategy report generated" in result.stdout
@@ -0,0 +1,177 @@
+"""
+Tests for competitor tracking.
+"""
+
+import numpy as np
+import pytest
+
+from football_pool import json_utils
+from football_pool.competitor_tracking import CompetitorTracker
+
+
+class TestCompetitorTracker:
+    """Test competitor pick tracking."""
+
+    @pytest.fixture
+    def make_tracker(self):
+        """Build trackers and close them after the test."""
+        trackers = []
+
+        def make() -> CompetitorTracker:
+            tracker = CompetitorTracker()
+            trackers.append(tracker)
+            return tracker
+
+        yield make
+        for tracker in trackers:
+            tracker.close()
+
+    def test_get_pick_matrix(self, tmp_path, monkeypatch, make_tracker):
+        """Test tracked picks are laid out as competitor x game arrays."""
+        monkeypatch.chdir(tmp_path)
+        tracker = make_tracker()
+
+        tracker.track_competitor_pick("Uncle Bob", 3, "KC@NYG", "KC", 20)
+        tracker.track_competitor_pick("Uncle Bob", 3, "ATL@CAR", "CAR", 5)
+        tracker.track_competitor_pick("Aunt Sue", 3, "KC@NYG", "NYG", 12)
+
+        competitors, games, sides, confidence = tracker.get_pick_matrix(3)
+
+        assert competitors == ["Uncle Bob", "Aunt Sue"]
+        assert games == ["ATL@CAR", "KC@NYG"]
+        np.testing.assert_array_equal(sides, [[1, -1], [0, 1]])
+        np.testing.assert_array_equal(confidence, [[5, 20], [0, 12]])
+
+    def test_get_pick_matrix_empty_week(self, tmp_path, monkeypatch, make_tracker):
+        """Test a week without tracked picks yields empty arrays."""
+        monkeypatch.chdir(tmp_path)
+
+        competitors, games, sides, confidence = make_tracker().get_pick_matrix(3)
+
+        assert competitors == [] and games == []
+        assert sides.shape == confidence.shape == (0, 0)
+        assert not (tmp_path / "data").exists()
+
+    def test_competitor_analysis(self, tmp_path, monkeypatch, make_tracker):
+        """Test common, avoid and contrarian picks come from the tracked picks."""
+        monkeypatch.chdir(tmp_path)
+        tracker = make_tracker()
+
+        for competitor in ("Uncle Bob", "Aunt Sue", "Cousin Al"):
+            tracker.track_competitor_pick(competitor, 3, "KC@NYG", "KC", 20)
+        tracker.track_competitor_pick("Grandma", 3, "KC@NYG", "NYG", 4)
+
+        analysis = tracker.get_competitor_analysis(3)
+
+        assert analysis["total_competitors"] == 4
+        assert analysis["common_picks"] == [
+            {
+                "game": "KC@NYG",
+                "team": "KC",
+                "count": 3,
+                "competitors": ["Uncle Bob", "Aunt Sue", "Cousin Al"],
+            }
+        ]
+        assert analysis["avoid_picks"] == ["KC@NYG_KC"]
+        assert analysis["contrarian_opportunities"] == [
+            {
+                "game": "KC@NYG",
+                "public_team": "KC",
+                "contrarian_team": "NYG",
+                "public_percentage": 75.0,
+                "contrarian_percentage": 25.0,
+            }
+        ]
+        recommendations = tracker.get_contrarian_recommendations(3, ["ATL@CAR", "KC@NYG"])
+        assert [(rec["game"], rec["recommended_team"]) for rec in recommendations] == [
+            ("KC@NYG", "NYG")
+        ]
+
+        patterns = analysis["competitor_patterns"]
+        assert patterns["high_confidence_pickers"] == ["Uncle Bob", "Aunt Sue", "Cousin Al"]
+        assert patterns["favorite_pickers"] == ["Uncle Bob", "Aunt Sue", "Cousin Al"]
+        assert patterns["low_confidence_pickers"] == patterns["underdog_pickers"] == ["Grandma"]
+
+    def test_tracking_data_cache(self, tmp_path, monkeypatch, make_tracker):
+        """Test tracking data is re-read only when the file changes."""
+        monkeypatch.chdir(tmp_path)
+        tracker = make_tracker()
+        tracker.track_competitor_pick("Uncle Bob", 3, "KC@NYG", "KC", 20)
+        tracker.flush()
+
+        assert tracker._load_tracking_data() is tracker._load_tracking_data()
+
+        # Another process rewrites the file
+        with make_tracker() as other:
+            other.track_competitor_pick("Aunt Sue", 3, "KC@NYG", "NYG", 12)
+
+        assert set(tracker._load_tracking_data()[3]) == {"Uncle Bob", "Aunt Sue"}
+
+    def test_picks_written_on_flush(self, tmp_path, monkeypatch, make_tracker):
+        """Test tracked picks are batched in memory until flushed."""
+        monkeypatch.chdir(tmp_path)
+        tracker = make_tracker()
+
+        tracker.track_competitor_pick("Uncle Bob", 3, "KC@NYG", "KC", 20)
+        tracker.track_competitor_pick("Uncle Bob", 3, "ATL@CAR", "CAR", 5)
+
+        assert not tracker.tracking_file.exists()
+        assert len(tracker._load_tracking_data()[3]["Uncle Bob"]) == 2
+
+        tracker.flush()
+
+        assert [path.name for path in tracker.data_dir.iterdir()] == ["competitor_picks.json"]
+        picks = make_tracker()._load_tracking_data()[3]["Uncle Bob"]
+        assert [(pick.game, pick.team, pick.confidence) for pick in picks] == [
+            ("KC@NYG", "KC", 20),
+            ("ATL@CAR", "CAR", 5),
+        ]
+
+    def test_export_without_orjson(self, tmp_path, monkeypatch, make_tracker):
+        """Test tracked picks serialize through the stdlib json fallback."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(json_utils, "orjson", None)
+        tracker = make_tracker()
+        tracker.track_competitor_pick("Uncle Bob", 3, "KC@NYG", "KC", 20)
+
+        export = json_utils.read_json(tracker.export_competitor_data(3))
+
+        assert export["competitor_picks"]["Uncle Bob"][0]["team"] == "KC"
+
+    def test_competitor_analysis_empty_week(self, tmp_path, monkeypatch, make_tracker):
+        """Test a week without tracked picks returns the shared read-only default."""
+        monkeypatch.chdir(tmp_path)
+        tracker = make_tracker()
+
+        analysis = tracker.get_competitor_analysis(3)
+
+        assert analysis["total_competitors"] == 0
+        assert not analysis["common_picks"] and not analysis["avoid_picks"]
+        assert analysis is tracker.get_competitor_analysis(4)
+        assert tracker.get_contrarian_recommendations(3, ["KC@NYG"]) == []
+
+    def test_batch_timestamp(self, tmp_path, monkeypatch, make_tracker):
+        """Test picks tracked in a with-block share one timestamp."""
+        monkeypatch.chdir(tmp_path)
+
+        with make_tracker() as tracker:
+            tracker.track_competitor_pick("Uncle Bob", 3, "KC@NYG", "KC", 20)
+            tracker.track_competitor_pick("Aunt Sue", 3, "KC@NYG", "NYG", 12)
+            tracker.track_competitor_pick("Grandma", 3, "KC@NYG", "NYG", 4, "2025-09-17T12:00:00")
+
+        week_data = make_tracker()._load_tracking_data()[3]
+        timestamps = [week_data[name][0].timestamp for name in ("Uncle Bob", "Aunt Sue", "Grandma")]
+        assert timestamps[0] == timestamps[1] != timestamps[2] == "2025-09-17T12:00:00"
+
+    def test_flush_after_cwd_change(self, tmp_path, monkeypatch, make_tracker):
+        """Test pending picks are written to the original directory after a chdir."""
+        monkeypatch.chdir(tmp_path)
+        tracker = make_tracker()
+        tracker.track_competitor_pick("Uncle Bob", 3, "KC@NYG", "KC", 20)
+
+        (tmp_path / "elsewhere").mkdir()
+        monkeypatch.chdir(tmp_path / "elsewhere")
+        tracker.flush()
+
+        assert (tmp_path / "data" / "competitors" / "competitor_picks.json").exists()
+        assert not (tmp_path / "elsewhere" / "data").exists()
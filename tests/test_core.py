@@ -2,12 +2,19 @@
 Tests for core system functionality.
 """
 
+import asyncio
+import json
 import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
+import requests
 
-from football_pool.core import PoolDominationSystem
+from football_pool.core import APIUsageTracker, PoolDominationSystem, TokenBucket
 from football_pool.models import Pick, PoolPosition
 
 
@@ -36,6 +43,24 @@ class TestPoolDominationSystem:
         assert len(system.team_power_ratings) > 0
         assert len(system.schedule) > 0
 
+    def test_schedule_cache(self, temp_db, tmp_path, monkeypatch):
+        """Test the parsed schedule workbook is reused until it changes."""
+        import openpyxl
+        import pandas as pd
+
+        monkeypatch.chdir(tmp_path)
+        workbook = openpyxl.Workbook()
+        for col in range(1, 10):
+            workbook.active.cell(3, col, f"9/{col}")
+            workbook.active.cell(4, col, "KC@NYG")
+        workbook.save("2025-2026 Football Schedule.xlsx")
+
+        schedule = PoolDominationSystem(db_path=temp_db).schedule
+        assert schedule[1] == {"dates": "9/1", "games": ["KC@NYG"]}
+
+        monkeypatch.setattr(pd, "read_excel", MagicMock(side_effect=AssertionError))
+        assert PoolDominationSystem(db_path=temp_db).schedule == schedule
+
     def test_determine_strategy(self, temp_db):
         """Test strategy determination based on pool position."""
         system = PoolDominationSystem(db_path=temp_db)
@@ -369,3 +394,284 @@ class TestPoolDominationSystem:
         assert len(request["messages"]) == 1
         assert request["messages"][0]["role"] == "user"
         assert "Week 3" in request["messages"][0]["content"]
+
+    def test_acall_openrouter_api_fans_out_prompts(self, temp_db, monkeypatch):
+        """Test concurrent OpenRouter calls keep prompt order."""
+        system = PoolDominationSystem(db_path=temp_db)
+        system.openrouter_api_key = "test-key"
+
+        def no_enhanced_prompt(week, api_key=None):
+            raise AssertionError("ready-made prompts must not build the enhanced prompt")
+
+        monkeypatch.setattr(system, "generate_openrouter_request", no_enhanced_prompt)
+        monkeypatch.setattr(system.usage_tracker, "can_make_request", lambda api_name: True)
+        monkeypatch.setattr(
+            system,
+            "_openrouter_completion",
+            lambda request_data, week: {"prompt": request_data["messages"][0]["content"]},
+        )
+
+        results = asyncio.run(system.acall_openrouter_api(3, ["first", "second", "third"]))
+
+        assert [result["prompt"] for result in results] == ["first", "second", "third"]
+
+    def test_post_with_retry_backs_off_on_transient_errors(self, temp_db, monkeypatch):
+        """Test transient failures are retried and client errors are not."""
+        system = PoolDominationSystem(db_path=temp_db)
+        responses = [
+            requests.ConnectionError("reset"),
+            MagicMock(status_code=503),
+            MagicMock(status_code=200),
+        ]
+
+        def fake_post(url, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        sleeps = []
+        monkeypatch.setattr(system._http, "post", fake_post)
+        monkeypatch.setattr("football_pool.core.time.sleep", sleeps.append)
+
+        assert system._post_with_retry("https://example.test").status_code == 200
+        assert sleeps == [1, 2]
+
+        responses.append(MagicMock(status_code=400))
+        assert system._post_with_retry("https://example.test").status_code == 400
+        assert sleeps == [1, 2]
+
+    def test_openrouter_retried_in_one_layer(self, temp_db):
+        """Test OpenRouter calls bypass adapter retries that other APIs get."""
+        system = PoolDominationSystem(db_path=temp_db)
+
+        openrouter = system._http.get_adapter(f"{system.openrouter_api_base}/chat/completions")
+        odds = system._http.get_adapter(f"{system.odds_api_base}/sports")
+
+        assert openrouter.max_retries.total == 0
+        assert odds.max_retries.total == 3
+
+    def test_enhanced_prompt_fetches_context_concurrently(self, temp_db, monkeypatch):
+        """Test odds and web context are fetched at the same time, also from async callers."""
+        system = PoolDominationSystem(db_path=temp_db)
+        system.openrouter_api_key = "test-key"
+        # Each fetch waits for the other, so running them one after another times out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_odds(date, force_refresh=False):
+            barrier.wait()
+            return {"KC@NYG": {"spread": -7, "odds": -110}}
+
+        def fetch_web_context(date):
+            barrier.wait()
+            return "\n\n## Web Context"
+
+        monkeypatch.setattr(system, "fetch_odds_data_by_date", fetch_odds)
+        monkeypatch.setattr(system, "_get_web_search_context_by_date", fetch_web_context)
+        monkeypatch.setattr(system.usage_tracker, "can_make_request", lambda api_name: True)
+        monkeypatch.setattr(
+            system,
+            "_openrouter_completion",
+            lambda request_data, week: {"prompt": request_data["messages"][0]["content"]},
+        )
+
+        prompt = system.get_enhanced_llm_prompt("2025-09-17")
+        assert "- KC@NYG: -7.0 (-110)" in prompt and prompt.endswith("## Web Context")
+
+        [result] = asyncio.run(system.acall_openrouter_api(3))
+        assert result["prompt"].endswith("## Web Context")
+
+    def test_fetch_week_odds_batch_matches_either_side(self, temp_db, monkeypatch):
+        """Test scheduled games are matched to API games regardless of home/away order."""
+        system = PoolDominationSystem(db_path=temp_db)
+        system.schedule = {3: {"dates": "9/18-9/22", "games": ["KC@NYG", "ATL@CAR", "DEN@LAC"]}}
+        api_games = [
+            {"away_team": "New York Giants", "home_team": "Kansas City Chiefs"},
+            {"away_team": "Atlanta Falcons", "home_team": "Carolina Panthers"},
+        ]
+        monkeypatch.setattr(
+            system._http, "get", lambda url, **kwargs: MagicMock(json=lambda: api_games)
+        )
+        monkeypatch.setattr(
+            system, "_parse_odds_data", lambda game, away, home: {"home": game["home_team"]}
+        )
+
+        assert system._fetch_week_odds_batch(3) == {
+            "KC@NYG": {"home": "Kansas City Chiefs"},
+            "ATL@CAR": {"home": "Carolina Panthers"},
+        }
+
+    def test_variance_picks_reproducible_with_seeded_rng(self, temp_db):
+        """Test the variance strategies draw only from the instance RNG."""
+        system = PoolDominationSystem(db_path=temp_db)
+        games = ["KC@NYG", "ATL@CAR", "DEN@LAC"]
+
+        def picks(generate):
+            system._rng = np.random.default_rng(7)
+            return [(p.predicted_winner, p.conf, p.spread) for p in generate(3, games, None)]
+
+        for generate in (
+            system._generate_high_variance_picks,
+            system._generate_maximum_variance_picks,
+        ):
+            first = picks(generate)
+            assert first == picks(generate)
+            assert all(type(conf) is float for _, conf, _ in first)
+
+    def test_odds_cache_round_trip(self, temp_db, tmp_path, monkeypatch):
+        """Test cached odds are written one game per line and read back as a dict."""
+        system = PoolDominationSystem(db_path=temp_db)
+        monkeypatch.chdir(tmp_path)
+        odds_data = {"KC@NYG": {"spread": -7, "odds": -110}, "ATL@CAR": {"spread": 2.5}}
+
+        system._cache_odds_data(3, odds_data)
+
+        assert len((tmp_path / "cache_odds_week_3.jsonl").read_bytes().splitlines()) == 2
+        assert system._get_cached_odds(3) == odds_data
+        assert system._get_cached_odds(4) is None
+
+    def test_retrieve_llm_batch_parses_output(self, temp_db, monkeypatch):
+        """Test completed batches are downloaded and parsed."""
+        system = PoolDominationSystem(db_path=temp_db)
+        system.openai_api_key = "test-key"
+
+        output_line = json.dumps(
+            {
+                "custom_id": "week3",
+                "response": {
+                    "body": {"choices": [{"message": {"content": 'Here: {"week": 3}'}}]}
+                },
+            }
+        )
+
+        def fake_get(url, headers=None, timeout=None):
+            response = MagicMock(status_code=200)
+            if url.endswith("/content"):
+                response.text = output_line + "\n"
+            else:
+                response.json.return_value = {"status": "completed", "output_file_id": "file-1"}
+            return response
+
+        monkeypatch.setattr(system._http, "get", fake_get)
+
+        status, analysis = system.retrieve_llm_batch("batch-1")
+
+        assert status == "completed"
+        assert analysis == {"week": 3}
+
+    def test_collect_llm_batch(self, temp_db, tmp_path, monkeypatch):
+        """Test a submitted batch is kept until it completes, then saved and forgotten."""
+        system = PoolDominationSystem(db_path=temp_db)
+        system.openai_api_key = "test-key"
+        monkeypatch.chdir(tmp_path)
+        assert system.collect_llm_batch(3) == (None, None)
+
+        (tmp_path / "data" / "llm_batches").mkdir(parents=True)
+        (tmp_path / "data" / "llm_batches" / "week_3.json").write_text('{"batch_id": "batch-1"}')
+        assert system.submit_llm_batch(3) == "batch-1"
+
+        monkeypatch.setattr(system, "retrieve_llm_batch", lambda batch_id: ("in_progress", None))
+        assert system.collect_llm_batch(3) == ("in_progress", None)
+        assert system.pending_llm_batch(3) == "batch-1"
+
+        monkeypatch.setattr(
+            system, "retrieve_llm_batch", lambda batch_id: ("completed", {"week": 3})
+        )
+        assert system.collect_llm_batch(3) == ("completed", {"week": 3})
+        assert system.pending_llm_batch(3) is None
+        assert system.load_llm_data(3) == {"week": 3}
+
+    def test_generate_optimal_picks_applies_batched_llm_picks(self, temp_db):
+        """Test a single batched LLM response is distributed back to picks."""
+        system = PoolDominationSystem(db_path=temp_db)
+        system.schedule = {3: {"dates": "9/18-9/22", "games": ["KC@NYG", "ATL@CAR"]}}
+
+        llm_data = {
+            "picks": [
+                {"game_id": "KC@NYG", "winner": "NYG", "confidence": 90},
+                {"game_id": "ATL@CAR", "winner": "ATL", "confidence": 55},
+            ]
+        }
+
+        picks = system.generate_optimal_picks(week=3, llm_data=llm_data)
+        picks_by_game = {pick.game: pick for pick in picks}
+
+        assert picks_by_game["KC@NYG"].predicted_winner == "NYG"
+        assert picks_by_game["KC@NYG"].conf == 90
+        assert picks_by_game["ATL@CAR"].predicted_winner == "ATL"
+        assert picks_by_game["KC@NYG"].confidence_points > picks_by_game["ATL@CAR"].confidence_points
+
+
+class TestAPIUsageTracker:
+    """Test API usage tracking."""
+
+    def test_requests_saved_in_batches(self, tmp_path, monkeypatch):
+        """Test recorded requests are written every few calls and on flush."""
+        monkeypatch.chdir(tmp_path)
+        tracker = APIUsageTracker()
+        tracker._flush_every = 3
+
+        tracker.record_request("openrouter")  # month reset writes the file
+        tracker.record_request("openrouter")
+        assert json.loads(tracker.usage_file.read_text())["openrouter"]["requests_used"] == 0
+
+        tracker.record_request("openrouter")
+        tracker.record_request("openrouter")
+        assert json.loads(tracker.usage_file.read_text())["openrouter"]["requests_used"] == 3
+
+        tracker.flush()
+        assert APIUsageTracker().usage_data["openrouter"]["requests_used"] == 4
+
+    def test_concurrent_requests_all_counted(self, tmp_path, monkeypatch):
+        """Test requests recorded from several threads are neither lost nor left in tmp files."""
+        monkeypatch.chdir(tmp_path)
+        tracker = APIUsageTracker()
+        tracker._flush_every = 1
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(40):
+                executor.submit(tracker.record_request, "openrouter")
+        tracker.flush()
+
+        assert APIUsageTracker().usage_data["openrouter"]["requests_used"] == 40
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_warning_level_change_saved(self, tmp_path, monkeypatch):
+        """Test crossing into a new warning level is written immediately."""
+        monkeypatch.chdir(tmp_path)
+        tracker = APIUsageTracker()
+        tracker.monthly_limits["odds_api"] = 4
+
+        tracker.record_request("odds_api")
+        tracker.record_request("odds_api")
+
+        assert APIUsageTracker().usage_data["odds_api"]["requests_used"] == 2
+
+
+class TestTokenBucket:
+    """Test the client-side rate limiter."""
+
+    def test_burst_then_waits_for_refill(self, monkeypatch):
+        """Test a full bucket allows a burst and then sleeps one token at a time."""
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr("football_pool.core.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("football_pool.core.time.sleep", fake_sleep)
+        bucket = TokenBucket(rate=10, per=60, burst=3)
+
+        for _ in range(3):
+            bucket.acquire()
+        assert sleeps == []
+
+        bucket.acquire()
+        bucket.acquire()
+        assert sleeps == pytest.approx([6.0, 6.0])
+
+        clock[0] += 60
+        bucket.acquire()
+        assert len(sleeps) == 2
@@ -83,6 +83,20 @@ class TestDatabaseManager:
         assert first_pick.conf == 85.0
         assert first_pick.strategy_tag == "balanced"
 
+    def test_get_latest_week(self, temp_db):
+        """Test the latest week comes from an aggregate over saved picks."""
+        db = DatabaseManager(temp_db)
+        assert db.get_latest_week() is None
+
+        db.save_picks(
+            [
+                Pick(game="KC@NYG", predicted_winner="KC", confidence_points=20, week=3),
+                Pick(game="DAL@CHI", predicted_winner="DAL", confidence_points=19, week=5),
+            ]
+        )
+
+        assert db.get_latest_week() == 5
+
     def test_update_pick_results(self, temp_db):
         """Test updating picks with results."""
         db = DatabaseManager(temp_db)
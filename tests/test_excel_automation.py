@@ -5,11 +5,13 @@ Comprehensive test coverage for Excel automation to prevent pick alignment issue
 import os
 import shutil
 import tempfile
+from unittest.mock import patch
 
 import pytest
 from openpyxl import Workbook, load_workbook
 
 from football_pool.excel_automation import ExcelAutomation
+from football_pool.models import Pick
 
 
 class TestExcelAutomation:
@@ -105,6 +107,24 @@ class TestExcelAutomation:
         assert ws.cell(row=13, column=4).value == "LAR", "LAR should be in Row 13, Column 4"
         assert ws.cell(row=22, column=4).value == "DET", "DET should be in Row 22, Column 4"
 
+    def test_pick_objects_accepted(self, excel_automation, temp_dir):
+        """Test that Pick objects are placed and validated like pick dicts."""
+        picks = [
+            Pick(game=f"AWAY{i} @ HOME{i}", predicted_winner=f"HOME{i}", confidence_points=i)
+            for i in range(20, 0, -1)
+        ]
+
+        validation = excel_automation.validate_picks(picks)
+        assert validation["valid"], validation.get("errors", [])
+
+        excel_automation.output_dir = temp_dir
+        assert excel_automation.update_picks(3, picks, "2024-09-17")
+
+        filename = os.path.join(temp_dir, "Dawgpac25_2024-09-17.xlsx")
+        ws = load_workbook(filename).active
+        assert ws.cell(row=3, column=4).value == "HOME20"
+        assert ws.cell(row=22, column=4).value == "HOME1"
+
     def test_confidence_point_validation(self, excel_automation):
         """Test that confidence points are properly validated."""
         # Test valid confidence points (need 20 picks for full validation)
@@ -139,6 +159,13 @@ class TestExcelAutomation:
         assert not validation["valid"], "Duplicate confidence points should fail validation"
         assert "duplicate" in str(validation.get("errors", [])).lower()
 
+    def test_empty_picks_validation(self, excel_automation):
+        """Test that an empty pick list fails validation instead of raising."""
+        validation = excel_automation.validate_picks([])
+
+        assert not validation["valid"]
+        assert validation["errors"] == ["Expected 20 picks, got 0"]
+
     def test_team_name_validation(self, excel_automation):
         """Test that team names are properly validated."""
         # Test valid team names (need 20 picks for full validation)
@@ -278,6 +305,20 @@ class TestExcelAutomation:
         assert "BALT" in teams, "Should retrieve BALT"
         assert "LAR" in teams, "Should retrieve LAR"
 
+    def test_submission_summary_from_loaded_picks(self, excel_automation):
+        """Test the summary uses already-loaded picks without reading the workbook."""
+        picks = [
+            {"team": "LAR", "confidence": 18, "week": 3},
+            {"team": "KC", "confidence": 20, "week": 3},
+        ]
+
+        with patch.object(excel_automation, "get_current_picks") as mock_get:
+            summary = excel_automation.create_submission_summary(3, picks=picks)
+
+        mock_get.assert_not_called()
+        assert summary.index("20: KC") < summary.index("18: LAR")
+        assert picks[0]["team"] == "LAR", "Caller's list should not be reordered"
+
     def test_week_boundary_validation(self, excel_automation):
         """Test that week boundaries are properly validated."""
         # Test valid weeks
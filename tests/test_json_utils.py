@@ -0,0 +1,90 @@
+"""
+Tests for JSON helpers.
+"""
+
+import json
+
+import pytest
+
+from football_pool import json_utils
+
+
+class TestJsonUtils:
+    """Test JSON serialization helpers."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        """Run each test with orjson and with the stdlib fallback."""
+        if request.param == "stdlib":
+            monkeypatch.setattr(json_utils, "orjson", None)
+        elif json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        return request.param
+
+    def test_round_trip(self, backend, tmp_path):
+        """Test writing and reading a JSON file."""
+        data = {"week": 3, "picks": [{"team": "KC", "confidence": 20}], "note": "45°F"}
+        path = tmp_path / "data.json"
+
+        json_utils.write_json(path, data, indent=True)
+
+        assert json_utils.read_json(path) == data
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+
+    def test_non_string_keys(self, backend):
+        """Test integer keys are serialized the same way as the json module."""
+        assert json_utils.loads(json_utils.dumps({3: "week"})) == {"3": "week"}
+
+    def test_compact_output(self, backend):
+        """Test compact output has no whitespace."""
+        assert json_utils.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_jsonl_append(self, backend, tmp_path):
+        """Test appended records are read back one per line, in order."""
+        path = tmp_path / "results.jsonl"
+
+        json_utils.append_jsonl(path, {"week": 3, "status": "completed"})
+        json_utils.append_jsonl(path, {"week": 4, "status": "error"})
+
+        assert len(path.read_bytes().splitlines()) == 2
+        assert [record["week"] for record in json_utils.read_jsonl(path)] == [3, 4]
+
+    def test_jsonl_write(self, backend, tmp_path):
+        """Test written records replace the file and read back one per line."""
+        path = tmp_path / "odds.jsonl"
+        path.write_text("stale\n")
+
+        json_utils.write_jsonl(path, ({"game": game} for game in ["KC@NYG", "ATL@CAR"]))
+
+        assert list(json_utils.read_jsonl(path)) == [{"game": "KC@NYG"}, {"game": "ATL@CAR"}]
+
+    def test_read_json_lazy_fallback(self, backend, tmp_path, monkeypatch):
+        """Test lazy reads fall back to plain dicts without pysimdjson."""
+        monkeypatch.setattr(json_utils, "simdjson", None)
+        path = tmp_path / "llm.json"
+        json_utils.write_json(path, {"games": ["KC@NYG"], "spreads": {}})
+
+        doc = json_utils.read_json_lazy(path)
+
+        assert "games" in doc and "picks" not in doc
+        assert json_utils.to_python(doc) == {"games": ["KC@NYG"], "spreads": {}}
+
+    def test_iter_json_items(self, backend, tmp_path):
+        """Test objects yield (key, value) pairs and arrays yield elements."""
+        results_path = tmp_path / "results.json"
+        picks_path = tmp_path / "picks.json"
+        json_utils.write_json(results_path, {"KC@NYG": "KC", "ATL@CAR": "CAR"})
+        json_utils.write_json(picks_path, [{"game": "KC@NYG", "pick": "KC", "points": 20}])
+
+        assert list(json_utils.iter_json_items(results_path)) == [
+            ("KC@NYG", "KC"),
+            ("ATL@CAR", "CAR"),
+        ]
+        assert list(json_utils.iter_json_items(picks_path)) == [
+            {"game": "KC@NYG", "pick": "KC", "points": 20}
+        ]
+
+    def test_iter_json_items_missing_file(self, backend, tmp_path):
+        """Test a missing file fails at call time, not on first iteration."""
+        with pytest.raises(FileNotFoundError):
+            json_utils.iter_json_items(tmp_path / "missing.json")